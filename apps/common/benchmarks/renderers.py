@@ -0,0 +1,92 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.common.benchmarks.serializers import build_context, build_rows, get_pages
+from apps.common.renderers import ORJSONRenderer
+from apps.common.services.benchmark import run_benchmark
+from apps.courses.serializers.course import CourseModelSerializer
+from apps.courses.serializers.webinar import WebinarModelSerializer
+from apps.news.serializers.submissions import SubmissionModelSerializer
+from apps.payment.enum import TransactionStatus
+from apps.payment.models import Transaction
+from apps.payment.serializers.transactions import TransactionModelSerializer
+
+
+def build_transactions(rows):
+    now = timezone.now()
+    statuses = list(TransactionStatus)
+    return [
+        Transaction(
+            id=position,
+            order_id=position,
+            status=statuses[position % len(statuses)],
+            paid_at=now - timedelta(minutes=position) if position % 3 else None,
+            remote_id=f"remote-{position}",
+            amount=Decimal(position * 1250) / 100,
+        )
+        for position in range(1, rows + 1)
+    ]
+
+
+def build_history(transactions):
+    """Unserialized rows with raw Decimal, datetime and lazy string values"""
+    return [
+        {
+            "id": transaction.id,
+            "amount": transaction.amount,
+            "status": TransactionStatus(transaction.status).label,
+            "paid_at": transaction.paid_at,
+        }
+        for transaction in transactions
+    ]
+
+
+def build_payloads(rows, page_size):
+    context = build_context()
+    courses, webinars, submissions = build_rows(rows)
+    transactions = build_transactions(rows)
+    payloads = {
+        name: [
+            serializer_class(page, many=True, context=context).data
+            for page in get_pages(instances, page_size)
+        ]
+        for name, serializer_class, instances in (
+            ("courses", CourseModelSerializer, courses),
+            ("webinars", WebinarModelSerializer, webinars),
+            ("submissions", SubmissionModelSerializer, submissions),
+            ("transactions", TransactionModelSerializer, transactions),
+        )
+    }
+    payloads["history"] = get_pages(build_history(transactions), page_size)
+    return payloads
+
+
+def run_benchmarks(rows=1000, page_size=50, repeat=5):
+    """
+    Pages whose orjson rendering differs from the stdlib one, and the timings
+    of both renderers over every payload
+    """
+    stdlib, fast = JSONRenderer(), ORJSONRenderer()
+    mismatches = []
+    results = []
+    for name, pages in build_payloads(rows, page_size).items():
+        for index, page in enumerate(pages):
+            if stdlib.render(page) != fast.render(page):
+                mismatches.append(f"{name} page {index}")
+
+        size = len(stdlib.render(pages[0]))
+        for label, renderer in (("json", stdlib), ("orjson", fast)):
+            results.append(
+                run_benchmark(
+                    f"{name}[{label}]",
+                    renderer.render,
+                    pages,
+                    repeat=repeat,
+                    size=lambda page, size=size: size,
+                    unit="bytes",
+                )
+            )
+    return mismatches, results
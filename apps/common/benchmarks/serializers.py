@@ -0,0 +1,202 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.common.services.benchmark import run_benchmark
+from apps.common.services.compiled_serializer import CompiledSerializer
+from apps.courses.enums import FeeType, WebinarStatus
+from apps.courses.models import Category, Course, Webinar
+from apps.courses.serializers.course import CourseModelSerializer
+from apps.courses.serializers.webinar import WebinarModelSerializer
+from apps.news.enums import QuestionTypeChoices
+from apps.news.models import Question, QuestionOption, Submission, Survey
+from apps.news.serializers.submissions import SubmissionModelSerializer
+from apps.user.models import User, UserProfile
+
+
+def build_author(position, now):
+    user = User(
+        id=position,
+        email=f"author{position}@example.com",
+        username=f"author{position}",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    if position % 5:
+        user.profile = UserProfile(
+            id=position,
+            first_name=f"Ism {position}",
+            last_name=f"Familiya {position}",
+            avatar=f"avatars/{position}.jpg" if position % 2 else None,
+            created_at=now,
+            updated_at=now,
+        )
+    else:
+        # cache the missing profile, as select_related does
+        User.profile.related.set_cached_value(user, None)
+    return user
+
+
+def build_rows(rows):
+    """
+    Unsaved courses, webinars and submissions with every relation the list
+    serializers read already cached, so the benchmark measures serialization only
+    """
+    now = timezone.now()
+    categories = [
+        Category(
+            id=position,
+            name=f"Kategoriya {position}",
+            icon=f"category/icon/{position}.png" if position % 2 else None,
+            created_at=now,
+            updated_at=now,
+        )
+        for position in range(1, 11)
+    ]
+    authors = [build_author(position, now) for position in range(1, 51)]
+
+    courses, webinars, submissions = [], [], []
+    for position in range(1, rows + 1):
+        author = authors[position % len(authors)]
+        category = categories[position % len(categories)] if position % 7 else None
+        created_at = now - timedelta(minutes=position)
+        course = Course(
+            id=position,
+            title=f"Kurs {position}",
+            description=f"Kurs {position} tavsifi",
+            price=Decimal(position * 1000) / 100,
+            card=f"courses/card/{position}.jpg" if position % 3 else None,
+            category=category or categories[0],
+            author=author,
+            discount=position % 50,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        courses.append(course)
+        webinars.append(
+            Webinar(
+                id=position,
+                title=f"Вебинар {position}",
+                author_display_name=author.username,
+                description=f"Вебинар {position} тавсифи",
+                price=Decimal(position * 500) / 100,
+                cover=f"webinars/cover/{position}.jpg" if position % 3 else None,
+                category=category,
+                author=author,
+                datetime=1_700_000_000 + position,
+                status=WebinarStatus.UPCOMING,
+                fee_type=FeeType.PAID if position % 2 else FeeType.FREE,
+                fee_amount=1000 if position % 2 else None,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+        )
+        survey = Survey(
+            id=position,
+            title=f"So'rovnoma {position}",
+            description="",
+            author=author,
+            course=course if position % 2 else None,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        question = Question(
+            id=position,
+            title=f"Savol {position}",
+            type=QuestionTypeChoices.SINGLE_CHOICE,
+            survey=survey,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        option = QuestionOption(
+            id=position,
+            question=question,
+            title=f"Javob {position}",
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        submissions.append(
+            Submission(
+                id=position,
+                user=author,
+                question=question,
+                chosen_option=option if position % 3 else None,
+                text=None if position % 3 else f"Javob matni {position}",
+                created_at=created_at,
+                updated_at=created_at,
+            )
+        )
+    return courses, webinars, submissions
+
+
+def build_context():
+    request = Request(APIRequestFactory().get("/api/v1/"))
+    return {"request": request, "view": None, "format": None}
+
+
+def get_pages(instances, page_size):
+    return [
+        instances[start : start + page_size]
+        for start in range(0, len(instances), page_size)
+    ]
+
+
+def check_equal(serializer_class, instances, context):
+    """First page index where the compiled output differs from DRF, None if none"""
+    compiled = CompiledSerializer(serializer_class, context)
+    expected = serializer_class(instances, many=True, context=context).data
+    actual = compiled.serialize_many(instances)
+    for index, (left, right) in enumerate(zip(expected, actual, strict=True)):
+        if json.dumps(left, default=str) != json.dumps(right, default=str):
+            return index
+    return None
+
+
+def run_benchmarks(rows=1000, page_size=10, repeat=5):
+    """
+    Equality mismatches and the DRF vs compiled timings for every list
+    serializer, one call per page of `page_size` rows
+    """
+    context = build_context()
+    courses, webinars, submissions = build_rows(rows)
+    mismatches = []
+    results = []
+    for serializer_class, instances in (
+        (CourseModelSerializer, courses),
+        (WebinarModelSerializer, webinars),
+        (SubmissionModelSerializer, submissions),
+    ):
+        name = serializer_class.__name__
+        index = check_equal(serializer_class, instances, context)
+        if index is not None:
+            mismatches.append(f"{name} differs at row {index}")
+            continue
+
+        pages = get_pages(instances, page_size)
+        compiled = CompiledSerializer(serializer_class, context)
+        results.append(
+            run_benchmark(
+                f"{name}[drf]",
+                lambda page, cls=serializer_class: (
+                    cls(page, many=True, context=context).data
+                ),
+                pages,
+                repeat=repeat,
+                unit="rows",
+            )
+        )
+        results.append(
+            run_benchmark(
+                f"{name}[compiled]",
+                compiled.serialize_many,
+                pages,
+                repeat=repeat,
+                unit="rows",
+            )
+        )
+    return mismatches, results
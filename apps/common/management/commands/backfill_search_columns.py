@@ -0,0 +1,68 @@
+import os
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.common.services.search_backfill import (
+    Checkpoint,
+    backfill,
+    get_searchable_models,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill search columns of searchable models in pk chunks on a process pool, "
+        "resuming from the last checkpoint"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Model label to backfill, e.g. courses.Course. Defaults to all.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Transliteration processes, 1 runs in the current process.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=str(settings.BASE_DIR / ".backfill_search_columns.json"),
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the checkpoint and backfill every row.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        models = get_searchable_models()
+        if options["models"]:
+            models = [apps.get_model(label) for label in options["models"]]
+
+        checkpoint = Checkpoint(options["checkpoint"])
+        if options["restart"]:
+            checkpoint.clear()
+
+        for model in models:
+            updated = backfill(
+                model,
+                chunk_size=options["chunk_size"],
+                workers=options["workers"],
+                checkpoint=checkpoint,
+                on_chunk=self.report_chunk,
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"{model._meta.label}: {updated} rows updated")
+            )
+
+    def report_chunk(self, model, last_pk, updated):
+        if self.verbosity > 1:
+            self.stdout.write(f"{model._meta.label}: {updated} rows, last pk {last_pk}")
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.courses.benchmarks import autocomplete
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark per keystroke latency of the autocomplete prefix index on "
+        "synthetic titles built from the reference corpus"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        build_seconds, keys, results = autocomplete.run_benchmarks(
+            options["size"], options["repeat"]
+        )
+        self.stdout.write(
+            f"index of {options['size']} titles, {keys} keys built in "
+            f"{build_seconds * 1e3:.1f}ms"
+        )
+        for result in results:
+            self.stdout.write(result.format())
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.benchmarks import renderers
+
+
+class Command(BaseCommand):
+    help = (
+        "Check the orjson renderer against the stdlib JSON renderer on course, "
+        "webinar, submission and transaction pages and benchmark both"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--page-size", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        mismatches, results = renderers.run_benchmarks(
+            options["rows"], options["page_size"], options["repeat"]
+        )
+        for result in results:
+            self.stdout.write(result.format())
+        if mismatches:
+            raise CommandError("Rendering differs: " + ", ".join(mismatches))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.benchmarks import serializers
+
+
+class Command(BaseCommand):
+    help = (
+        "Check compiled list serializers against the DRF serializers of courses, "
+        "webinars and submissions and benchmark both"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--page-size", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        mismatches, results = serializers.run_benchmarks(
+            options["rows"], options["page_size"], options["repeat"]
+        )
+        for result in results:
+            self.stdout.write(result.format())
+        if mismatches:
+            raise CommandError("; ".join(mismatches))
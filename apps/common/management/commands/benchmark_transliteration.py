@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.text_services.benchmarks import transliteration
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark to_cyrillic/to_latin on the reference Uzbek corpus and check "
+        "their output against the frozen snapshot"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only run the differential check against the snapshot.",
+        )
+        parser.add_argument(
+            "--fork",
+            action="store_true",
+            help=(
+                "Only compare workers forked from a cold and from a preloaded "
+                "master (Linux only)."
+            ),
+        )
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument(
+            "--update-snapshot",
+            action="store_true",
+            help="Freeze the current output as the new snapshot.",
+        )
+
+    def handle(self, *args, **options):
+        corpus = transliteration.load_corpus()
+
+        if options["fork"]:
+            for result in transliteration.run_fork_benchmarks(
+                corpus, options["workers"]
+            ):
+                self.stdout.write(result.format())
+            return
+
+        if options["update_snapshot"]:
+            transliteration.write_snapshot(transliteration.build_snapshot(corpus))
+            self.stdout.write(self.style.SUCCESS("Snapshot updated"))
+            return
+
+        mismatches = transliteration.check_snapshot(transliteration.load_snapshot())
+        for name, text, expected, actual in mismatches[:20]:
+            self.stderr.write(
+                f"{name}({text!r}):\n  expected {expected!r}\n  actual   {actual!r}"
+            )
+        if mismatches:
+            raise CommandError(f"{len(mismatches)} outputs differ from the snapshot")
+        self.stdout.write(self.style.SUCCESS("Output matches the snapshot"))
+
+        if options["check"]:
+            return
+        for result in transliteration.run_benchmarks(corpus, options["repeat"]):
+            self.stdout.write(result.format())
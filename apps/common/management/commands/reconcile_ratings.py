@@ -0,0 +1,40 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from apps.courses.services.ratings import RATING_TARGETS, reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute rating aggregates of courses and webinars from their ratings "
+        "in pk chunks, writing only rows that drifted"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Rating model label, e.g. courses.RatingCourse. Defaults to all.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        labels = options["models"] or list(RATING_TARGETS)
+        for label in labels:
+            rating_model = apps.get_model(label)
+            updated = reconcile(
+                rating_model,
+                chunk_size=options["chunk_size"],
+                on_chunk=self.report_chunk,
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{rating_model._meta.label}: {updated} rows updated"
+                )
+            )
+
+    def report_chunk(self, model, last_pk, updated):
+        if self.verbosity > 1:
+            self.stdout.write(f"{model._meta.label}: {updated} rows, last pk {last_pk}")
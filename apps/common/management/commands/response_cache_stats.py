@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.urls import get_resolver
+
+from apps.common.services import response_cache
+
+
+class Command(BaseCommand):
+    help = "Hit ratio and time saved by the response cache of every cached view"
+
+    def handle(self, *args, **options):
+        # cached views register themselves when the URLconf imports them
+        get_resolver().url_patterns  # noqa: B018
+        for name, stats in response_cache.get_all_stats().items():
+            self.stdout.write(
+                f"{name:<32} hits {stats['hits']:>9} misses {stats['misses']:>9} "
+                f"ratio {stats['hit_ratio']:>6.1%} "
+                f"saved {stats['saved_us'] / 1e6:>10.1f}s"
+            )
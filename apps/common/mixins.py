@@ -0,0 +1,251 @@
+import time
+
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from apps.common.services import conditional, response_cache, sparse_fields
+from apps.common.services.compiled_serializer import CompiledSerializer
+
+# Distinct (serializer class, exclusions) compiled plans kept, others are built per call
+COMPILED_PLAN_CACHE_SIZE = 1024
+
+_compiled_plans = {}
+
+
+def eager_load(queryset, serializer_class, context=None, required_fields=()):
+    """
+    Apply the `select_related_fields` and `prefetch_related_fields` declared on
+    `serializer_class` to `queryset`. With a serializer `context` only the
+    columns and joins the serializer renders under it are loaded, together with
+    `required_fields`, when every field can be traced to model fields.
+    """
+    select_related = getattr(serializer_class, "select_related_fields", ())
+    prefetch_related = getattr(serializer_class, "prefetch_related_fields", ())
+    plan = None
+    if context is not None:
+        plan = sparse_fields.get_load_plan(serializer_class, context)
+    if plan is not None:
+        queryset = plan.apply(queryset, required_fields)
+    elif select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+class EagerLoadingMixin:
+    """
+    Load the relations the view serializer declares together with the objects,
+    so serializing a page costs a constant number of queries. Reads defer the
+    columns the serializer does not render, except `required_fields` and the
+    keys a keyset paginator reads.
+    """
+
+    required_fields = ()
+
+    def get_required_fields(self):
+        get_key_fields = getattr(self.paginator, "get_key_fields", None)
+        if get_key_fields is None:
+            return self.required_fields
+        return (*self.required_fields, *get_key_fields())
+
+    def eager_load(self, queryset):
+        if self.request.method not in SAFE_METHODS:
+            return eager_load(queryset, self.get_serializer_class())
+        return eager_load(
+            queryset,
+            self.get_serializer_class(),
+            self.get_serializer_context(),
+            self.get_required_fields(),
+        )
+
+    def filter_queryset(self, queryset):
+        return self.eager_load(super().filter_queryset(queryset))
+
+
+class CompiledListMixin:
+    """
+    Serialize list pages with the `CompiledSerializer` plan of the view
+    serializer instead of building DRF serializers per row. Plans are compiled
+    once per serializer class and exclusion lists of the context and bound to
+    the context of every request.
+    """
+
+    def get_compiled_serializer(self):
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        key = (serializer_class, sparse_fields.get_exclusions_key(context))
+        compiled = _compiled_plans.get(key)
+        if compiled is not None:
+            return compiled.bind(context)
+        compiled = CompiledSerializer(serializer_class, context)
+        if len(_compiled_plans) < COMPILED_PLAN_CACHE_SIZE:
+            _compiled_plans[key] = compiled
+        return compiled
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        compiled = self.get_compiled_serializer()
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(compiled.serialize_many(page))
+
+        return Response(compiled.serialize_many(queryset))
+
+
+class ExcludeFieldsMixin:
+    """Passes the view's `exclude_fields` to its serializers through the context"""
+
+    exclude_fields = None
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.exclude_fields is not None:
+            context["exclude_fields"] = self.exclude_fields
+        return context
+
+
+class SparseFieldsMixin:
+    """
+    Lets clients narrow the top level fields with `?fields=a,b` or drop some
+    with `?omit=a,b`. The names join the serializer's exclusions in the context,
+    so `EagerLoadingMixin` defers their columns and joins too.
+    """
+
+    sparse_exclusions = None
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        serializer_class = self.get_serializer_class()
+        if self.sparse_exclusions is None:
+            self.sparse_exclusions = sparse_fields.get_client_exclusions(
+                serializer_class, context, self.request.query_params
+            )
+        if self.sparse_exclusions:
+            key = sparse_fields.get_exclude_fields_key(serializer_class)
+            context[key] = [*(context.get(key) or ()), *self.sparse_exclusions]
+        return context
+
+
+class CachedResponseMixin:
+    """
+    Serves list responses from the response cache. Entries are keyed by path,
+    normalized query string and the generations of `cache_models`, which every
+    save or delete of those models bumps, so writes invalidate them at once.
+    Only for views whose response does not depend on the user.
+    """
+
+    cache_name = None
+    cache_models = ()
+    response_cache_checked = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cache_models:
+            response_cache.registry.add(cls.get_cache_name())
+
+    @classmethod
+    def get_cache_name(cls):
+        return cls.cache_name or cls.__name__
+
+    def get_cached_response(self, request):
+        """Cached response to `request`, None on a miss. Looked up once per request"""
+        if self.response_cache_checked:
+            return None
+        self.response_cache_checked = True
+        name = self.get_cache_name()
+        key = response_cache.build_key(name, self.cache_models, request)
+        response = response_cache.get_response(name, key)
+        if response is None:
+            self.response_cache_key = key
+            self.response_cache_started = time.perf_counter()
+        return response
+
+    def list(self, request, *args, **kwargs):
+        response = self.get_cached_response(request)
+        if response is not None:
+            return response
+        return super().list(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "response_cache_key", None)
+        if (
+            key is not None
+            and response.status_code == 200
+            and isinstance(response, Response)
+            and response.accepted_renderer.format == "json"
+        ):
+            response.render()
+            response_cache.set_response(
+                key, response, time.perf_counter() - self.response_cache_started
+            )
+        return response
+
+
+class ConditionalGetMixin:
+    """
+    Answers `If-None-Match` and `If-Modified-Since` before running the query
+    and the serializer. Lists are validated by `MAX(updated_at)` and `COUNT`
+    of the filtered queryset, details by the instance's `updated_at`, both with
+    the query parameters and the generations of `conditional_models` (by default
+    the view's `cache_models`), so changes to related rows count too. With
+    `CachedResponseMixin` the validators are stored with the cached response,
+    so cache hits are answered without queries.
+    """
+
+    conditional_models = ()
+    conditional_validators = None
+
+    def get_conditional_models(self):
+        return self.conditional_models or getattr(self, "cache_models", ())
+
+    def check_not_modified(self, request, etag, last_modified):
+        self.conditional_validators = (etag, last_modified)
+        return conditional.get_not_modified(request, etag, last_modified)
+
+    def check_queryset_not_modified(self, request, queryset):
+        etag, last_modified = conditional.get_queryset_validators(
+            queryset, request, self.get_conditional_models()
+        )
+        return self.check_not_modified(request, etag, last_modified)
+
+    def check_instance_not_modified(self, request, instance):
+        etag, last_modified = conditional.get_instance_validators(
+            instance, request, self.get_conditional_models()
+        )
+        return self.check_not_modified(request, etag, last_modified)
+
+    def list(self, request, *args, **kwargs):
+        get_cached_response = getattr(self, "get_cached_response", None)
+        cached = get_cached_response(request) if get_cached_response else None
+        if cached is not None:
+            response = self.check_not_modified(
+                request, *conditional.get_response_validators(cached)
+            )
+            return cached if response is None else response
+
+        response = self.check_queryset_not_modified(
+            request, self.filter_queryset(self.get_queryset())
+        )
+        if response is not None:
+            return response
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        response = self.check_instance_not_modified(request, instance)
+        if response is not None:
+            return response
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # set before `CachedResponseMixin` stores the response with its headers
+        if self.conditional_validators is not None and response.status_code in (
+            200,
+            304,
+        ):
+            conditional.set_validators(response, *self.conditional_validators)
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -1,6 +1,12 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from apps.common.services.reference_cache import ReferenceQuerySet
+from apps.text_services.search_columns import build_search_columns
+
 
 class BaseModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created at"))
@@ -10,10 +16,169 @@ class BaseModel(models.Model):
         abstract = True
 
 
+class SearchableModel(BaseModel):
+    """
+    Keeps `search_latin` and `search_cyrillic` columns built from
+    `search_source_fields` so search can hit one trigram indexed column per script.
+    Source fields may follow relations with `__`, e.g. `author__profile__first_name`.
+    """
+
+    search_latin = models.TextField(
+        _("Search latin"), blank=True, default="", editable=False
+    )
+    search_cyrillic = models.TextField(
+        _("Search cyrillic"), blank=True, default="", editable=False
+    )
+
+    search_source_fields = ("title",)
+    search_columns = ("search_latin", "search_cyrillic")
+
+    class Meta:
+        abstract = True
+        indexes = [
+            GinIndex(
+                fields=["search_latin"],
+                name="%(app_label)s_%(class)s_slat_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["search_cyrillic"],
+                name="%(app_label)s_%(class)s_scyr_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
+
+    @classmethod
+    def get_search_source_fields(cls):
+        return cls.search_source_fields
+
+    @classmethod
+    def get_search_related_fields(cls):
+        """Relations to `select_related` when building search columns in bulk"""
+        return sorted(
+            {
+                field.rsplit("__", 1)[0]
+                for field in cls.get_search_source_fields()
+                if "__" in field
+            }
+        )
+
+    def get_search_source_value(self, field):
+        value = self
+        for attr in field.split("__"):
+            try:
+                value = getattr(value, attr)
+            except ObjectDoesNotExist:
+                return ""
+            if value is None:
+                return ""
+        return str(value)
+
+    def get_search_text(self, fields=None):
+        if fields is None:
+            fields = self.search_source_fields
+        values = (self.get_search_source_value(field) for field in fields)
+        return " ".join(value for value in values if value)
+
+    def get_search_texts(self):
+        """Texts to transliterate for the search columns"""
+        return [self.get_search_text()]
+
+    def apply_search_columns(self, columns):
+        """Set search columns from `build_search_columns` of `get_search_texts`"""
+        self.search_latin, self.search_cyrillic = columns[0]
+
+    def fill_search_columns(self):
+        self.apply_search_columns(
+            [build_search_columns(text) for text in self.get_search_texts()]
+        )
+
+    @classmethod
+    def get_search_source_names(cls):
+        """Names and attnames of the local fields the search columns read"""
+        names = set()
+        for source in cls.get_search_source_fields():
+            field = cls._meta.get_field(source.split("__", 1)[0])
+            names.update((field.name, field.attname))
+        return names
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.fill_search_columns()
+        elif not self.get_search_source_names().isdisjoint(update_fields):
+            self.fill_search_columns()
+            kwargs["update_fields"] = {*update_fields, *self.search_columns}
+        super().save(*args, **kwargs)
+
+
+class FullTextSearchModel(SearchableModel):
+    """
+    Adds a stored `search_vector` for postgres full text search. Every weight
+    of `search_vector_fields` holds its text in both latin and cyrillic script.
+    """
+
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    search_vector_fields = {
+        "A": ("title",),
+        "C": ("description",),
+    }
+    search_vector_config = "simple"
+    search_columns = (*SearchableModel.search_columns, "search_vector")
+
+    class Meta(SearchableModel.Meta):
+        abstract = True
+        indexes = [
+            *SearchableModel.Meta.indexes,
+            GinIndex(fields=["search_vector"], name="%(app_label)s_%(class)s_fts"),
+        ]
+
+    @classmethod
+    def get_search_source_fields(cls):
+        return (
+            *cls.search_source_fields,
+            *(
+                field
+                for fields in cls.search_vector_fields.values()
+                for field in fields
+            ),
+        )
+
+    def get_search_texts(self):
+        return [
+            *super().get_search_texts(),
+            *(
+                self.get_search_text(fields)
+                for fields in self.search_vector_fields.values()
+            ),
+        ]
+
+    def build_search_vector(self, columns):
+        vectors = [
+            SearchVector(
+                models.Value(" ".join(text), output_field=models.TextField()),
+                config=self.search_vector_config,
+                weight=weight,
+            )
+            for weight, text in zip(self.search_vector_fields, columns, strict=True)
+        ]
+        vector = vectors[0]
+        for other in vectors[1:]:
+            vector = vector + other
+        return vector
+
+    def apply_search_columns(self, columns):
+        super().apply_search_columns(columns)
+        self.search_vector = self.build_search_vector(columns[1:])
+
+
 class VersionHistory(BaseModel):
     version = models.CharField(_("Version"), max_length=64)
     required = models.BooleanField(_("Required"), default=True)
 
+    objects = ReferenceQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Version history")
         verbose_name_plural = _("Version histories")
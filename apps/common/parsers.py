@@ -0,0 +1,35 @@
+import codecs
+import io
+import re
+
+import orjson
+from rest_framework.parsers import JSONParser, get_encoding
+
+from apps.common.renderers import ORJSONRenderer
+
+# orjson reads integers over 64 bits as floats, the stdlib as ints
+LONG_NUMBER = re.compile(rb"\d{19}")
+
+
+class ORJSONParser(JSONParser):
+    """
+    `JSONParser` backed by orjson for UTF-8 bodies. Bodies orjson rejects or
+    may read differently go through the stdlib parser, so results and errors
+    are the same.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = get_encoding(parser_context)
+        if codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if not LONG_NUMBER.search(body):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass
+        return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,81 @@
+import math
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# Floats orjson formats unlike `float.__repr__` have an exponent (a digit then
+# "e") or a magnitude under 1e-4 written out ("0.0000"). Matches inside strings
+# only cost a fallback to the stdlib renderer.
+DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+
+
+def has_float_mismatch(ret):
+    return b"0e" in ret.translate(DIGITS_TO_ZERO) or b"0.0000" in ret
+
+
+def has_non_finite_float(data, ret):
+    """
+    Whether the payload holds a NaN or an infinity, which orjson writes as null
+    where the stdlib fails. Payloads of plain JSON types that read back equal
+    to what was written have none, other payloads are walked one nesting level
+    at a time.
+    """
+    if orjson.loads(ret) == data:
+        return False
+
+    level = [data]
+    while level:
+        values = []
+        for item in level:
+            values.extend(item.values() if isinstance(item, dict) else item)
+        if any(issubclass(kind, float) for kind in set(map(type, values))):
+            floats = (value for value in values if isinstance(value, float))
+            if not all(map(math.isfinite, floats)):
+                return True
+        level = [value for value in values if isinstance(value, dict | list | tuple)]
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` backed by orjson, with byte for byte the same output.
+
+    Types orjson does not render like DRF's `JSONEncoder` (Decimal, dates,
+    lazy strings, querysets...) go through that encoder. Payloads orjson can
+    not render the same way (non string keys, integers over 64 bits, floats in
+    exponent notation) and indented responses are rendered by the stdlib
+    renderer. So are payloads with NaN or infinity, which then fail like they
+    do with `JSONRenderer`, instead of rendering as null.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def __init__(self):
+        self.default = self.encoder_class().default
+
+    def is_fast(self, indent):
+        return indent is None and self.compact and not self.ensure_ascii
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if not self.is_fast(indent):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if has_float_mismatch(ret) or (
+            b"null" in ret and has_non_finite_float(data, ret)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same javascript safe escapes as JSONRenderer
+        if b"\xe2\x80" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
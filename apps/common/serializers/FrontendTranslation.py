@@ -7,3 +7,8 @@ class FrontendTranslationSerializer(serializers.ModelSerializer):
     class Meta:
         model = models.FrontendTranslation
         fields = ("key", "text")
+
+
+class FrontendTranslationQuerySerializer(serializers.Serializer):
+    key = serializers.CharField(required=False, allow_blank=True)
+    since_version = serializers.IntegerField(min_value=0, required=False)
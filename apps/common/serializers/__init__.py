@@ -1,7 +1,11 @@
-from .FrontendTranslation import FrontendTranslationSerializer
+from .FrontendTranslation import (
+    FrontendTranslationQuerySerializer,
+    FrontendTranslationSerializer,
+)
 from .VersionHistory import VersionHistorySerializer
 
 __all__ = [
+    "FrontendTranslationQuerySerializer",
     "FrontendTranslationSerializer",
     "VersionHistorySerializer",
 ]
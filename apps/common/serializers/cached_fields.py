@@ -0,0 +1,48 @@
+import copy
+
+from rest_framework.fields import DictField, ListField
+from rest_framework.relations import ManyRelatedField
+from rest_framework.serializers import BaseSerializer
+
+# Fields holding child fields bound to them, these still need a deep copy
+NESTED_FIELD_TYPES = (BaseSerializer, ManyRelatedField, ListField, DictField)
+# Distinct (serializer class, exclusions) pairs kept, others are built per call
+FIELDS_CACHE_SIZE = 1024
+
+
+def copy_field(field):
+    if isinstance(field, NESTED_FIELD_TYPES):
+        return copy.deepcopy(field)
+    return copy.copy(field)
+
+
+class CachedFieldsMixin:
+    """
+    Builds the fields of a serializer once per serializer class and set of
+    names excluded through `context[exclude_fields_key]`, then hands every
+    instance shallow copies of the unbound fields to bind.
+    """
+
+    exclude_fields_key = "exclude_fields"
+
+    _fields_cache = {}
+
+    def get_exclude_fields(self):
+        return frozenset(self.context.get(self.exclude_fields_key) or ())
+
+    def get_fields(self):
+        exclude_fields = self.get_exclude_fields()
+        key = (type(self), exclude_fields)
+        fields = self._fields_cache.get(key)
+        if fields is not None:
+            return {name: copy_field(field) for name, field in fields.items()}
+
+        fields = {
+            name: field
+            for name, field in super().get_fields().items()
+            if name not in exclude_fields
+        }
+        if len(self._fields_cache) >= FIELDS_CACHE_SIZE:
+            return fields
+        self._fields_cache[key] = fields
+        return {name: copy_field(field) for name, field in fields.items()}
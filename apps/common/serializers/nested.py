@@ -0,0 +1,65 @@
+from django.core.exceptions import ObjectDoesNotExist
+
+# Render the value with the nested serializer even when it is None or missing
+SERIALIZE = object()
+
+
+class Nested:
+    """
+    Declares the nested serializer a `SerializerMethodField` renders, so both
+    DRF and `CompiledSerializer` read it from one place.
+
+    `inherit_context` names the parent context keys passed down, True for all.
+    `empty` is returned when the source is None and `missing` when a reverse
+    one-to-one source does not exist.
+    """
+
+    def __init__(
+        self,
+        source,
+        serializer_class,
+        context=None,
+        inherit_context=(),
+        empty=SERIALIZE,
+        missing=SERIALIZE,
+    ):
+        self.source = source
+        self.serializer_class = serializer_class
+        self.context = context or {}
+        self.inherit_context = inherit_context
+        self.empty = empty
+        self.missing = missing
+
+    def get_context(self, parent_context):
+        if self.inherit_context is True:
+            context = dict(parent_context)
+        else:
+            context = {
+                key: parent_context[key]
+                for key in self.inherit_context
+                if key in parent_context
+            }
+        context.update(self.context)
+        return context
+
+    def serialize(self, obj, parent_context):
+        try:
+            value = getattr(obj, self.source)
+        except ObjectDoesNotExist:
+            if self.missing is SERIALIZE:
+                raise
+            return self.missing
+        if value is None and self.empty is not SERIALIZE:
+            return self.empty
+        return self.serializer_class(
+            value, context=self.get_context(parent_context)
+        ).data
+
+
+class NestedSerializerMixin:
+    """Renders the `nested_fields` declarations from `get_<field>` methods"""
+
+    nested_fields = {}
+
+    def get_nested(self, field_name, obj):
+        return self.nested_fields[field_name].serialize(obj, self.context)
@@ -0,0 +1,113 @@
+import json
+
+from django.conf import settings
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def is_unfiltered(queryset):
+    query = queryset.query
+    return not (
+        query.where
+        or query.distinct
+        or query.combinator
+        or query.group_by
+        or query.low_mark
+        or query.high_mark is not None
+    )
+
+
+def get_table_estimate(queryset):
+    """Row estimate of the table from `pg_class.reltuples`, -1 if never analyzed"""
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else -1
+
+
+def get_explain_estimate(queryset):
+    plan = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def estimate_count(queryset, threshold=None):
+    """
+    Return `(count, approximate)` for `queryset`. Unfiltered querysets of large
+    postgres tables are counted from planner statistics, everything else and
+    tables under `threshold` rows get an exact `COUNT(*)`.
+    """
+    if threshold is None:
+        threshold = settings.APPROXIMATE_COUNT_THRESHOLD
+    if connections[queryset.db].vendor != "postgresql" or not is_unfiltered(queryset):
+        return queryset.count(), False
+
+    estimate = get_table_estimate(queryset)
+    if estimate < 0:
+        estimate = get_explain_estimate(queryset)
+    if estimate < threshold:
+        return queryset.count(), False
+    return estimate, True
+
+
+class ApproximatePage(Page):
+    """Page whose `has_next` comes from fetching one extra row, not the count"""
+
+    has_more = None
+
+    def has_next(self):
+        if self.has_more is None:
+            return super().has_next()
+        return self.has_more
+
+
+class ApproximateCountPaginator(Paginator):
+    """
+    Paginator counting with `estimate_count`, usable as `ModelAdmin.paginator`.
+
+    An estimate can be off in either direction, so approximate counts do not
+    bound the page number. Pages are read with one extra row to tell whether
+    another page follows, and only a page past the last row is empty.
+    """
+
+    approximate = False
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, "query"):
+            return super().count
+        count, self.approximate = estimate_count(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        # reading the count sets `approximate`
+        if not self.count or not self.approximate:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"]) from None
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.approximate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not object_list and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        page = self._get_page(object_list[: self.per_page], number, self)
+        page.has_more = len(object_list) > self.per_page
+        return page
+
+    def _get_page(self, *args, **kwargs):
+        return ApproximatePage(*args, **kwargs)
@@ -0,0 +1,72 @@
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    calls: int
+    chars: int
+    seconds: float
+    p50: float
+    p99: float
+    peak_memory: int
+    unit: str = "chars"
+
+    @property
+    def chars_per_second(self):
+        return self.chars / self.seconds if self.seconds else 0.0
+
+    def format(self):
+        return (
+            f"{self.name:<32} {self.calls:>7} calls "
+            f"{self.chars_per_second:>14,.0f} {self.unit}/s "
+            f"p50 {self.p50 * 1e6:>10.1f}us "
+            f"p99 {self.p99 * 1e6:>10.1f}us "
+            f"peak {self.peak_memory / 1024:>9.1f}KiB"
+        )
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def run_benchmark(name, func, inputs, repeat=1, size=len, unit="chars"):
+    """
+    Call `func` on every item of `inputs` `repeat` times and measure per call
+    latency. Peak memory is measured in a separate traced pass, so tracing does
+    not distort the timings.
+    """
+    inputs = list(inputs)
+    latencies = []
+    chars = 0
+    for _ in range(repeat):
+        for item in inputs:
+            started = time.perf_counter()
+            func(item)
+            latencies.append(time.perf_counter() - started)
+            chars += size(item)
+
+    tracemalloc.start()
+    try:
+        for item in inputs:
+            func(item)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return BenchmarkResult(
+        name=name,
+        calls=len(latencies),
+        chars=chars,
+        seconds=sum(latencies),
+        p50=percentile(latencies, 0.50),
+        p99=percentile(latencies, 0.99),
+        peak_memory=peak_memory,
+        unit=unit,
+    )
@@ -0,0 +1,188 @@
+import copy
+
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from rest_framework.fields import SerializerMethodField, SkipField
+from rest_framework.relations import PKOnlyObject, RelatedField
+
+from apps.common.serializers.nested import SERIALIZE
+
+
+def get_model_field(serializer_class, source):
+    model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+    if model is None:
+        return None
+    try:
+        return model._meta.get_field(source)
+    except FieldDoesNotExist:
+        return None
+
+
+class AttributeStep:
+    """Plain attribute rendered by the field's `to_representation`"""
+
+    def __init__(self, name, field):
+        self.name = name
+        self.source = field.source
+        self.render = field.to_representation
+
+    def from_instance(self, obj):
+        value = getattr(obj, self.source)
+        return None if value is None else self.render(value)
+
+    def bind(self, template, context):
+        step = copy.copy(self)
+        step.render = template.fields[self.name].to_representation
+        return step
+
+
+class PrimaryKeyStep:
+    """Related field rendered as the primary key, read from the `_id` column"""
+
+    def __init__(self, name, model_field):
+        self.name = name
+        self.attname = model_field.attname
+
+    def bind(self, template, context):
+        return self
+
+    def from_instance(self, obj):
+        return getattr(obj, self.attname)
+
+
+class FieldStep:
+    """Any other field, through DRF's own attribute lookup"""
+
+    def __init__(self, name, field):
+        self.name = name
+        self.field = field
+
+    def bind(self, template, context):
+        return FieldStep(self.name, template.fields[self.name])
+
+    def from_instance(self, obj):
+        attribute = self.field.get_attribute(obj)
+        check_for_none = (
+            attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+        )
+        if check_for_none is None:
+            return None
+        return self.field.to_representation(attribute)
+
+
+class MethodStep:
+    """`SerializerMethodField` without a `Nested` declaration"""
+
+    def __init__(self, name, method):
+        self.name = name
+        self.method = method
+
+    def bind(self, template, context):
+        field = template.fields[self.name]
+        return MethodStep(self.name, getattr(template, field.method_name))
+
+    def from_instance(self, obj):
+        return self.method(obj)
+
+
+class NestedStep:
+    """`Nested` declaration compiled into the plan of its serializer"""
+
+    def __init__(self, name, nested, context):
+        self.name = name
+        self.nested = nested
+        self.context = nested.get_context(context)
+        self.plan = CompiledSerializer(nested.serializer_class, self.context)
+        self._none = SERIALIZE
+
+    def bind(self, template, context):
+        step = copy.copy(self)
+        step.context = self.nested.get_context(context)
+        step.plan = self.plan.bind(step.context)
+        step._none = SERIALIZE
+        return step
+
+    def render_none(self):
+        if self.nested.empty is not SERIALIZE:
+            return self.nested.empty
+        if self._none is SERIALIZE:
+            self._none = self.nested.serializer_class(None, context=self.context).data
+        return self._none
+
+    def from_instance(self, obj):
+        try:
+            value = getattr(obj, self.nested.source)
+        except ObjectDoesNotExist:
+            if self.nested.missing is SERIALIZE:
+                raise
+            return self.nested.missing
+        if value is None:
+            return self.render_none()
+        return self.plan.serialize(value)
+
+
+class CompiledSerializer:
+    """
+    Read-only serializer plan built once per serializer class and context.
+
+    The fields a `serializer_class` renders under `context` (after its
+    `exclude_fields` filtering) become a flat list of steps: plain attribute
+    access, primary key columns and `Nested` declarations compiled into their
+    own plans. Instances are serialized without building serializers per row.
+    The output equals `serializer_class(instance, context=context).data`.
+    """
+
+    def __init__(self, serializer_class, context=None):
+        self.serializer_class = serializer_class
+        self.context = context or {}
+        template = serializer_class(context=self.context)
+        nested_fields = getattr(serializer_class, "nested_fields", {})
+        self.steps = []
+        for name, field in template.fields.items():
+            if field.write_only:
+                continue
+            model_field = get_model_field(serializer_class, field.source)
+            if isinstance(field, SerializerMethodField):
+                nested = nested_fields.get(name)
+                if nested is None:
+                    step = MethodStep(name, getattr(template, field.method_name))
+                else:
+                    step = NestedStep(name, nested, self.context)
+            elif (
+                isinstance(field, RelatedField)
+                and field.use_pk_only_optimization()
+                and model_field is not None
+                and model_field.concrete
+            ):
+                step = PrimaryKeyStep(name, model_field)
+            elif (
+                model_field is not None
+                and model_field.concrete
+                and not model_field.is_relation
+            ):
+                step = AttributeStep(name, field)
+            else:
+                step = FieldStep(name, field)
+            self.steps.append(step)
+
+    def bind(self, context):
+        """
+        The same plan rendering under `context`. Steps keep their compiled
+        layout and only rebind the fields that may read the context.
+        """
+        compiled = copy.copy(self)
+        compiled.context = context or {}
+        template = self.serializer_class(context=compiled.context)
+        compiled.steps = [step.bind(template, compiled.context) for step in self.steps]
+        return compiled
+
+    def serialize(self, instance):
+        data = {}
+        for step in self.steps:
+            try:
+                data[step.name] = step.from_instance(instance)
+            except SkipField:
+                continue
+        return data
+
+    def serialize_many(self, instances):
+        return [self.serialize(instance) for instance in instances]
@@ -0,0 +1,79 @@
+import datetime
+import hashlib
+import json
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+from apps.common.services.response_cache import get_generations, normalize_query
+
+
+def build_etag(parts):
+    """Weak ETag over `parts`, equal responses may differ byte for byte"""
+    digest = hashlib.sha1(json.dumps(parts, default=str).encode()).hexdigest()
+    return "W/" + quote_etag(digest)
+
+
+def get_request_parts(request, models=()):
+    """What else a response depends on: the request and the related models"""
+    return [
+        request.scheme,
+        request.get_host(),
+        request.path,
+        normalize_query(request.query_params),
+        request.accepted_media_type,
+        get_generations(models) if models else [],
+    ]
+
+
+def get_queryset_validators(queryset, request, models=()):
+    """
+    ETag and Last-Modified of a list from one aggregate query: the latest
+    `updated_at` changes on every save and the count on every delete
+    """
+    watermark = queryset.order_by().aggregate(
+        last_modified=Max("updated_at"), count=Count("pk")
+    )
+    last_modified = watermark["last_modified"]
+    etag = build_etag(
+        [last_modified, watermark["count"], *get_request_parts(request, models)]
+    )
+    return etag, last_modified
+
+
+def get_instance_validators(instance, request, models=()):
+    etag = build_etag(
+        [
+            instance._meta.label,
+            instance.pk,
+            instance.updated_at,
+            *get_request_parts(request, models),
+        ]
+    )
+    return etag, instance.updated_at
+
+
+def get_not_modified(request, etag, last_modified):
+    """304 (or 412 for failed preconditions) response, None to build the body"""
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified and int(last_modified.timestamp()),
+    )
+
+
+def set_validators(response, etag, last_modified):
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+def get_response_validators(response):
+    """ETag and Last-Modified a response was stored with"""
+    timestamp = parse_http_date_safe(response.get("Last-Modified", ""))
+    last_modified = None
+    if timestamp is not None:
+        last_modified = datetime.datetime.fromtimestamp(timestamp, datetime.UTC)
+    return response.get("ETag"), last_modified
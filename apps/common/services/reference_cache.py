@@ -0,0 +1,252 @@
+import datetime
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, router, transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from apps.common.services.search_cache import bump_counter, get_counter
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "reference:invalidate"
+VERSION_KEY = "reference:version:{label}"
+ROWS_KEY = "reference:rows:{label}:{version}"
+# Seconds to wait before subscribing again after the connection dropped
+RECONNECT_DELAY = 1
+
+
+def is_cached_model(model):
+    return model._meta.label in settings.REFERENCE_CACHE_MODELS
+
+
+def invalidate_on_commit(model, using):
+    """Invalidate `model` once the current transaction on `using` commits"""
+    if is_cached_model(model):
+        transaction.on_commit(partial(reference_cache.invalidate, model), using=using)
+
+
+class ReferenceQuerySet(models.QuerySet):
+    """
+    Queryset of the reference tables. `update()` and `bulk_create()` send no
+    model signals, so they invalidate the cached table themselves. Deletes and
+    `bulk_update()`, which runs `update()`, are covered already.
+    """
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        if rows:
+            invalidate_on_commit(self.model, self.db)
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if objs:
+            invalidate_on_commit(self.model, self.db)
+        return objs
+
+
+def get_redis():
+    """Raw redis client of the default cache, None for other cache backends"""
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+def encode_value(value):
+    """JSON safe value, exact unlike the cache serializer's datetimes"""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+class Table:
+    """Rows of a model as raw values of its concrete fields, in default order"""
+
+    def __init__(self, model, version, rows):
+        self.model = model
+        self.version = version
+        self.rows = rows
+        self.fields = model._meta.concrete_fields
+        self.attnames = [field.attname for field in self.fields]
+        self.columns = {}
+        for index, field in enumerate(self.fields):
+            self.columns[field.name] = self.columns[field.attname] = index
+        self.columns["pk"] = self.attnames.index(model._meta.pk.attname)
+        self.db = router.db_for_read(model)
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    def load(cls, model, version):
+        attnames = [field.attname for field in model._meta.concrete_fields]
+        ordering = model._meta.ordering or ("pk",)
+        rows = model._base_manager.order_by(*ordering).values_list(*attnames)
+        return cls(model, version, [list(row) for row in rows])
+
+    @classmethod
+    def from_cache(cls, model, version, rows):
+        """Rows decoded from JSON get their python types back"""
+        fields = model._meta.concrete_fields
+        return cls(
+            model,
+            version,
+            [
+                [
+                    None if value is None else field.to_python(value)
+                    for field, value in zip(fields, row, strict=True)
+                ]
+                for row in rows
+            ],
+        )
+
+    def to_cache(self):
+        return [[encode_value(value) for value in row] for row in self.rows]
+
+    def filter(self, **lookups):
+        """New instances of the rows equal to every lookup, in default order"""
+        conditions = []
+        for name, value in lookups.items():
+            if name not in self.columns:
+                raise TypeError(f"{self.model.__name__} has no field {name!r}")
+            index = self.columns[name]
+            if value is not None:
+                value = self.fields[index].to_python(value)
+            conditions.append((index, value))
+        return [
+            self.model.from_db(self.db, self.attnames, row)
+            for row in self.rows
+            if all(row[index] == value for index, value in conditions)
+        ]
+
+
+class ReferenceCache:
+    """
+    Whole small tables of `REFERENCE_CACHE_MODELS`, read through a process
+    local LRU of `REFERENCE_CACHE_SIZE` tables and the shared cache. Committed
+    writes bump the table version and are published on a redis channel, every
+    process listening on it drops its copy at once. Models need the
+    `ReferenceQuerySet` manager for bulk writes to count, raw SQL is not seen. Local copies also expire
+    after `REFERENCE_CACHE_LOCAL_TIMEOUT` seconds in case a message is missed.
+    Lookups return new instances, meant for reading and assigning relations.
+    """
+
+    def __init__(self):
+        self.tables = OrderedDict()
+        # A table loaded while anything was dropped may be stale, it is not kept
+        self.drops = 0
+        self.lock = threading.Lock()
+        self.listener_pid = None
+
+    def get_table(self, model):
+        label = model._meta.label
+        if not is_cached_model(model):
+            raise ValueError(f"{label} is not in REFERENCE_CACHE_MODELS")
+        self.ensure_listener()
+        with self.lock:
+            table = self.tables.get(label)
+            if table is not None:
+                if (
+                    time.monotonic() - table.loaded_at
+                    < settings.REFERENCE_CACHE_LOCAL_TIMEOUT
+                ):
+                    self.tables.move_to_end(label)
+                    return table
+                del self.tables[label]
+            drops = self.drops
+
+        table = self.load_table(model)
+        with self.lock:
+            if self.drops != drops:
+                return table
+            self.tables[label] = table
+            self.tables.move_to_end(label)
+            while len(self.tables) > settings.REFERENCE_CACHE_SIZE:
+                self.tables.popitem(last=False)
+        return table
+
+    def load_table(self, model):
+        """
+        Table from the shared cache, else from the database. The version is
+        read before the rows, so rows are never older than their version.
+        """
+        label = model._meta.label
+        version = get_counter(VERSION_KEY.format(label=label))
+        key = ROWS_KEY.format(label=label, version=version)
+        rows = cache.get(key)
+        if rows is not None:
+            return Table.from_cache(model, version, rows)
+        table = Table.load(model, version)
+        cache.add(key, table.to_cache(), timeout=settings.REFERENCE_CACHE_TIMEOUT)
+        return table
+
+    def filter(self, model, **lookups):
+        return self.get_table(model).filter(**lookups)
+
+    def first(self, model, **lookups):
+        rows = self.filter(model, **lookups)
+        return rows[0] if rows else None
+
+    def last(self, model, **lookups):
+        rows = self.filter(model, **lookups)
+        return rows[-1] if rows else None
+
+    def drop(self, label=None):
+        with self.lock:
+            self.drops += 1
+            if label is None:
+                self.tables.clear()
+            else:
+                self.tables.pop(label, None)
+
+    def invalidate(self, model):
+        """Bump the version of `model` and tell every process to drop it"""
+        label = model._meta.label
+        bump_counter(VERSION_KEY.format(label=label))
+        self.drop(label)
+        client = get_redis()
+        if client is not None:
+            client.publish(CHANNEL, label)
+
+    def ensure_listener(self):
+        """Start the subscriber thread once per process, forked workers too"""
+        pid = os.getpid()
+        if self.listener_pid == pid:
+            return
+        with self.lock:
+            if self.listener_pid == pid:
+                return
+            self.listener_pid = pid
+            self.tables.clear()
+        if get_redis() is None:
+            return
+        threading.Thread(
+            target=self.listen, name="reference-cache-listener", daemon=True
+        ).start()
+
+    def listen(self):
+        while True:
+            try:
+                pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(CHANNEL)
+                # Messages sent while disconnected are lost
+                self.drop()
+                for message in pubsub.listen():
+                    self.drop(message["data"].decode())
+            except RedisError:
+                logger.warning("Reference cache listener disconnected")
+                time.sleep(RECONNECT_DELAY)
+
+
+reference_cache = ReferenceCache()
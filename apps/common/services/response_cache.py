@@ -0,0 +1,129 @@
+import hashlib
+import json
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from apps.common.services.search_cache import bump_counter, get_counter
+
+GENERATION_KEY = "response:generation:{label}"
+RESPONSE_KEY = "response:{name}:{digest}"
+STATS_KEY = "response:stats:{name}:{stat}"
+
+HITS = "hits"
+MISSES = "misses"
+# Microseconds the cached responses would have taken to build again
+SAVED = "saved_us"
+STATS = (HITS, MISSES, SAVED)
+
+# Saves touching only these fields do not change any cached response
+IGNORED_FIELDS = frozenset({"last_login"})
+# Response headers kept with the cached content
+STORED_HEADERS = ("ETag", "Last-Modified")
+
+# Names of the cached views, filled by `CachedResponseMixin` subclasses
+registry = set()
+
+
+def is_cached_model(model):
+    return model._meta.label in settings.RESPONSE_CACHE_MODELS
+
+
+def get_generation_key(model):
+    if isinstance(model, str):
+        model = apps.get_model(model)
+    return GENERATION_KEY.format(label=model._meta.label)
+
+
+def get_generations(models):
+    """Current generation of every model in `models`, read in one round trip"""
+    keys = [get_generation_key(model) for model in models]
+    generations = cache.get_many(keys)
+    return [generations.get(key) or get_counter(key) for key in keys]
+
+
+def bump_generation(model):
+    return bump_counter(get_generation_key(model))
+
+
+def normalize_query(query_dict):
+    """Query parameters sorted by name, values kept in their order"""
+    return sorted((key, query_dict.getlist(key)) for key in query_dict)
+
+
+def build_key(name, models, request):
+    """
+    Key of the response of the view `name` to `request` with the current
+    generations of the `models` it reads. Scheme and host are part of it,
+    serializers render absolute media URLs from them.
+    """
+    payload = json.dumps(
+        [
+            get_generations(models),
+            request.scheme,
+            request.get_host(),
+            request.path,
+            normalize_query(request.query_params),
+            request.accepted_media_type,
+        ]
+    )
+    return RESPONSE_KEY.format(
+        name=name, digest=hashlib.sha1(payload.encode()).hexdigest()
+    )
+
+
+def incr_stat(name, stat, delta=1):
+    key = STATS_KEY.format(name=name, stat=stat)
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def get_response(name, key):
+    """Cached response for `key`, None on a miss. Hits and misses are counted."""
+    entry = cache.get(key)
+    if entry is None:
+        incr_stat(name, MISSES)
+        return None
+    incr_stat(name, HITS)
+    incr_stat(name, SAVED, entry["cost"])
+    return HttpResponse(
+        entry["content"],
+        content_type=entry["content_type"],
+        headers=entry.get("headers"),
+    )
+
+
+def set_response(key, response, seconds):
+    """Store the rendered JSON `response`, `seconds` being what it took to build"""
+    cache.set(
+        key,
+        {
+            "content": response.content.decode(),
+            "content_type": response["Content-Type"],
+            "headers": {
+                header: response[header]
+                for header in STORED_HEADERS
+                if header in response
+            },
+            "cost": int(seconds * 1e6),
+        },
+        timeout=settings.RESPONSE_CACHE_TIMEOUT,
+    )
+
+
+def get_stats(name):
+    keys = {STATS_KEY.format(name=name, stat=stat): stat for stat in STATS}
+    values = cache.get_many(keys)
+    stats = {stat: values.get(key, 0) for key, stat in keys.items()}
+    requests = stats[HITS] + stats[MISSES]
+    stats["hit_ratio"] = stats[HITS] / requests if requests else 0.0
+    return stats
+
+
+def get_all_stats():
+    return {name: get_stats(name) for name in sorted(registry)}
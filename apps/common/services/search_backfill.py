@@ -0,0 +1,168 @@
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connections, transaction
+
+from apps.common.models import SearchableModel
+from apps.common.services import search_cache
+from apps.text_services.search_columns import build_search_columns
+
+RANGE_GENERATION_KEY = "search_backfill:generation"
+RANGE_KEY = "search_backfill:{generation}:{label}:{first_pk}:{last_pk}"
+# Completed ranges are kept long enough to resume a failed run
+RANGE_TIMEOUT = 7 * 24 * 60 * 60
+
+
+def get_searchable_models():
+    return [model for model in apps.get_models() if issubclass(model, SearchableModel)]
+
+
+def iter_pk_ranges(model, chunk_size, after_pk=None):
+    """Yield `(first_pk, last_pk)` of consecutive chunks of `chunk_size` rows"""
+    pks = model.objects.order_by("pk").values_list("pk", flat=True)
+    while True:
+        chunk = pks if after_pk is None else pks.filter(pk__gt=after_pk)
+        chunk = list(chunk[:chunk_size])
+        if not chunk:
+            return
+        yield chunk[0], chunk[-1]
+        after_pk = chunk[-1]
+
+
+def load_chunk(model, first_pk, last_pk):
+    return list(
+        model.objects.select_related(*model.get_search_related_fields())
+        .filter(pk__range=(first_pk, last_pk))
+        .order_by("pk")
+    )
+
+
+def get_chunk_texts(objects):
+    return [text for obj in objects for text in obj.get_search_texts()]
+
+
+def transliterate_texts(texts):
+    """CPU bound part of the backfill, runs in pool workers"""
+    return [build_search_columns(text) for text in texts]
+
+
+def write_chunk(model, objects, columns):
+    position = 0
+    for obj in objects:
+        count = len(obj.get_search_texts())
+        obj.apply_search_columns(columns[position : position + count])
+        position += count
+    with transaction.atomic():
+        model.objects.bulk_update(objects, model.search_columns)
+    if search_cache.is_cached_model(model):
+        search_cache.bump_version(model)
+    return len(objects)
+
+
+def backfill_range(model, first_pk, last_pk):
+    """Backfill one pk range in the current process"""
+    objects = load_chunk(model, first_pk, last_pk)
+    return write_chunk(model, objects, transliterate_texts(get_chunk_texts(objects)))
+
+
+class Checkpoint:
+    """Last backfilled pk per model label, kept in a json file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.positions = {}
+        if self.path.exists():
+            self.positions = json.loads(self.path.read_text())
+
+    def get(self, model):
+        return self.positions.get(model._meta.label)
+
+    def set(self, model, pk):
+        self.positions[model._meta.label] = pk
+        temporary_path = self.path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps(self.positions))
+        temporary_path.replace(self.path)
+
+    def clear(self):
+        self.positions = {}
+        self.path.unlink(missing_ok=True)
+
+
+class RangeCheckpoint:
+    """
+    Backfilled pk ranges per model label, kept in the cache. Chunk tasks finish
+    in any order on any worker, so every completed range is recorded instead of
+    the last pk. Ranges are recomputed on resume, runs resume with the same
+    `chunk_size` to skip the ranges they completed.
+    """
+
+    def __init__(self, generation=None):
+        if generation is None:
+            generation = search_cache.get_counter(RANGE_GENERATION_KEY)
+        self.generation = generation
+
+    def get_key(self, model, first_pk, last_pk):
+        return RANGE_KEY.format(
+            generation=self.generation,
+            label=model._meta.label,
+            first_pk=first_pk,
+            last_pk=last_pk,
+        )
+
+    def get_pending(self, model, ranges):
+        """`ranges` of `model` that were not backfilled yet"""
+        keys = {self.get_key(model, *pk_range): pk_range for pk_range in ranges}
+        done = cache.get_many(list(keys))
+        return [pk_range for key, pk_range in keys.items() if key not in done]
+
+    def add(self, model, first_pk, last_pk):
+        cache.set(self.get_key(model, first_pk, last_pk), True, timeout=RANGE_TIMEOUT)
+
+    def clear(self):
+        self.generation = search_cache.bump_counter(RANGE_GENERATION_KEY)
+
+
+def backfill(model, chunk_size, workers, checkpoint=None, on_chunk=None):
+    """
+    Stream `model` rows in pk chunks, transliterate them on a pool of `workers`
+    processes and write them back with `bulk_update`, saving the last written pk
+    to `checkpoint` after every chunk. Returns the number of updated rows.
+    """
+    after_pk = checkpoint.get(model) if checkpoint else None
+    ranges = iter_pk_ranges(model, chunk_size, after_pk)
+    updated = 0
+
+    def write(objects, columns, last_pk):
+        nonlocal updated
+        updated += write_chunk(model, objects, columns)
+        if checkpoint:
+            checkpoint.set(model, last_pk)
+        if on_chunk:
+            on_chunk(model, last_pk, updated)
+
+    if workers <= 1:
+        for first_pk, last_pk in ranges:
+            objects = load_chunk(model, first_pk, last_pk)
+            write(objects, transliterate_texts(get_chunk_texts(objects)), last_pk)
+        return updated
+
+    # fork the workers before any query so they do not inherit open connections
+    connections.close_all()
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        executor.submit(transliterate_texts, []).result()
+        for first_pk, last_pk in ranges:
+            objects = load_chunk(model, first_pk, last_pk)
+            future = executor.submit(transliterate_texts, get_chunk_texts(objects))
+            pending.append((objects, future, last_pk))
+            if len(pending) >= 2 * workers:
+                objects, future, last_pk = pending.popleft()
+                write(objects, future.result(), last_pk)
+        while pending:
+            objects, future, last_pk = pending.popleft()
+            write(objects, future.result(), last_pk)
+    return updated
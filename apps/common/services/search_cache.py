@@ -0,0 +1,94 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Case, IntegerField, When
+
+VERSION_KEY = "search:version:{label}"
+RESULT_KEY = "search:result:{label}:{version}:{digest}"
+
+
+def is_cached_model(model):
+    return model._meta.label in settings.SEARCH_CACHE_MODELS
+
+
+def get_counter(key, start=time.time_ns):
+    """
+    Read a version counter. A missing counter starts from the current time so
+    entries cached before an eviction are never read again.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, start(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_counter(key, start=time.time_ns):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, start(), timeout=None)
+        return cache.get(key)
+
+
+def get_version(model):
+    return get_counter(VERSION_KEY.format(label=model._meta.label))
+
+
+def bump_version(model):
+    return bump_counter(VERSION_KEY.format(label=model._meta.label))
+
+
+def get_queryset_digest(queryset):
+    """Digest of the SQL `queryset` runs, None if it can not match anything"""
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    return hashlib.sha1(repr((sql, params)).encode()).hexdigest()
+
+
+def build_key(queryset, variants):
+    """
+    Key for the results of `queryset` searched by the normalized `variants` of a
+    query, None if the queryset can not be cached.
+    """
+    model = queryset.model
+    queryset_digest = get_queryset_digest(queryset)
+    if queryset_digest is None:
+        return None
+    payload = json.dumps([list(variants), queryset_digest])
+    return RESULT_KEY.format(
+        label=model._meta.label,
+        version=get_version(model),
+        digest=hashlib.sha1(payload.encode()).hexdigest(),
+    )
+
+
+def get_pks(key):
+    return cache.get(key)
+
+
+def set_pks(key, queryset):
+    """Cache the ordered primary keys of `queryset` unless there are too many"""
+    limit = settings.SEARCH_CACHE_MAX_RESULTS
+    pks = list(queryset.values_list("pk", flat=True)[: limit + 1])
+    if len(pks) > limit:
+        return None
+    cache.set(key, pks, timeout=settings.SEARCH_CACHE_TIMEOUT)
+    return pks
+
+
+def filter_pks(queryset, pks):
+    """Restrict `queryset` to `pks`, ordered as they were cached"""
+    if not pks:
+        return queryset.none()
+    position = Case(
+        *[When(pk=pk, then=index) for index, pk in enumerate(pks)],
+        output_field=IntegerField(),
+    )
+    return queryset.filter(pk__in=pks).order_by(position)
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import SerializerMethodField
+from rest_framework.relations import RelatedField
+
+from apps.common.services.compiled_serializer import get_model_field
+
+FIELDS_PARAM = "fields"
+OMIT_PARAM = "omit"
+# Distinct (serializer class, exclusions) plans kept, others are built per call
+PLAN_CACHE_SIZE = 1024
+
+_plans = {}
+
+
+@dataclass(frozen=True, slots=True)
+class LoadPlan:
+    only: tuple
+    select_related: tuple
+
+    def apply(self, queryset, required_fields=()):
+        # select_related() without names would follow every non-null relation
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        return queryset.only(*self.only, *required_fields)
+
+
+class UnplannableFieldError(Exception):
+    """A field reads attributes that can not be derived from its declaration"""
+
+
+def parse_names(value):
+    return [name for name in (part.strip() for part in value.split(",")) if name]
+
+
+def get_exclude_fields_key(serializer_class):
+    return getattr(serializer_class, "exclude_fields_key", "exclude_fields")
+
+
+def get_client_exclusions(serializer_class, context, query_params):
+    """
+    Top level fields the client drops with `?fields=` (keep only these) and
+    `?omit=` (drop these), on top of the fields excluded by the server.
+    """
+    fields = parse_names(query_params.get(FIELDS_PARAM, ""))
+    omit = parse_names(query_params.get(OMIT_PARAM, ""))
+    if not fields and not omit:
+        return set()
+
+    available = set(serializer_class(context=context).fields)
+    errors = {}
+    for param, names in ((FIELDS_PARAM, fields), (OMIT_PARAM, omit)):
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            errors[param] = [f"Unknown field: {name}" for name in unknown]
+    if errors:
+        raise ValidationError(errors)
+
+    exclusions = set(omit)
+    if fields:
+        exclusions.update(available.difference(fields))
+    return exclusions
+
+
+def collect_paths(serializer_class, context, prefix, only, select_related):
+    template = serializer_class(context=context)
+    nested_fields = getattr(serializer_class, "nested_fields", {})
+    for name, field in template.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, SerializerMethodField):
+            nested = nested_fields.get(name)
+            model_field = nested and get_model_field(serializer_class, nested.source)
+            if (
+                model_field is None
+                or not model_field.is_relation
+                or model_field.many_to_many
+                or model_field.one_to_many
+            ):
+                raise UnplannableFieldError(name)
+            path = f"{prefix}{nested.source}"
+            select_related.append(path)
+            if model_field.concrete:
+                only.append(path)
+            collect_paths(
+                nested.serializer_class,
+                nested.get_context(context),
+                f"{path}__",
+                only,
+                select_related,
+            )
+            continue
+
+        model_field = get_model_field(serializer_class, field.source)
+        if model_field is None or not model_field.concrete:
+            raise UnplannableFieldError(name)
+        if model_field.is_relation and not (
+            isinstance(field, RelatedField) and field.use_pk_only_optimization()
+        ):
+            raise UnplannableFieldError(name)
+        only.append(f"{prefix}{field.source}")
+
+
+def build_load_plan(serializer_class, context):
+    only = []
+    select_related = []
+    try:
+        collect_paths(serializer_class, context, "", only, select_related)
+    except UnplannableFieldError:
+        return None
+    return LoadPlan(tuple(only), tuple(select_related))
+
+
+def get_exclusions_key(context):
+    """Exclusion lists of `context`, the only entries fields depend on"""
+    return frozenset(
+        (name, frozenset(value))
+        for name, value in context.items()
+        if isinstance(value, (list, tuple, set, frozenset))
+    )
+
+
+def get_load_plan(serializer_class, context):
+    """
+    Columns and joins `serializer_class` reads under `context`, None when some
+    field reads attributes that can not be traced to model fields. Plans are
+    cached per class and exclusion lists of the context.
+    """
+    key = (serializer_class, get_exclusions_key(context))
+    if key in _plans:
+        return _plans[key]
+    plan = build_load_plan(serializer_class, context)
+    if len(_plans) < PLAN_CACHE_SIZE:
+        _plans[key] = plan
+    return plan
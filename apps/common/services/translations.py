@@ -0,0 +1,99 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.common.services.search_cache import bump_counter, get_counter
+
+VERSION_KEY = "translations:version"
+BUNDLE_KEY = "translations:bundle:{version}"
+
+
+def now_ms():
+    # Versions reach clients, milliseconds stay exact in JavaScript numbers
+    return time.time_ns() // 1_000_000
+
+
+def get_version():
+    return get_counter(VERSION_KEY, start=now_ms)
+
+
+def bump_version():
+    return bump_counter(VERSION_KEY, start=now_ms)
+
+
+def load_texts():
+    from apps.common.models import FrontendTranslation
+
+    return dict(FrontendTranslation.objects.values_list("key", "text"))
+
+
+def get_shared_texts(version):
+    """
+    Texts of `version` from the cache, loaded by the first reader. The version
+    is read before the rows, so a bundle is never older than its version.
+    """
+    key = BUNDLE_KEY.format(version=version)
+    texts = cache.get(key)
+    if texts is None:
+        texts = load_texts()
+        cache.add(key, texts, timeout=settings.TRANSLATIONS_BUNDLE_TIMEOUT)
+    return texts
+
+
+def get_delta(old, new):
+    """Keys added or changed in `new` with their texts, keys removed from `old`"""
+    changed = {key: text for key, text in new.items() if old.get(key) != text}
+    deleted = [key for key in old if key not in new]
+    return changed, deleted
+
+
+class TranslationBundle:
+    """
+    Process wide key to text bundle of the frontend translations. Bundles are
+    shared through the cache per version, which every committed change bumps,
+    and the version is read at most every `TRANSLATIONS_CHECK_INTERVAL`
+    seconds. Bundles of served versions stay in the cache for
+    `TRANSLATIONS_BUNDLE_TIMEOUT` seconds to compute deltas from.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.texts = None
+        self.checked_at = None
+
+    def refresh(self):
+        version = get_version()
+        self.checked_at = time.monotonic()
+        if version != self.version:
+            self.texts = get_shared_texts(version)
+            self.version = version
+        return self.version, self.texts
+
+    def get(self):
+        if (
+            self.texts is None
+            or time.monotonic() - self.checked_at
+            >= settings.TRANSLATIONS_CHECK_INTERVAL
+        ):
+            return self.refresh()
+        return self.version, self.texts
+
+    def get_delta(self, since_version):
+        """
+        Version, whether the delta is the full bundle, and the changed and
+        deleted keys since `since_version`. Unknown or expired versions get
+        the full bundle.
+        """
+        version, texts = self.get()
+        if since_version != version:
+            version, texts = self.refresh()
+        if since_version == version:
+            return version, False, {}, []
+        old = cache.get(BUNDLE_KEY.format(version=since_version))
+        if old is None or since_version > version:
+            return version, True, texts, []
+        return version, False, *get_delta(old, texts)
+
+
+bundle = TranslationBundle()
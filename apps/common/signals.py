@@ -0,0 +1,66 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_migrate
+from django.dispatch import receiver
+
+
+@receiver(pre_migrate)
+def create_postgres_extensions(sender, using, **kwargs):
+    """Trigram indexes of searchable models need `pg_trgm` before tables are created"""
+    from django.db import connections
+
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_search_cache_version(sender, using, **kwargs):
+    """
+    Cached search results of a model are dropped once a write to it commits,
+    so a search reading the old rows can not cache them under the new version
+    """
+    from apps.common.services import search_cache
+
+    if search_cache.is_cached_model(sender):
+        transaction.on_commit(partial(search_cache.bump_version, sender), using=using)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_response_cache_generation(sender, using, update_fields=None, **kwargs):
+    """
+    Cached responses reading a model are dropped once a write to it commits,
+    so a response built from the old rows can not be cached as new
+    """
+    from apps.common.services import response_cache
+
+    if not response_cache.is_cached_model(sender):
+        return
+    if update_fields is not None and update_fields <= response_cache.IGNORED_FIELDS:
+        return
+    transaction.on_commit(partial(response_cache.bump_generation, sender), using=using)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_translations_version(sender, using, **kwargs):
+    """Processes reload the translation bundle once a change to it commits"""
+    from apps.common.models import FrontendTranslation
+    from apps.common.services import translations
+
+    if sender is FrontendTranslation:
+        transaction.on_commit(translations.bump_version, using=using)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_reference_cache(sender, using, **kwargs):
+    """Every process drops its copy of a reference table once a write commits"""
+    from apps.common.services.reference_cache import invalidate_on_commit
+
+    invalidate_on_commit(sender, using)
@@ -0,0 +1 @@
+from .search_backfill import *  # noqa: F403
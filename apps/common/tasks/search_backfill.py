@@ -0,0 +1,52 @@
+from celery import group, shared_task
+from django.apps import apps
+from django.db import DatabaseError
+
+from apps.common.services.search_backfill import (
+    RangeCheckpoint,
+    backfill_range,
+    get_searchable_models,
+    iter_pk_ranges,
+)
+
+
+@shared_task(
+    autoretry_for=(DatabaseError,),
+    max_retries=5,
+    retry_backoff=True,
+    retry_jitter=True,
+)
+def backfill_search_columns_chunk_task(label, first_pk, last_pk, generation=None):
+    """Backfill one pk range and record it as done, database errors are retried
+    with an exponential backoff"""
+    model = apps.get_model(label)
+    updated = backfill_range(model, first_pk, last_pk)
+    RangeCheckpoint(generation).add(model, first_pk, last_pk)
+    return updated
+
+
+@shared_task
+def backfill_search_columns_task(labels=None, chunk_size=1000, restart=False):
+    """Fan the backfill out as one chunk task per pk range, the worker pool
+    transliterates them in parallel and failed chunks can be retried alone.
+    Ranges completed by an earlier run are skipped unless `restart` is set."""
+    models = (
+        [apps.get_model(label) for label in labels]
+        if labels
+        else get_searchable_models()
+    )
+    checkpoint = RangeCheckpoint()
+    if restart:
+        checkpoint.clear()
+    chunks = [
+        backfill_search_columns_chunk_task.s(
+            model._meta.label, first_pk, last_pk, checkpoint.generation
+        )
+        for model in models
+        for first_pk, last_pk in checkpoint.get_pending(
+            model, iter_pk_ranges(model, chunk_size)
+        )
+    ]
+    if chunks:
+        group(chunks).apply_async()
+    return len(chunks)
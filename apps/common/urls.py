@@ -1,6 +1,10 @@
 from django.urls import path
 
-from apps.common.views import FrontendTranslationView, VersionHistoryView
+from apps.common.views import (
+    FrontendTranslationView,
+    ResponseCacheStatsView,
+    VersionHistoryView,
+)
 
 app_name = "common"
 
@@ -11,4 +15,9 @@ urlpatterns = [
         name="frontend-translations",
     ),
     path("VersionHistory/", VersionHistoryView.as_view(), name="version-history"),
+    path(
+        "response-cache/stats/",
+        ResponseCacheStatsView.as_view(),
+        name="response-cache-stats",
+    ),
 ]
@@ -1,4 +1,3 @@
-from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.generics import ListAPIView
@@ -6,26 +5,62 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from apps.common import models
-from apps.common.serializers import FrontendTranslationSerializer
+from apps.common.mixins import ConditionalGetMixin
+from apps.common.serializers import (
+    FrontendTranslationQuerySerializer,
+    FrontendTranslationSerializer,
+)
+from apps.common.services import conditional
+from apps.common.services.translations import bundle
 
+VERSION_HEADER = "X-Translations-Version"
+
+
+class FrontendTranslationView(ConditionalGetMixin, ListAPIView):
+    """
+    Key to text bundle of the frontend translations, served from the process
+    wide bundle. `since_version` returns the keys changed since that version
+    instead, or the whole bundle with `full` when the version is not known.
+    """
 
-class FrontendTranslationView(ListAPIView):
     serializer_class = FrontendTranslationSerializer
     permission_classes = (AllowAny,)
 
-    @swagger_auto_schema(
-        manual_parameters=[
-            openapi.Parameter(
-                name="key",
-                in_=openapi.IN_QUERY,
-                type=openapi.TYPE_STRING,
-                description="Key",
-            )
-        ]
-    )
+    @swagger_auto_schema(query_serializer=FrontendTranslationQuerySerializer)
     def get(self, request):
         # translation.activate(lang)
-        serializer = self.get_serializer(self.get_queryset(), many=True)
+        query = FrontendTranslationQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        if query.validated_data.get("key"):
+            return self.get_filtered(request)
+
+        since_version = query.validated_data.get("since_version")
+        if since_version is None:
+            version, data = bundle.get()
+        else:
+            version, full, changed, deleted = bundle.get_delta(since_version)
+            data = {
+                "version": version,
+                "full": full,
+                "changed": changed,
+                "deleted": deleted,
+            }
+        response = self.check_not_modified(
+            request,
+            conditional.build_etag([version, *conditional.get_request_parts(request)]),
+            None,
+        )
+        if response is None:
+            response = Response(data, status=status.HTTP_200_OK)
+        response.headers[VERSION_HEADER] = str(version)
+        return response
+
+    def get_filtered(self, request):
+        queryset = self.get_queryset()
+        response = self.check_queryset_not_modified(request, queryset)
+        if response is not None:
+            return response
+        serializer = self.get_serializer(queryset, many=True)
         data = {}
         for obj in serializer.data:
             data[obj["key"]] = obj["text"]
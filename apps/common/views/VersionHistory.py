@@ -4,12 +4,13 @@ from rest_framework.views import APIView
 
 from apps.common.models import VersionHistory
 from apps.common.serializers import VersionHistorySerializer
+from apps.common.services.reference_cache import reference_cache
 
 
 class VersionHistoryView(APIView):
     serializer_class = VersionHistorySerializer
 
     def get(self, request):
-        query = VersionHistory.objects.first()
+        query = reference_cache.first(VersionHistory)
         data = self.serializer_class(query).data
         return Response(data=data, status=status.HTTP_200_OK)
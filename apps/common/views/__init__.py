@@ -1,7 +1,9 @@
 from .FrontendTranslation import FrontendTranslationView
+from .response_cache import ResponseCacheStatsView
 from .VersionHistory import VersionHistoryView
 
 __all__ = [
     "FrontendTranslationView",
+    "ResponseCacheStatsView",
     "VersionHistoryView",
 ]
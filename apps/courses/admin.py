@@ -1,10 +1,22 @@
 from django.contrib import admin
 
+from apps.common.services.approximate_count import ApproximateCountPaginator
 from apps.courses.models import Course, Category, Webinar, Module, Lesson, Comment
 
-admin.site.register(Course)
+
+@admin.register(Course)
+class CourseAdmin(admin.ModelAdmin):
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(Webinar)
+class WebinarAdmin(admin.ModelAdmin):
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+
+
 admin.site.register(Category)
-admin.site.register(Webinar)
 admin.site.register(Module)
 admin.site.register(Lesson)
 admin.site.register(Comment)
@@ -0,0 +1,43 @@
+import random
+import time
+
+from apps.common.services.benchmark import run_benchmark
+from apps.courses.services.autocomplete import KINDS, PrefixIndex, Suggestion
+from apps.text_services.benchmarks.transliteration import load_corpus
+
+
+def build_suggestions(corpus, size, seed=0):
+    """`size` suggestions cycling through the corpus titles of both scripts"""
+    rng = random.Random(seed)
+    titles = [*corpus["latin"]["titles"], *corpus["cyrillic"]["titles"]]
+    return [
+        Suggestion(
+            KINDS[position % len(KINDS)],
+            position,
+            f"{titles[position % len(titles)]} {position // len(titles)}",
+            rng.randint(0, 1000),
+        )
+        for position in range(size)
+    ]
+
+
+def get_keystrokes(corpus):
+    """Every prefix typed on the way to each corpus query, in both scripts"""
+    queries = [*corpus["latin"]["queries"], *corpus["cyrillic"]["queries"]]
+    return [query[:length] for query in queries for length in range(1, len(query) + 1)]
+
+
+def run_benchmarks(size=10_000, repeat=5):
+    corpus = load_corpus()
+    suggestions = build_suggestions(corpus, size)
+
+    started = time.perf_counter()
+    index = PrefixIndex(suggestions)
+    build_seconds = time.perf_counter() - started
+
+    keystrokes = get_keystrokes(corpus)
+    results = [
+        run_benchmark("autocomplete[cold]", index._search, keystrokes, repeat=repeat),
+        run_benchmark("autocomplete[cached]", index.search, keystrokes, repeat=repeat),
+    ]
+    return build_seconds, len(index.keys), results
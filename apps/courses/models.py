@@ -3,7 +3,8 @@ import time
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
 
-from apps.common.models import BaseModel
+from apps.common.models import BaseModel, FullTextSearchModel, SearchableModel
+from apps.common.services.reference_cache import ReferenceQuerySet
 from apps.courses.enums import WebinarStatus, FeeType
 
 
@@ -11,6 +12,8 @@ class Category(BaseModel):
     name = models.CharField(max_length=64, unique=True, db_index=True)
     icon = models.ImageField(upload_to="category/icon", null=True, blank=True)
 
+    objects = ReferenceQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
@@ -20,7 +23,27 @@ class Category(BaseModel):
         ordering = ["name"]
 
 
-class Course(BaseModel):
+class RatedModel(models.Model):
+    """
+    Rating aggregates kept current by `apps.courses.services.ratings`, lists
+    order and filter by these columns instead of aggregating the ratings
+    """
+
+    rating_sum = models.IntegerField(
+        default=0, editable=False, verbose_name="Rating Sum"
+    )
+    rating_count = models.IntegerField(
+        default=0, editable=False, db_index=True, verbose_name="Rating Count"
+    )
+    rating_avg = models.FloatField(
+        default=0, editable=False, db_index=True, verbose_name="Average Rating"
+    )
+
+    class Meta:
+        abstract = True
+
+
+class Course(RatedModel, FullTextSearchModel):
     title = models.CharField(max_length=128, verbose_name="Title", db_index=True)
     description = models.TextField(verbose_name="Description")
     price = models.DecimalField(decimal_places=2, max_digits=10, verbose_name="Price")
@@ -48,10 +71,21 @@ class Course(BaseModel):
         default=0,
     )
 
+    search_source_fields = (
+        "title",
+        "author__profile__first_name",
+        "author__profile__last_name",
+    )
+    search_vector_fields = {
+        "A": ("title",),
+        "B": ("author__profile__first_name", "author__profile__last_name"),
+        "C": ("description",),
+    }
+
     def __str__(self):
         return self.title
 
-    class Meta:
+    class Meta(FullTextSearchModel.Meta):
         verbose_name = "Course"
         verbose_name_plural = "Courses"
         ordering = ("-created_at",)
@@ -84,7 +118,7 @@ class RatingCourse(BaseModel):
         ordering = ["-created_at"]
 
 
-class Webinar(BaseModel):
+class Webinar(RatedModel, FullTextSearchModel):
     title = models.CharField(max_length=128, verbose_name="Title", db_index=True)
     author_display_name = models.CharField(
         max_length=128, verbose_name="Display Name", default="", db_index=True
@@ -133,10 +167,30 @@ class Webinar(BaseModel):
         verbose_name="Fee Amount",
     )
 
+    search_source_fields = (
+        "title",
+        "author_display_name",
+        "author__username",
+        "author__email",
+        "author__profile__first_name",
+        "author__profile__last_name",
+    )
+    search_vector_fields = {
+        "A": ("title",),
+        "B": (
+            "author_display_name",
+            "author__username",
+            "author__email",
+            "author__profile__first_name",
+            "author__profile__last_name",
+        ),
+        "C": ("description",),
+    }
+
     def __str__(self):
         return self.title
 
-    class Meta:
+    class Meta(FullTextSearchModel.Meta):
         verbose_name = "Webinar Course"
         verbose_name_plural = "Webinar Courses"
 
@@ -171,7 +225,7 @@ class RatingWebinar(BaseModel):
         ordering = ["-created_at"]
 
 
-class Module(BaseModel):
+class Module(SearchableModel):
     title = models.CharField(max_length=128, verbose_name="Title")
     description = models.TextField(verbose_name="Description")
     course = models.ForeignKey(
@@ -185,12 +239,12 @@ class Module(BaseModel):
     def __str__(self):
         return self.title
 
-    class Meta:
+    class Meta(SearchableModel.Meta):
         verbose_name = "Module"
         verbose_name_plural = "Modules"
 
 
-class Lesson(BaseModel):
+class Lesson(SearchableModel):
     title = models.CharField(max_length=128, verbose_name="Title")
     description = models.TextField(verbose_name="Description")
     file = models.FileField(upload_to="lessons/%Y/%m", null=True, blank=True)
@@ -207,7 +261,7 @@ class Lesson(BaseModel):
     def __str__(self):
         return self.title
 
-    class Meta:
+    class Meta(SearchableModel.Meta):
         verbose_name = "Lesson"
         verbose_name_plural = "Lessons"
 
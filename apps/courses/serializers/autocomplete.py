@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+from apps.courses.services.autocomplete import DEFAULT_LIMIT, KINDS, MAX_LIMIT
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(allow_blank=True, trim_whitespace=False)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=MAX_LIMIT, default=DEFAULT_LIMIT
+    )
+    kind = serializers.MultipleChoiceField(choices=KINDS, required=False)
+
+
+class AutocompleteSuggestionSerializer(serializers.Serializer):
+    kind = serializers.CharField()
+    id = serializers.IntegerField()
+    title = serializers.CharField()
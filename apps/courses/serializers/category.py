@@ -1,10 +1,11 @@
 from rest_framework import serializers
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
 from apps.courses.models import Category
 from apps.courses.services.validate_alpha import alpha_validator
 
 
-class CategoryModelSerializer(serializers.ModelSerializer):
+class CategoryModelSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = "__all__"
@@ -14,11 +15,6 @@ class CategoryModelSerializer(serializers.ModelSerializer):
             "icon": {"required": False},
         }
 
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
-
 
 class CategoryCreateSerializer(serializers.Serializer):
     name = serializers.CharField(
@@ -1,18 +1,40 @@
 from django.db import transaction
 from rest_framework import serializers
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
+from apps.common.serializers.nested import Nested, NestedSerializerMixin
+from apps.common.services.reference_cache import reference_cache
 from apps.courses.models import Category, Course
 from apps.courses.serializers.category import CategoryModelSerializer
 from apps.user.serializers.account_model import UserProfileResponseSerializer
 
 
-class CourseModelSerializer(serializers.ModelSerializer):
+class CourseModelSerializer(
+    CachedFieldsMixin, NestedSerializerMixin, serializers.ModelSerializer
+):
     author = serializers.SerializerMethodField()
     category = serializers.SerializerMethodField()
 
+    select_related_fields = ("author__profile", "category")
+    nested_fields = {
+        "author": Nested(
+            "author",
+            UserProfileResponseSerializer,
+            context={
+                "exclude_profile_fields": ["last_name", "phone_number", "bio", "id"],
+                "exclude_fields": ["is_staff", "is_superuser"],
+            },
+        ),
+        "category": Nested(
+            "category",
+            CategoryModelSerializer,
+            context={"exclude_fields": ["id", "created_at", "updated_at"]},
+        ),
+    }
+
     class Meta:
         model = Course
-        fields = "__all__"
+        exclude = ("search_latin", "search_cyrillic", "search_vector", "rating_sum")
         read_only_fields = ("id", "author", "category")
         extra_kwargs = {
             "category": {"required": False, "write_only": True},
@@ -25,36 +47,10 @@ class CourseModelSerializer(serializers.ModelSerializer):
         }
 
     def get_author(self, obj):
-        exclude_fields = [
-            "is_staff",
-            "is_superuser",
-        ]
-        exclude_profile_fields = ["last_name", "phone_number", "bio", "id"]
-        author_serializer = UserProfileResponseSerializer(
-            obj.author,
-            context={
-                "exclude_profile_fields": exclude_profile_fields,
-                "exclude_fields": exclude_fields,
-            },
-        )
-
-        return author_serializer.data
-
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
+        return self.get_nested("author", obj)
 
     def get_category(self, obj):
-        exclude_fields = [
-            "id",
-            "created_at",
-            "updated_at",
-        ]
-        category_serializer = CategoryModelSerializer(
-            obj.category, context={"exclude_fields": exclude_fields}
-        )
-        return category_serializer.data
+        return self.get_nested("category", obj)
 
 
 class CourseCreateSerializer(serializers.Serializer):
@@ -81,7 +77,7 @@ class CourseCreateSerializer(serializers.Serializer):
         category_id = validated_data.get("category_id")
 
         try:
-            category = Category.objects.filter(id=category_id).first()
+            category = reference_cache.first(Category, id=category_id)
         except Exception as e:
             raise serializers.ValidationError({"error": str(e)})
         if not category:
@@ -2,11 +2,12 @@ from django.db import transaction
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
 from apps.courses.models import Lesson, Module
 from apps.courses.serializers.module import ModuleModelSerializer
 
 
-class LessonModelSerializer(serializers.ModelSerializer):
+class LessonModelSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     module = serializers.SerializerMethodField()
 
     class Meta:
@@ -23,11 +24,6 @@ class LessonModelSerializer(serializers.ModelSerializer):
 
         return module_serializer.data
 
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
-
 
 class LessonCreateSerializer(serializers.Serializer):
     title = serializers.CharField(max_length=128)
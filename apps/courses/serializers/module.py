@@ -2,23 +2,19 @@ from django.db import transaction
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError, PermissionDenied
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
 from apps.courses.models import Module, Course
 from apps.courses.serializers.course import CourseModelSerializer
 
 
-class ModuleModelSerializer(serializers.ModelSerializer):
+class ModuleModelSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     course = serializers.SerializerMethodField()
 
     class Meta:
         model = Module
-        fields = "__all__"
+        exclude = ("search_latin", "search_cyrillic")
         read_only_fields = ("course", "id")
 
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
-
     def get_course(self, obj):
         exclude_fields = [
             "id",
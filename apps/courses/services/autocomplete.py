@@ -0,0 +1,351 @@
+import copy
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Count, F
+
+from apps.common.services.search_cache import bump_counter, get_counter
+from apps.text_services.search_columns import (
+    build_search_columns,
+    normalize_search_text,
+)
+
+logger = logging.getLogger(__name__)
+
+COURSE = "course"
+WEBINAR = "webinar"
+CATEGORY = "category"
+KINDS = (COURSE, WEBINAR, CATEGORY)
+KIND_ORDER = {kind: position for position, kind in enumerate(KINDS)}
+# Bits of a rank below the popularity, see `get_rank`
+KIND_BITS = 2
+KIND_MASK = (1 << KIND_BITS) - 1
+ID_BITS = 40
+ADD = "add"
+REMOVE = "remove"
+
+VERSION_KEY = "autocomplete:version"
+CHANGE_KEY = "autocomplete:change:{version}"
+# A process further behind than this rebuilds instead of fetching the changes
+MAX_CHANGES = 1000
+# Keys are title suffixes starting at a word, cut to this many characters
+KEY_LENGTH = 32
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+SEARCH_CACHE_SIZE = 4096
+# Prefixes this short match too many keys to rank on every keystroke
+TOP_PREFIX_LENGTH = 2
+
+
+@dataclass(frozen=True, slots=True)
+class Suggestion:
+    kind: str
+    id: int
+    title: str
+    popularity: int
+
+
+def get_rank(suggestion):
+    """
+    Unique int ordering the most popular suggestions first, ties in kind and
+    then id order. Ints hash and compare faster than tuples in lookups.
+    """
+    return (
+        -suggestion.popularity << (KIND_BITS + ID_BITS)
+        | KIND_ORDER[suggestion.kind] << ID_BITS
+        | suggestion.id
+    )
+
+
+def get_index_keys(title):
+    """Every word suffix of `title`, normalized, in both scripts"""
+    keys = set()
+    for text in build_search_columns(title):
+        start = 0
+        while start < len(text):
+            keys.add(text[start : start + KEY_LENGTH])
+            start = text.find(" ", start) + 1
+            if not start:
+                break
+    return keys
+
+
+def get_top_prefixes(key):
+    return [key[:length] for length in range(1, min(len(key), TOP_PREFIX_LENGTH) + 1)]
+
+
+class PrefixIndex:
+    """
+    Sorted array of title keys with the rank of their suggestion, see
+    `get_rank`. Prefixes up to `TOP_PREFIX_LENGTH` characters are answered from
+    top lists kept per prefix, longer ones with two bisections and a top-k over
+    the matched range. `apply` returns an updated copy, so readers of this one
+    are never disturbed.
+    """
+
+    def __init__(self, suggestions=(), version=None):
+        self.suggestions = {
+            get_rank(suggestion): suggestion for suggestion in suggestions
+        }
+        self.ranks = {
+            (suggestion.kind, suggestion.id): rank
+            for rank, suggestion in self.suggestions.items()
+        }
+        pairs = sorted(
+            (key, rank)
+            for rank, suggestion in self.suggestions.items()
+            for key in get_index_keys(suggestion.title)
+        )
+        self.keys = [key for key, _ in pairs]
+        self.key_ranks = [rank for _, rank in pairs]
+        self.matches = defaultdict(set)
+        for key, rank in pairs:
+            for prefix in get_top_prefixes(key):
+                self.matches[prefix].add(rank)
+        self.matches = dict(self.matches)
+        self.top = {
+            prefix: tuple(heapq.nsmallest(MAX_LIMIT, ranks))
+            for prefix, ranks in self.matches.items()
+        }
+        self.version = version
+        self.built_at = time.monotonic()
+        self.search = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._search)
+
+    def __len__(self):
+        return len(self.suggestions)
+
+    def _search(self, prefix, limit=DEFAULT_LIMIT, kinds=KINDS):
+        prefix = normalize_search_text(prefix)[:KEY_LENGTH]
+        if not prefix:
+            return ()
+        if len(prefix) <= TOP_PREFIX_LENGTH and kinds == KINDS:
+            ranks = self.top.get(prefix, ())[:limit]
+        else:
+            start = bisect_left(self.keys, prefix)
+            end = bisect_left(self.keys, prefix + "\U0010ffff", lo=start)
+            ranks = set(self.key_ranks[start:end])
+            if kinds != KINDS:
+                orders = {KIND_ORDER[kind] for kind in kinds}
+                ranks = {
+                    rank for rank in ranks if rank >> ID_BITS & KIND_MASK in orders
+                }
+            ranks = heapq.nsmallest(limit, ranks)
+        return tuple(self.suggestions[rank] for rank in ranks)
+
+    def copy(self, version):
+        """Copy sharing the match sets, which are copied before they change"""
+        index = copy.copy(self)
+        index.suggestions = dict(self.suggestions)
+        index.ranks = dict(self.ranks)
+        index.keys = list(self.keys)
+        index.key_ranks = list(self.key_ranks)
+        index.matches = dict(self.matches)
+        index.top = dict(self.top)
+        index.version = version
+        index.search = lru_cache(maxsize=SEARCH_CACHE_SIZE)(index._search)
+        return index
+
+    def get_matches(self, prefix, changed):
+        if prefix not in changed:
+            self.matches[prefix] = set(self.matches.get(prefix, ()))
+            changed.add(prefix)
+        return self.matches[prefix]
+
+    def discard(self, rank, changed):
+        suggestion = self.suggestions.pop(rank)
+        del self.ranks[suggestion.kind, suggestion.id]
+        for key in get_index_keys(suggestion.title):
+            position = bisect_left(self.keys, key)
+            while position < len(self.keys) and self.keys[position] == key:
+                if self.key_ranks[position] == rank:
+                    del self.keys[position]
+                    del self.key_ranks[position]
+                    break
+                position += 1
+            for prefix in get_top_prefixes(key):
+                self.get_matches(prefix, changed).discard(rank)
+
+    def insert(self, suggestion, changed):
+        rank = get_rank(suggestion)
+        self.suggestions[rank] = suggestion
+        self.ranks[suggestion.kind, suggestion.id] = rank
+        for key in get_index_keys(suggestion.title):
+            position = bisect_right(self.keys, key)
+            self.keys.insert(position, key)
+            self.key_ranks.insert(position, rank)
+            for prefix in get_top_prefixes(key):
+                self.get_matches(prefix, changed).add(rank)
+
+    def apply(self, changes, version):
+        """
+        Copy with `changes` applied, each `[action, kind, id, title]`. Only the
+        changed titles are transliterated, an added suggestion keeps the
+        popularity it had. Applying a change twice has no further effect.
+        """
+        index = self.copy(version)
+        changed = set()
+        for action, kind, pk, title in changes:
+            rank = index.ranks.get((kind, pk))
+            old = None if rank is None else index.suggestions[rank]
+            if action == ADD and old is not None and old.title == title:
+                continue
+            if old is not None:
+                index.discard(rank, changed)
+            if action == ADD:
+                popularity = 0 if old is None else old.popularity
+                index.insert(Suggestion(kind, pk, title, popularity), changed)
+        for prefix in changed:
+            if index.matches[prefix]:
+                index.top[prefix] = tuple(
+                    heapq.nsmallest(MAX_LIMIT, index.matches[prefix])
+                )
+            else:
+                del index.matches[prefix]
+                index.top.pop(prefix, None)
+        return index
+
+
+def load_suggestions():
+    """Course and webinar titles by ratings count, category names by usage"""
+    from apps.courses.models import Category, Course, Webinar
+
+    courses = Course.objects.annotate(popularity=F("rating_count"))
+    webinars = Webinar.objects.annotate(popularity=F("rating_count"))
+    categories = Category.objects.annotate(
+        popularity=Count("courses", distinct=True) + Count("webinars", distinct=True)
+    )
+    suggestions = []
+    for kind, queryset, field in (
+        (COURSE, courses, "title"),
+        (WEBINAR, webinars, "title"),
+        (CATEGORY, categories, "name"),
+    ):
+        suggestions.extend(
+            Suggestion(kind, pk, title, popularity)
+            for pk, title, popularity in queryset.order_by().values_list(
+                "pk", field, "popularity"
+            )
+        )
+    return suggestions
+
+
+def get_version():
+    return get_counter(VERSION_KEY)
+
+
+def publish_change(action, kind, pk, title=""):
+    """Number a committed title change with the next version and share it"""
+    version = bump_counter(VERSION_KEY)
+    cache.set(
+        CHANGE_KEY.format(version=version),
+        [action, kind, pk, title],
+        timeout=settings.AUTOCOMPLETE_MAX_AGE,
+    )
+    return version
+
+
+class Autocomplete:
+    """
+    Process wide `PrefixIndex`. Committed title changes are published to the
+    cache under consecutive versions and every process applies the ones it
+    missed on its next version check, read at most every
+    `AUTOCOMPLETE_CHECK_INTERVAL` seconds. Gaps in the changes, and popularity
+    drift after `AUTOCOMPLETE_MAX_AGE` seconds, rebuild the index on a
+    background thread while the current one keeps answering.
+    """
+
+    def __init__(self):
+        self.index = None
+        self.checked_at = None
+        self.lock = threading.Lock()
+        self.rebuilding = False
+
+    def set_index(self, index):
+        """Keep `index` unless a newer version was set meanwhile"""
+        with self.lock:
+            if self.index is None or index.version >= self.index.version:
+                self.index = index
+            return self.index
+
+    def build(self):
+        index = PrefixIndex(load_suggestions(), version=get_version())
+        self.checked_at = time.monotonic()
+        return self.set_index(self.catch_up(index) or index)
+
+    def catch_up(self, index):
+        """
+        `index` with the changes published since its version, None when some
+        of them are gone from the cache
+        """
+        version = get_version()
+        if version == index.version:
+            return index
+        if version < index.version or version - index.version > MAX_CHANGES:
+            return None
+        keys = [
+            CHANGE_KEY.format(version=number)
+            for number in range(index.version + 1, version + 1)
+        ]
+        changes = cache.get_many(keys)
+        if len(changes) != len(keys):
+            return None
+        return index.apply([changes[key] for key in keys], version)
+
+    def rebuild_in_background(self):
+        with self.lock:
+            if self.rebuilding:
+                return
+            self.rebuilding = True
+        threading.Thread(
+            target=self.rebuild, name="autocomplete-rebuild", daemon=True
+        ).start()
+
+    def rebuild(self):
+        try:
+            self.build()
+        except Exception:
+            logger.exception("Autocomplete index rebuild failed")
+        finally:
+            # the thread's own connection, request threads keep theirs
+            connections.close_all()
+            self.rebuilding = False
+
+    def get_index(self):
+        index = self.index
+        if index is None:
+            return self.build()
+        now = time.monotonic()
+        if now - self.checked_at < settings.AUTOCOMPLETE_CHECK_INTERVAL:
+            return index
+        self.checked_at = now
+        updated = self.catch_up(index)
+        if updated is None:
+            self.rebuild_in_background()
+            return index
+        if updated is not index:
+            updated = self.set_index(updated)
+        if now - updated.built_at > settings.AUTOCOMPLETE_MAX_AGE:
+            self.rebuild_in_background()
+        return updated
+
+    def search(self, prefix, limit=DEFAULT_LIMIT, kinds=KINDS):
+        return self.get_index().search(prefix, limit, kinds)
+
+    def warm_up(self):
+        """Build the index ahead of the first query, left to it on failure"""
+        try:
+            self.build()
+        except Exception:
+            self.index = None
+
+
+autocomplete = Autocomplete()
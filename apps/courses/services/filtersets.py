@@ -1,13 +1,36 @@
 from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
 
 from apps.courses.models import Category, Course, Webinar
 
 
+class StableOrderingFilter(filters.OrderingFilter):
+    """Ties are broken by the primary key so pages do not overlap"""
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        ordering = [self.get_ordering_value(param) for param in value]
+        return qs.order_by(*ordering, "-pk")
+
+
+ORDERING_FIELDS = (
+    ("rating_avg", "rating"),
+    ("rating_count", "rating_count"),
+    ("created_at", "created_at"),
+)
+
+
 class CourseFilterByCategory(filters.FilterSet):
     category = filters.ModelChoiceFilter(queryset=Category.objects.all())
     category__name = filters.CharFilter(
         field_name="category__name", lookup_expr="iexact"
     )
+    min_rating = filters.NumberFilter(field_name="rating_avg", lookup_expr="gte")
+    min_rating_count = filters.NumberFilter(
+        field_name="rating_count", lookup_expr="gte"
+    )
+    ordering = StableOrderingFilter(fields=ORDERING_FIELDS)
 
     class Meta:
         model = Course
@@ -19,6 +42,11 @@ class WebinarFilterByCategory(filters.FilterSet):
     category__name = filters.CharFilter(
         field_name="category__name", lookup_expr="iexact"
     )
+    min_rating = filters.NumberFilter(field_name="rating_avg", lookup_expr="gte")
+    min_rating_count = filters.NumberFilter(
+        field_name="rating_count", lookup_expr="gte"
+    )
+    ordering = StableOrderingFilter(fields=ORDERING_FIELDS)
 
     class Meta:
         model = Webinar
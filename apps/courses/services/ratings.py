@@ -0,0 +1,176 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import (
+    Avg,
+    Count,
+    F,
+    FloatField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce, NullIf
+from django.utils import timezone
+
+from apps.common.services import response_cache, search_cache
+from apps.common.services.search_backfill import iter_pk_ranges
+
+# Rating model label to the foreign key of the rated `RatedModel`
+RATING_TARGETS = {
+    "courses.RatingCourse": "course",
+    "courses.RatingWebinar": "webinar",
+}
+
+
+def get_target_field(rating_model):
+    return rating_model._meta.get_field(RATING_TARGETS[rating_model._meta.label])
+
+
+def invalidate_caches(model):
+    """Aggregate updates skip model signals, cached reads are dropped here"""
+    if response_cache.is_cached_model(model):
+        response_cache.bump_generation(model)
+    if search_cache.is_cached_model(model):
+        search_cache.bump_version(model)
+
+
+def get_average(rating_sum, rating_count):
+    return Coalesce(
+        Cast(rating_sum, FloatField()) / NullIf(rating_count, Value(0)),
+        Value(0.0),
+    )
+
+
+def add_to_aggregates(model, pk, rating, count, using=None):
+    """
+    Add `rating` to the rating sum and `count` to the rating count of one
+    row, the average is derived from the same values in a single UPDATE
+    """
+    rating_sum = F("rating_sum") + rating
+    rating_count = F("rating_count") + count
+    model._base_manager.using(using).filter(pk=pk).update(
+        rating_sum=rating_sum,
+        rating_count=rating_count,
+        rating_avg=get_average(rating_sum, rating_count),
+        updated_at=timezone.now(),
+    )
+    transaction.on_commit(partial(invalidate_caches, model), using=using)
+
+
+def remember_rating(instance, using=None):
+    """
+    Keep the stored target and rating of `instance` before it is saved.
+
+    Inside a transaction the row stays locked until commit, so concurrent
+    saves of one rating apply their differences one after the other. Saves in
+    autocommit mode can not hold the lock and may race, `reconcile_ratings`
+    corrects the aggregates they leave behind.
+    """
+    instance._stored_rating = None
+    if instance._state.adding or instance.pk is None:
+        return
+    field = get_target_field(type(instance))
+    stored = type(instance)._base_manager.using(using).filter(pk=instance.pk)
+    if transaction.get_connection(using).in_atomic_block:
+        stored = stored.select_for_update()
+    instance._stored_rating = stored.values_list(field.attname, "rating").first()
+
+
+def rating_saved(instance, created, using=None):
+    field = get_target_field(type(instance))
+    model = field.related_model
+    target_id = getattr(instance, field.attname)
+    stored = None if created else getattr(instance, "_stored_rating", None)
+    if stored is None:
+        add_to_aggregates(model, target_id, instance.rating, 1, using)
+        return
+
+    stored_target_id, stored_rating = stored
+    if stored_target_id == target_id:
+        if instance.rating != stored_rating:
+            add_to_aggregates(
+                model, target_id, instance.rating - stored_rating, 0, using
+            )
+        return
+    add_to_aggregates(model, stored_target_id, -stored_rating, -1, using)
+    add_to_aggregates(model, target_id, instance.rating, 1, using)
+
+
+def rating_deleted(instance, origin=None, using=None):
+    field = get_target_field(type(instance))
+    model = field.related_model
+    target_id = getattr(instance, field.attname)
+    # The rated row itself is being deleted, its aggregates go with it
+    if isinstance(origin, model) and origin.pk == target_id:
+        return
+    if isinstance(origin, QuerySet) and origin.model is model:
+        return
+    add_to_aggregates(model, target_id, -instance.rating, -1, using)
+
+
+def get_computed_aggregates(rating_model):
+    """Rating aggregates of the outer rated row computed by subqueries"""
+    field = get_target_field(rating_model)
+    ratings = (
+        rating_model._base_manager.filter(**{field.name: OuterRef("pk")})
+        .order_by()
+        .values(field.name)
+    )
+    return {
+        "rating_sum": Coalesce(
+            Subquery(ratings.annotate(value=Sum("rating")).values("value")),
+            Value(0),
+        ),
+        "rating_count": Coalesce(
+            Subquery(ratings.annotate(value=Count("pk")).values("value")),
+            Value(0),
+        ),
+        "rating_avg": Coalesce(
+            Subquery(ratings.annotate(value=Avg("rating")).values("value")),
+            Value(0.0),
+            output_field=FloatField(),
+        ),
+    }
+
+
+def reconcile_range(rating_model, first_pk, last_pk):
+    """Recompute the aggregates of rows in the pk range that drifted"""
+    model = get_target_field(rating_model).related_model
+    computed = get_computed_aggregates(rating_model)
+    drifted = list(
+        model._base_manager.filter(pk__range=(first_pk, last_pk))
+        .annotate(
+            computed_sum=computed["rating_sum"],
+            computed_count=computed["rating_count"],
+        )
+        .filter(~Q(rating_sum=F("computed_sum")) | ~Q(rating_count=F("computed_count")))
+        .values_list("pk", flat=True)
+    )
+    if not drifted:
+        return 0
+    with transaction.atomic():
+        model._base_manager.filter(pk__in=drifted).update(
+            **computed, updated_at=timezone.now()
+        )
+    return len(drifted)
+
+
+def reconcile(rating_model, chunk_size=1000, on_chunk=None):
+    """
+    Recompute the aggregates of every row rated through `rating_model` in
+    pk chunks, only rows that drifted are written
+    """
+    model = get_target_field(rating_model).related_model
+    updated = 0
+    for first_pk, last_pk in iter_pk_ranges(model, chunk_size):
+        count = reconcile_range(rating_model, first_pk, last_pk)
+        updated += count
+        if on_chunk is not None:
+            on_chunk(model, last_pk, count)
+    if updated:
+        invalidate_caches(model)
+    return updated
@@ -0,0 +1,116 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.common.services import search_cache
+from apps.courses.models import (
+    Category,
+    Course,
+    RatingCourse,
+    RatingWebinar,
+    Webinar,
+)
+from apps.courses.services import autocomplete, ratings
+from apps.user.models import User, UserProfile
+
+
+def refresh_author_search_columns(models, author_id, using=None):
+    for model in models:
+        objects = list(
+            model.objects.filter(author_id=author_id).select_related(
+                *model.get_search_related_fields()
+            )
+        )
+        for obj in objects:
+            obj.fill_search_columns()
+        model.objects.bulk_update(objects, model.search_columns)
+        transaction.on_commit(partial(search_cache.bump_version, model), using=using)
+
+
+@receiver(post_save, sender=UserProfile)
+def refresh_author_name_search_columns(
+    sender, instance, using=None, update_fields=None, **kwargs
+):
+    """Author names are part of course and webinar search columns"""
+    if update_fields is not None and not {"first_name", "last_name"} & set(
+        update_fields
+    ):
+        return
+    refresh_author_search_columns((Course, Webinar), instance.user_id, using)
+
+
+@receiver(post_save, sender=User)
+def refresh_author_account_search_columns(
+    sender, instance, created, using=None, update_fields=None, **kwargs
+):
+    """Author username and email are part of webinar search columns"""
+    if created:
+        return
+    if update_fields is not None and not {"username", "email"} & set(update_fields):
+        return
+    refresh_author_search_columns((Webinar,), instance.pk, using)
+
+
+# Autocomplete kind and title field of the indexed models
+AUTOCOMPLETE_SOURCES = {
+    Course: (autocomplete.COURSE, "title"),
+    Webinar: (autocomplete.WEBINAR, "title"),
+    Category: (autocomplete.CATEGORY, "name"),
+}
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Webinar)
+@receiver(post_save, sender=Category)
+def publish_autocomplete_title(sender, instance, using, update_fields=None, **kwargs):
+    """Processes index the saved title once the save commits"""
+    kind, field = AUTOCOMPLETE_SOURCES[sender]
+    if update_fields is not None and field not in update_fields:
+        return
+    transaction.on_commit(
+        partial(
+            autocomplete.publish_change,
+            autocomplete.ADD,
+            kind,
+            instance.pk,
+            getattr(instance, field),
+        ),
+        using=using,
+    )
+
+
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=Webinar)
+@receiver(post_delete, sender=Category)
+def publish_autocomplete_removal(sender, instance, using, **kwargs):
+    """Processes drop the deleted title once the delete commits"""
+    kind, _ = AUTOCOMPLETE_SOURCES[sender]
+    transaction.on_commit(
+        partial(autocomplete.publish_change, autocomplete.REMOVE, kind, instance.pk),
+        using=using,
+    )
+
+
+@receiver(pre_save, sender=RatingCourse)
+@receiver(pre_save, sender=RatingWebinar)
+def remember_stored_rating(sender, instance, raw=False, using=None, **kwargs):
+    if not raw:
+        ratings.remember_rating(instance, using)
+
+
+@receiver(post_save, sender=RatingCourse)
+@receiver(post_save, sender=RatingWebinar)
+def add_rating_to_aggregates(
+    sender, instance, created, raw=False, using=None, **kwargs
+):
+    """Fixtures are left to `reconcile_ratings`, their targets may not exist yet"""
+    if not raw:
+        ratings.rating_saved(instance, created, using)
+
+
+@receiver(post_delete, sender=RatingCourse)
+@receiver(post_delete, sender=RatingWebinar)
+def remove_rating_from_aggregates(sender, instance, origin=None, using=None, **kwargs):
+    ratings.rating_deleted(instance, origin, using)
@@ -10,6 +10,7 @@ from apps.courses.views import (
     CourseSetCardAPIView,
     CourseDetailAPIView,
 )
+from apps.courses.views.autocomplete import AutocompleteAPIView
 from apps.courses.views.lesson import (
     LessonCreateAPIView,
     LessonListAPIView,
@@ -114,4 +115,5 @@ urlpatterns = [
         LessonDeleteAPIView.as_view(),
         name="lesson-delete",
     ),
+    path("autocomplete/", AutocompleteAPIView.as_view(), name="autocomplete"),
 ]
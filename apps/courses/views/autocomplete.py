@@ -0,0 +1,35 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from apps.courses.serializers.autocomplete import (
+    AutocompleteQuerySerializer,
+    AutocompleteSuggestionSerializer,
+)
+from apps.courses.services.autocomplete import KINDS, autocomplete
+
+
+class AutocompleteAPIView(GenericAPIView):
+    """Course, webinar and category suggestions for a typed prefix in any script"""
+
+    serializer_class = AutocompleteSuggestionSerializer
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        query_serializer=AutocompleteQuerySerializer,
+        responses={200: AutocompleteSuggestionSerializer(many=True)},
+    )
+    def get(self, request):
+        query = AutocompleteQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        kinds = query.validated_data.get("kind")
+        suggestions = autocomplete.search(
+            query.validated_data["q"],
+            query.validated_data["limit"],
+            tuple(kind for kind in KINDS if kind in kinds) if kinds else KINDS,
+        )
+        return Response(
+            self.get_serializer(suggestions, many=True).data, status=status.HTTP_200_OK
+        )
@@ -5,6 +5,12 @@ from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.mixins import (
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    EagerLoadingMixin,
+    SparseFieldsMixin,
+)
 from apps.courses.models import Category
 from apps.courses.serializers.category import (
     CategoryCreateSerializer,
@@ -78,12 +84,19 @@ class CategorySetIconView(GenericAPIView):
         )
 
 
-class CategoryListView(ListAPIView):
+class CategoryListView(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    SparseFieldsMixin,
+    EagerLoadingMixin,
+    ListAPIView,
+):
     serializer_class = CategoryModelSerializer
     queryset = Category.objects.all()
     filter_backends = (SearchFilter,)
     search_fields = ["name"]
     pagination_class = StandardResultsSetPagination
+    cache_models = ("courses.Category",)
 
 
 class CategoryDetailView(GenericAPIView):
@@ -1,19 +1,27 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
-from rest_framework.filters import SearchFilter
 from rest_framework.generics import CreateAPIView, ListAPIView, GenericAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.mixins import (
+    CachedResponseMixin,
+    CompiledListMixin,
+    ConditionalGetMixin,
+    EagerLoadingMixin,
+    SparseFieldsMixin,
+)
+from apps.common.renderers import ORJSONRenderer
 from apps.courses.models import Course
 from apps.courses.serializers.course import (
     CourseCreateSerializer,
     CourseModelSerializer,
 )
 from apps.courses.services.filtersets import CourseFilterByCategory
-from apps.text_services.pagination import StandardResultsSetPagination
+from apps.text_services.filters import CachedFullTextSearchFilter
+from apps.text_services.pagination import ApproximateCountPagination
 
 
 class CreateCourseAPIView(CreateAPIView):
@@ -26,17 +34,26 @@ class CreateCourseAPIView(CreateAPIView):
         serializer.save()
 
 
-class CourseListAPIView(ListAPIView):
+class CourseListAPIView(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    SparseFieldsMixin,
+    CompiledListMixin,
+    EagerLoadingMixin,
+    ListAPIView,
+):
     serializer_class = CourseModelSerializer
     queryset = Course.objects.all()
-    filter_backends = [SearchFilter, DjangoFilterBackend]
-    search_fields = (
-        "^title",
-        "=author__profile__first_name",
-        "=author__profile__last_name",
-    )
+    filter_backends = [DjangoFilterBackend, CachedFullTextSearchFilter]
     filterset_class = CourseFilterByCategory
-    pagination_class = StandardResultsSetPagination
+    pagination_class = ApproximateCountPagination
+    renderer_classes = [ORJSONRenderer]
+    cache_models = (
+        "courses.Course",
+        "courses.Category",
+        "user.User",
+        "user.UserProfile",
+    )
 
 
 
@@ -88,15 +105,16 @@ class CourseSetCardAPIView(GenericAPIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class CourseDetailAPIView(GenericAPIView):
+class CourseDetailAPIView(ConditionalGetMixin, EagerLoadingMixin, GenericAPIView):
     serializer_class = CourseModelSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    conditional_models = ("courses.Category", "user.User", "user.UserProfile")
 
 
     def _get_object(self, course_id):
         try:
-            course = Course.objects.get(id=course_id)
+            course = self.eager_load(Course.objects.all()).get(id=course_id)
         except Course.DoesNotExist:
             raise ValidationError("Course not found")
         if not course:
@@ -113,9 +131,9 @@ class CourseDetailAPIView(GenericAPIView):
     def get(self, request, course_id, *args, **kwargs):
         self.permission_classes = [AllowAny]
         course = self._get_object(course_id)
-        serializer = self.serializer_class(course, data=request.data, partial=True)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+        response = self.check_instance_not_modified(request, course)
+        if response is not None:
+            return response
         return Response(self.serializer_class(course).data, status=status.HTTP_200_OK)
 
     def delete(self, request, course_id, *args, **kwargs):
@@ -1,17 +1,25 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, permissions
-from rest_framework.filters import SearchFilter
 from rest_framework.generics import CreateAPIView, ListAPIView, GenericAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.mixins import (
+    CachedResponseMixin,
+    CompiledListMixin,
+    ConditionalGetMixin,
+    EagerLoadingMixin,
+    SparseFieldsMixin,
+)
+from apps.common.renderers import ORJSONRenderer
 from apps.courses.models import Webinar
 from apps.courses.serializers.webinar import (
     WebinarModelSerializer,
     WebinarCreateSerializer,
 )
 from apps.courses.services.filtersets import WebinarFilterByCategory
+from apps.text_services.filters import CachedFullTextSearchFilter
 
 
 class WebinarCreateAPIView(CreateAPIView):
@@ -31,18 +39,25 @@ class WebinarCreateAPIView(CreateAPIView):
         )
 
 
-class WebinarListAPIView(ListAPIView):
+class WebinarListAPIView(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    SparseFieldsMixin,
+    CompiledListMixin,
+    EagerLoadingMixin,
+    ListAPIView,
+):
     queryset = Webinar.objects.all()
     serializer_class = WebinarModelSerializer
-    filter_backends = [SearchFilter, DjangoFilterBackend]
-    search_fields = (
-        "^title",
-        "=author__username",
-        "^author__email",
-        "=author__profile__first_name",
-        "=author__profile__last_name",
-    )
+    filter_backends = [DjangoFilterBackend, CachedFullTextSearchFilter]
     filterset_class = WebinarFilterByCategory
+    renderer_classes = [ORJSONRenderer]
+    cache_models = (
+        "courses.Webinar",
+        "courses.Category",
+        "user.User",
+        "user.UserProfile",
+    )
 
 class WebinarSetCardAPIView(GenericAPIView):
     serializer_class = WebinarModelSerializer
@@ -1,10 +1,27 @@
 from django.contrib import admin
 
+from apps.common.services.approximate_count import ApproximateCountPaginator
 from apps.news.models import Submission, Post, Event, Survey, Question, QuestionOption
 
-admin.site.register(Submission)
-admin.site.register(Post)
-admin.site.register(Event)
+
+@admin.register(Post)
+class PostAdmin(admin.ModelAdmin):
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(Event)
+class EventAdmin(admin.ModelAdmin):
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(Submission)
+class SubmissionAdmin(admin.ModelAdmin):
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+
+
 admin.site.register(Survey)
 admin.site.register(Question)
 admin.site.register(QuestionOption)
@@ -1,12 +1,12 @@
 from django.db import models
 
-from apps.common.models import BaseModel
+from apps.common.models import BaseModel, SearchableModel
 from apps.courses.models import Course
 from apps.news.enums import QuestionTypeChoices
 from apps.user.models import User
 
 
-class Post(BaseModel):
+class Post(SearchableModel):
     title = models.CharField(max_length=255, verbose_name="Title")
     description = models.TextField(verbose_name="Description")
     card = models.ImageField(
@@ -19,13 +19,19 @@ class Post(BaseModel):
     def __str__(self):
         return self.title
 
-    class Meta:
+    class Meta(SearchableModel.Meta):
         verbose_name = "Post"
         verbose_name_plural = "Posts"
         ordering = ("-created_at",)
+        indexes = [
+            *SearchableModel.Meta.indexes,
+            models.Index(
+                fields=["-created_at", "-id"], name="news_post_created_id_idx"
+            ),
+        ]
 
 
-class Event(BaseModel):
+class Event(SearchableModel):
     title = models.CharField(max_length=255, verbose_name="Title")
     description = models.TextField(verbose_name="Description", blank=True)
     card = models.ImageField(
@@ -39,16 +45,18 @@ class Event(BaseModel):
     latitude = models.FloatField(verbose_name="Latitude", blank=True)
     longitude = models.FloatField(verbose_name="Longitude", blank=True)
 
+    search_source_fields = ("title", "location")
+
     def __str__(self):
         return self.title
 
-    class Meta:
+    class Meta(SearchableModel.Meta):
         verbose_name = "Event"
         verbose_name_plural = "Events"
         ordering = ("-created_at",)
 
 
-class Survey(BaseModel):
+class Survey(SearchableModel):
     title = models.CharField(max_length=255, verbose_name="Title")
     description = models.TextField(verbose_name="Description")
     card = models.ImageField(
@@ -69,7 +77,7 @@ class Survey(BaseModel):
     def __str__(self):
         return self.title
 
-    class Meta:
+    class Meta(SearchableModel.Meta):
         verbose_name = "Survey"
         verbose_name_plural = "Surveys"
         ordering = ("-created_at",)
@@ -146,4 +154,10 @@ class Submission(BaseModel):
     class Meta:
         verbose_name = "Submission"
         verbose_name_plural = "Submissions"
-        ordering = ("-created_at",)
\ No newline at end of file
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["user", "question", "-created_at", "-id"],
+                name="news_submission_keyset_idx",
+            )
+        ]
@@ -3,13 +3,30 @@ import datetime
 from django.db import transaction
 from rest_framework import serializers
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
+from apps.common.serializers.nested import Nested, NestedSerializerMixin
 from apps.news.models import Event
 from apps.user.serializers.account_model import UserProfileResponseSerializer
 
 
-class EventModelSerializer(serializers.ModelSerializer):
+class EventModelSerializer(
+    CachedFieldsMixin, NestedSerializerMixin, serializers.ModelSerializer
+):
     author = serializers.SerializerMethodField()
 
+    select_related_fields = ("author__profile",)
+    nested_fields = {
+        "author": Nested(
+            "author",
+            UserProfileResponseSerializer,
+            context={
+                "exclude_profile_fields": ["user", "phone_number", "bio", "id"],
+                "exclude_fields": ["is_staff", "is_superuser", "email", "is_active"],
+            },
+            empty={"author": None},
+        ),
+    }
+
     class Meta:
         model = Event
         fields = (
@@ -34,25 +51,8 @@ class EventModelSerializer(serializers.ModelSerializer):
             'longitude': {'required': False},
         }
 
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
-
     def get_author(self, obj):
-        if not obj.author:
-            return {"author": None}
-        exclude_fields = ["is_staff", "is_superuser", "email", "is_active"]
-        exclude_profile_fields = ["user", "phone_number", "bio", "id"]
-        author_serializer = UserProfileResponseSerializer(
-            obj.author,
-            context={
-                "exclude_profile_fields": exclude_profile_fields,
-                "exclude_fields": exclude_fields,
-            },
-        )
-
-        return author_serializer.data
+        return self.get_nested("author", obj)
 
 class EventCreateSerializer(serializers.Serializer):
     title = serializers.CharField(required=False)
@@ -2,13 +2,29 @@ from django.db import transaction
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
+from apps.common.serializers.nested import Nested, NestedSerializerMixin
 from apps.news.models import Post
 from apps.user.serializers.account_model import UserProfileResponseSerializer
 
 
-class PostModelSerializer(serializers.ModelSerializer):
+class PostModelSerializer(
+    CachedFieldsMixin, NestedSerializerMixin, serializers.ModelSerializer
+):
     author = serializers.SerializerMethodField()
 
+    select_related_fields = ("author__profile",)
+    nested_fields = {
+        "author": Nested(
+            "author",
+            UserProfileResponseSerializer,
+            context={
+                "exclude_profile_fields": ["user", "phone_number", "bio", "id"],
+                "exclude_fields": ["is_staff", "is_superuser", "email", "is_active"],
+            },
+        ),
+    }
+
     class Meta:
         model = Post
         fields = (
@@ -28,23 +44,8 @@ class PostModelSerializer(serializers.ModelSerializer):
             "card": {"required": False},
         }
 
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
-
     def get_author(self, obj):
-        exclude_fields = ["is_staff", "is_superuser", "email", "is_active"]
-        exclude_profile_fields = ["user", "phone_number", "bio", "id"]
-        author_serializer = UserProfileResponseSerializer(
-            obj.author,
-            context={
-                "exclude_profile_fields": exclude_profile_fields,
-                "exclude_fields": exclude_fields,
-            },
-        )
-
-        return author_serializer.data
+        return self.get_nested("author", obj)
 
 
 class PostCreateSerializer(serializers.Serializer):
@@ -1,13 +1,27 @@
 from django.db import transaction
 from rest_framework import serializers
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
+from apps.common.serializers.nested import Nested, NestedSerializerMixin
 from apps.news.models import QuestionOption, Question
 from apps.news.serializers.questions import QuestionModelSerializer
 
 
-class QuestionOptionModelSerializer(serializers.ModelSerializer):
+class QuestionOptionModelSerializer(
+    CachedFieldsMixin, NestedSerializerMixin, serializers.ModelSerializer
+):
     question = serializers.SerializerMethodField()
 
+    nested_fields = {
+        "question": Nested(
+            "question",
+            QuestionModelSerializer,
+            context={"exclude_fields": ["survey"]},
+            inherit_context=True,
+            empty=None,
+        ),
+    }
+
     class Meta:
         model = QuestionOption
         fields = (
@@ -17,20 +31,8 @@ class QuestionOptionModelSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'question')
 
-
     def get_question(self, obj):
-        if not obj.question:
-            return None
-        exclude_fields = ["survey"]
-        question_serializer = QuestionModelSerializer(
-            obj.question,
-            context={
-                **self.context,
-                "exclude_fields": exclude_fields,
-            },
-        )
-
-        return question_serializer.data
+        return self.get_nested("question", obj)
 
 class QuestionOptionCreateSerializer(serializers.Serializer):
     question_id = serializers.IntegerField()
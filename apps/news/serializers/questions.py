@@ -1,14 +1,28 @@
 from rest_framework import serializers
 from django.db import transaction
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
+from apps.common.serializers.nested import Nested, NestedSerializerMixin
 from apps.news.enums import QuestionTypeChoices
 from apps.news.models import Question, Survey
 from apps.news.serializers.survey import SurveyModelSerializer
 
 
-class QuestionModelSerializer(serializers.ModelSerializer):
+class QuestionModelSerializer(
+    CachedFieldsMixin, NestedSerializerMixin, serializers.ModelSerializer
+):
     survey = serializers.SerializerMethodField()
 
+    nested_fields = {
+        "survey": Nested(
+            "survey",
+            SurveyModelSerializer,
+            context={"exclude_fields": ["id", "description", "author"]},
+            inherit_context=True,
+            empty=None,
+        ),
+    }
+
     class Meta:
         model = Question
         fields = (
@@ -28,24 +42,8 @@ class QuestionModelSerializer(serializers.ModelSerializer):
             "survey": {"required": False},
         }
 
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
-
     def get_survey(self, obj):
-        if not obj.survey:
-            return None
-        exclude_fields = ["id", "description", "author"]
-        survey_serializer = SurveyModelSerializer(
-            obj.survey,
-            context={
-                **self.context,
-                "exclude_fields": exclude_fields,
-            },
-        )
-
-        return survey_serializer.data
+        return self.get_nested("survey", obj)
 
 class QuestionCreateSerializer(serializers.Serializer):
     title = serializers.CharField(required=True)
@@ -1,15 +1,37 @@
 from django.db import transaction
 from rest_framework import serializers
 
+from apps.common.serializers.nested import Nested, NestedSerializerMixin
 from apps.news.models import Submission, Question, QuestionOption
+from apps.news.serializers.question_options import QuestionOptionModelSerializer
 from apps.news.serializers.questions import QuestionModelSerializer
 
 
-class SubmissionModelSerializer(serializers.ModelSerializer):
+class SubmissionModelSerializer(NestedSerializerMixin, serializers.ModelSerializer):
     user = serializers.SerializerMethodField()
     question = serializers.SerializerMethodField()
     chosen_option = serializers.SerializerMethodField()
-    text = serializers.SerializerMethodField()
+
+    select_related_fields = (
+        "user",
+        "question__survey__course",
+        "chosen_option",
+    )
+    nested_fields = {
+        "question": Nested(
+            "question",
+            QuestionModelSerializer,
+            context={"exclude_fields": ["survey"]},
+            inherit_context=True,
+            empty=None,
+        ),
+        "chosen_option": Nested(
+            "chosen_option",
+            QuestionOptionModelSerializer,
+            context={"exclude_fields": ["question"]},
+            empty=None,
+        ),
+    }
 
     class Meta:
         model = Submission
@@ -35,31 +57,10 @@ class SubmissionModelSerializer(serializers.ModelSerializer):
             return None
 
     def get_question(self, obj):
-        if not obj.question:
-            return None
-        exclude_fields = [ "survey"]
-        question_serializer = QuestionModelSerializer(
-            obj.question,
-            context={
-                **self.context,
-                "exclude_fields": exclude_fields,
-            },
-        )
-
-        return question_serializer.data
+        return self.get_nested("question", obj)
 
     def get_chosen_option(self, obj):
-        if not obj.chosen_option:
-            return None
-        exclude_fields = ["question"]
-        question_serializer = QuestionModelSerializer(
-            obj.chosen_option,
-            context={
-                exclude_fields: exclude_fields,
-            }
-        )
-
-        return question_serializer.data
+        return self.get_nested("chosen_option", obj)
 
 class SubmissionCreateSerializer(serializers.Serializer):
     chosen_option = serializers.IntegerField(required=False)
@@ -1,16 +1,47 @@
 from django.db import transaction
 from rest_framework import serializers
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
+from apps.common.serializers.nested import Nested, NestedSerializerMixin
 from apps.courses.models import Course
 from apps.courses.serializers.course import CourseModelSerializer
 from apps.news.models import Survey
 from apps.user.serializers.account_model import UserProfileResponseSerializer
 
 
-class SurveyModelSerializer(serializers.ModelSerializer):
+class SurveyModelSerializer(
+    CachedFieldsMixin, NestedSerializerMixin, serializers.ModelSerializer
+):
     author = serializers.SerializerMethodField()
     course = serializers.SerializerMethodField()
 
+    select_related_fields = ("author__profile", "course")
+    nested_fields = {
+        "author": Nested(
+            "author",
+            UserProfileResponseSerializer,
+            context={
+                "exclude_profile_fields": ["user", "phone_number", "bio", "id"],
+                "exclude_fields": ["is_staff", "is_superuser", "email", "is_active"],
+            },
+            empty={"author": None},
+        ),
+        "course": Nested(
+            "course",
+            CourseModelSerializer,
+            context={
+                "exclude_fields": [
+                    "author",
+                    "description",
+                    "created_at",
+                    "updated_at",
+                    "category",
+                ],
+            },
+            empty={"course": None},
+        ),
+    }
+
     class Meta:
         model = Survey
         fields = (
@@ -31,38 +62,11 @@ class SurveyModelSerializer(serializers.ModelSerializer):
             'course': {'required': False},
         }
 
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
-
     def get_author(self, obj):
-        if not obj.author:
-            return {"author": None}
-        exclude_fields = ["is_staff", "is_superuser", "email", "is_active"]
-        exclude_profile_fields = ["user", "phone_number", "bio", "id"]
-        author_serializer = UserProfileResponseSerializer(
-            obj.author,
-            context={
-                "exclude_profile_fields": exclude_profile_fields,
-                "exclude_fields": exclude_fields,
-            },
-        )
-
-        return author_serializer.data
+        return self.get_nested("author", obj)
 
     def get_course(self, obj):
-        if not obj.course:
-            return {"course": None}
-        exclude_fields = ['author', 'description', 'created_at', 'updated_at', 'category']
-        course_serializer = CourseModelSerializer(
-            obj.course,
-            context={
-                "exclude_fields": exclude_fields,
-            },
-        )
-
-        return course_serializer.data
+        return self.get_nested("course", obj)
 
 class SurveyCreateSerializer(serializers.Serializer):
     title = serializers.CharField(required=False)
@@ -5,26 +5,29 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.mixins import (
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    EagerLoadingMixin,
+    ExcludeFieldsMixin,
+    SparseFieldsMixin,
+)
 from apps.news.models import Event
 from apps.news.serializers.events import EventCreateSerializer, EventModelSerializer
-from apps.text_services.pagination import StandardResultsSetPagination
+from apps.text_services.pagination import ApproximateCountPagination
 
 
-class EventCreateAPIView(CreateAPIView):
+class EventCreateAPIView(ExcludeFieldsMixin, CreateAPIView):
     serializer_class = EventCreateSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    exclude_fields = ("created_at", "updated_at")
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
-
-class EventUpdateAPIView(GenericAPIView):
+class EventUpdateAPIView(ExcludeFieldsMixin, GenericAPIView):
     serializer_class = EventModelSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    exclude_fields = ("created_at", "updated_at")
 
     def get_object(self):
         event_id = self.kwargs["pk"]
@@ -34,12 +37,6 @@ class EventUpdateAPIView(GenericAPIView):
             raise ValidationError("Event does not exist")
 
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
-
     def patch(self, request, *args, **kwargs):
         user = self.request.user
         event = self.get_object()
@@ -50,26 +47,30 @@ class EventUpdateAPIView(GenericAPIView):
         serializer.save()
         return Response(serializer.data)
 
-class EventListAPIView(ListAPIView):
+class EventListAPIView(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    SparseFieldsMixin,
+    ExcludeFieldsMixin,
+    EagerLoadingMixin,
+    ListAPIView,
+):
     serializer_class = EventModelSerializer
-    pagination_class = StandardResultsSetPagination
+    pagination_class = ApproximateCountPagination
     queryset = Event.objects.all()
+    exclude_fields = ("created_at", "updated_at", "description")
+    cache_models = ("news.Event", "user.User", "user.UserProfile")
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at", "description")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
-
-class EventDetailAPIView(RetrieveAPIView):
+class EventDetailAPIView(ConditionalGetMixin, EagerLoadingMixin, RetrieveAPIView):
     serializer_class = EventModelSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    conditional_models = ("user.User", "user.UserProfile")
 
     def get_object(self):
         event_id = self.kwargs["pk"]
         try:
-            return Event.objects.get(pk=event_id)
+            return self.eager_load(Event.objects.all()).get(pk=event_id)
         except Event.DoesNotExist:
             raise ValidationError("Event does not exist")
 
@@ -11,55 +11,55 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.mixins import (
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    EagerLoadingMixin,
+    ExcludeFieldsMixin,
+    SparseFieldsMixin,
+)
 from apps.news.models import Post
 from apps.news.serializers.posts import PostCreateSerializer, PostModelSerializer
-from apps.text_services.pagination import StandardResultsSetPagination
+from apps.text_services.pagination import KeysetResultsSetPagination
 
 
-class PostCreateAPIView(CreateAPIView):
+class PostCreateAPIView(ExcludeFieldsMixin, CreateAPIView):
     serializer_class = PostCreateSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
-
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
+    exclude_fields = ("created_at", "updated_at")
 
 
-class PostListAPIView(ListAPIView):
+class PostListAPIView(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    SparseFieldsMixin,
+    ExcludeFieldsMixin,
+    EagerLoadingMixin,
+    ListAPIView,
+):
     serializer_class = PostModelSerializer
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetResultsSetPagination
     permission_classes = [AllowAny]
-
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at", "description")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
+    exclude_fields = ("created_at", "updated_at", "description")
+    cache_models = ("news.Post", "user.User", "user.UserProfile")
 
     def get_queryset(self):
         return Post.objects.all()
 
 
-class PostDetailAPIView(RetrieveAPIView):
+class PostDetailAPIView(
+    ConditionalGetMixin, ExcludeFieldsMixin, EagerLoadingMixin, RetrieveAPIView
+):
     serializer_class = PostModelSerializer
     permission_classes = [AllowAny]
-
-    def get_serializer_context(self):
-        exclude_fields = (
-            "created_at",
-            "updated_at",
-        )
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
+    exclude_fields = ("created_at", "updated_at")
+    conditional_models = ("user.User", "user.UserProfile")
 
     def get_object(self):
         post_id = self.kwargs["pk"]
         try:
-            return Post.objects.get(pk=post_id)
+            return self.eager_load(Post.objects.all()).get(pk=post_id)
         except Post.DoesNotExist:
             raise Http404
 
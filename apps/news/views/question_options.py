@@ -6,32 +6,23 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.mixins import ExcludeFieldsMixin
 from apps.news.models import QuestionOption, Question
 from apps.news.serializers.question_options import QuestionOptionCreateSerializer, QuestionOptionModelSerializer
 from apps.text_services.pagination import StandardResultsSetPagination
 
 
-class QuestionOptionsCreateAPIView(CreateAPIView):
+class QuestionOptionsCreateAPIView(ExcludeFieldsMixin, CreateAPIView):
     serializer_class = QuestionOptionCreateSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    exclude_fields = ("created_at", "updated_at")
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
-
-class QuestionOptionsRetrieveAPIView(RetrieveAPIView):
+class QuestionOptionsRetrieveAPIView(ExcludeFieldsMixin, RetrieveAPIView):
     serializer_class = QuestionOptionModelSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
-
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
+    exclude_fields = ("created_at", "updated_at")
 
     def get_object(self):
         return get_object_or_404(QuestionOption, pk=self.kwargs["pk"])
@@ -77,15 +68,10 @@ class QuestionOptionsUpdateAPIView(UpdateAPIView):
         serializer.save()
         return Response(serializer.data)
 
-class QuestionOptionsListAPIView(ListAPIView):
+class QuestionOptionsListAPIView(ExcludeFieldsMixin, ListAPIView):
     serializer_class = QuestionOptionModelSerializer
     pagination_class = StandardResultsSetPagination
-
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
+    exclude_fields = ("created_at", "updated_at")
 
     def get_queryset(self):
         question = get_object_or_404(Question, pk=self.kwargs.get("pk"))
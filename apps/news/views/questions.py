@@ -5,31 +5,22 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.mixins import ExcludeFieldsMixin
 from apps.news.models import Question, Survey
 from apps.news.serializers.questions import QuestionCreateSerializer, QuestionModelSerializer
 from apps.text_services.pagination import StandardResultsSetPagination
 
 
-class QuestionCreateAPIView(CreateAPIView):
+class QuestionCreateAPIView(ExcludeFieldsMixin, CreateAPIView):
     serializer_class = QuestionCreateSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    exclude_fields = ("created_at", "updated_at")
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
-
-class QuestionListAPIView(ListAPIView):
+class QuestionListAPIView(ExcludeFieldsMixin, ListAPIView):
     pagination_class = StandardResultsSetPagination
     serializer_class = QuestionModelSerializer
-
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
+    exclude_fields = ("created_at", "updated_at")
 
     def get_queryset(self):
         survey_id = self.kwargs["pk"]
@@ -6,48 +6,36 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.mixins import CompiledListMixin, EagerLoadingMixin, ExcludeFieldsMixin
 from apps.news.models import Question, Submission
 from apps.news.serializers.submissions import SubmissionCreateSerializer, SubmissionModelSerializer
-from apps.text_services.pagination import StandardResultsSetPagination
+from apps.text_services.pagination import KeysetResultsSetPagination
 
 
-class SubmissionCreateAPIView(CreateAPIView):
+class SubmissionCreateAPIView(ExcludeFieldsMixin, CreateAPIView):
     serializer_class = SubmissionCreateSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    exclude_fields = ("created_at", "updated_at")
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
 
-
-class SubmissionListAPIView(ListAPIView):
-    pagination_class = StandardResultsSetPagination
+class SubmissionListAPIView(
+    ExcludeFieldsMixin, CompiledListMixin, EagerLoadingMixin, ListAPIView
+):
+    pagination_class = KeysetResultsSetPagination
     serializer_class = SubmissionModelSerializer
+    exclude_fields = ("created_at", "updated_at")
 
     def get_queryset(self):
         question = get_object_or_404(Question, pk=self.kwargs.get("pk"))
         user = self.request.user
         return Submission.objects.filter(question=question, user=user)
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
-
-class SubmissionDetailAPIView(RetrieveAPIView):
+class SubmissionDetailAPIView(ExcludeFieldsMixin, RetrieveAPIView):
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
     serializer_class = SubmissionModelSerializer
-
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
+    exclude_fields = ("created_at", "updated_at")
 
     def get_object(self):
         return get_object_or_404(Submission, pk=self.kwargs["pk"])
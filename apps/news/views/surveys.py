@@ -5,49 +5,54 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.common.mixins import (
+    ConditionalGetMixin,
+    EagerLoadingMixin,
+    ExcludeFieldsMixin,
+    SparseFieldsMixin,
+)
 from apps.news.models import Survey
 from apps.news.serializers.survey import SurveyCreateSerializer, SurveyModelSerializer
 from apps.text_services.pagination import StandardResultsSetPagination
 
 
-class SurveyCreateAPIView(CreateAPIView):
+class SurveyCreateAPIView(ExcludeFieldsMixin, CreateAPIView):
     serializer_class = SurveyCreateSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    exclude_fields = ("created_at", "updated_at")
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
-
-class SurveyListAPIView(ListAPIView):
+class SurveyListAPIView(
+    SparseFieldsMixin, ExcludeFieldsMixin, EagerLoadingMixin, ListAPIView
+):
     serializer_class = SurveyModelSerializer
     pagination_class = StandardResultsSetPagination
     queryset = Survey.objects.all()
+    exclude_fields = ("created_at", "updated_at", "description")
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at", "description")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
-
-class SurveyDetailAPIView(RetrieveAPIView):
+class SurveyDetailAPIView(ConditionalGetMixin, EagerLoadingMixin, RetrieveAPIView):
     serializer_class = SurveyModelSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    conditional_models = (
+        "courses.Course",
+        "courses.Category",
+        "user.User",
+        "user.UserProfile",
+    )
 
     def get_object(self):
         survey_id = self.kwargs["pk"]
         try:
-            return Survey.objects.get(pk=survey_id)
+            return self.eager_load(Survey.objects.all()).get(pk=survey_id)
         except Survey.DoesNotExist:
             raise ValidationError("Survey does not exist")
 
-class SurveyUpdateAPIView(GenericAPIView):
+class SurveyUpdateAPIView(ExcludeFieldsMixin, GenericAPIView):
     serializer_class = SurveyModelSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    exclude_fields = ("created_at", "updated_at")
 
     def get_object(self):
         survey_id = self.kwargs["pk"]
@@ -56,12 +61,6 @@ class SurveyUpdateAPIView(GenericAPIView):
         except Survey.DoesNotExist:
             raise ValidationError("Survey does not exist")
 
-    def get_serializer_context(self):
-        exclude_fields = ("created_at", "updated_at")
-        context = super().get_serializer_context()
-        context["exclude_fields"] = exclude_fields
-        return context
-
 
     def patch(self, request, *args, **kwargs):
         user = self.request.user
@@ -3,6 +3,7 @@ import datetime
 from django.db import models, transaction
 
 from apps.common.models import BaseModel
+from apps.common.services.reference_cache import ReferenceQuerySet
 from apps.payment.enum import OrderStatus, ProviderChoices, TransactionStatus
 
 
@@ -12,6 +13,8 @@ class Providers(BaseModel):
     )
     key = models.CharField(max_length=255, verbose_name="Key")
 
+    objects = ReferenceQuerySet.as_manager()
+
     def __str__(self):
         return f"Provider: {self.name}"
 
@@ -4,6 +4,7 @@ import urllib
 import requests
 from rest_framework.exceptions import NotFound
 
+from apps.common.services.reference_cache import reference_cache
 from apps.payment.enum import TransactionStatus
 from apps.payment.models import Transaction, Providers, UserCard
 from apps.payment.paylov.constants import (
@@ -112,7 +113,7 @@ class PaylovClient:
             otp_sent_phone = response_data["result"]["opSentPhone"]
             card_id = response_data["result"]["cid"]
 
-            paylov_provider = Providers.objects.filter(key="paylov").last()
+            paylov_provider = reference_cache.last(Providers, key="paylov")
             is_already_exists = UserCard.objects.filter(
                 user=user, card_token=card_id
             ).exists()
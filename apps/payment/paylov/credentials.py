@@ -1,8 +1,9 @@
+from apps.common.services.reference_cache import reference_cache
 from apps.payment.models import Providers, ProviderCredentials
 
 
 def get_credentials():
-    paylov_provider = Providers.objects.filter(key="paylov").last()
+    paylov_provider = reference_cache.last(Providers, key="paylov")
     paylov_creds = ProviderCredentials.objects.filter(provider=paylov_provider).all()
 
     paylov_api_key = getattr(
@@ -7,6 +7,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.common.services.reference_cache import reference_cache
 from apps.payment.enum import TransactionStatus
 from apps.payment.models import Providers, Transaction
 from apps.payment.paylov.auth import authentication as paylov_authentication
@@ -74,7 +75,7 @@ class PaylovAPIView(APIView):
         if error and code == STATUS_CODES["ORDER_NOT_FOUND"]:
             return dict(result=dict(status=code, statusText=STATUS_TEXT["ERROR"]))
 
-        provider = Providers.objects.filter(key="paylov").last()
+        provider = reference_cache.last(Providers, key="paylov")
         print(provider)
         transaction = Transaction.objects.get(
             id=self.params["account"]["order_id"],
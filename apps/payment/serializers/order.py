@@ -1,6 +1,7 @@
 from django.db import transaction
 from rest_framework import serializers
 
+from apps.common.services.reference_cache import reference_cache
 from apps.courses.enums import ProductTypeChoices
 from apps.courses.models import Course, Webinar
 from apps.payment.enum import TransactionStatus
@@ -36,7 +37,7 @@ class OrderCreateSerializer(serializers.Serializer):
                 amount=product.price,
             )
 
-            provider = Providers.objects.filter(key="paylov").last()
+            provider = reference_cache.last(Providers, key="paylov")
             transaction_obj = Transaction.objects.create(
                 order=order,
                 provider=provider,
@@ -1,6 +1,7 @@
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import IsAuthenticated
 
+from apps.common.renderers import ORJSONRenderer
 from apps.payment.models import Transaction, Order
 from apps.payment.serializers.transactions import TransactionModelSerializer
 
@@ -8,6 +9,7 @@ from apps.payment.serializers.transactions import TransactionModelSerializer
 class TransactionListAPIView(ListAPIView):
     serializer_class = TransactionModelSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer]
 
     def get_queryset(self):
         user_orders = Order.objects.filter(user=self.request.user)
@@ -0,0 +1,184 @@
+import gc
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from apps.common.services.benchmark import run_benchmark
+from apps.text_services import cyrillic_latin_translator
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+CORPUS_PATH = BENCHMARKS_DIR / "corpus.json"
+SNAPSHOT_PATH = BENCHMARKS_DIR / "snapshot.json"
+
+# script of the corpus each function reads
+FUNCTION_SOURCES = {
+    "to_cyrillic": cyrillic_latin_translator.LATIN,
+    "to_latin": cyrillic_latin_translator.CYRILLIC,
+}
+DICTIONARY_LINE_WORDS = 20
+
+
+def load_corpus():
+    """`{script: {"queries": [...], "titles": [...], "descriptions": [...]}}`"""
+    with open(CORPUS_PATH, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def get_dictionary_lines():
+    """Every exception and soft sign word in lower, title and upper case"""
+    words = [
+        word.replace("(", "").replace(")", "")
+        for word in (
+            *cyrillic_latin_translator.SOFT_SIGN_WORDS,
+            *cyrillic_latin_translator.TS_WORDS,
+            *cyrillic_latin_translator.E_WORDS,
+        )
+    ]
+    lines = [
+        " ".join(words[start : start + DICTIONARY_LINE_WORDS])
+        for start in range(0, len(words), DICTIONARY_LINE_WORDS)
+    ]
+    return [variant for line in lines for variant in (line, line.title(), line.upper())]
+
+
+def get_snapshot_inputs(corpus, to_cyrillic=None):
+    """Corpus texts of both scripts plus the dictionary words in each script"""
+    to_cyrillic = to_cyrillic or cyrillic_latin_translator.to_cyrillic
+    dictionary_lines = get_dictionary_lines()
+    latin = [text for texts in corpus["latin"].values() for text in texts]
+    cyrillic = [text for texts in corpus["cyrillic"].values() for text in texts]
+    return {
+        "to_cyrillic": [*latin, *dictionary_lines],
+        "to_latin": [*cyrillic, *map(to_cyrillic, dictionary_lines)],
+    }
+
+
+def build_snapshot(corpus, functions=None):
+    """Freeze the output of `functions` (defaults to the current engine)"""
+    functions = functions or {
+        name: getattr(cyrillic_latin_translator, name) for name in FUNCTION_SOURCES
+    }
+    inputs = get_snapshot_inputs(corpus, functions["to_cyrillic"])
+    return {
+        name: [[text, functions[name](text)] for text in inputs[name]]
+        for name in FUNCTION_SOURCES
+    }
+
+
+def load_snapshot():
+    with open(SNAPSHOT_PATH, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def write_snapshot(snapshot):
+    with open(SNAPSHOT_PATH, "w", encoding="utf-8") as file:
+        json.dump(snapshot, file, ensure_ascii=False, indent=1)
+        file.write("\n")
+
+
+def check_snapshot(snapshot):
+    """Return `(function name, input, expected, actual)` of every mismatch"""
+    mismatches = []
+    for name, pairs in snapshot.items():
+        function = getattr(cyrillic_latin_translator, name)
+        for text, expected in pairs:
+            actual = function(text)
+            if actual != expected:
+                mismatches.append((name, text, expected, actual))
+    return mismatches
+
+
+def run_benchmarks(corpus, repeat=5):
+    results = []
+    for name, script in FUNCTION_SOURCES.items():
+        function = getattr(cyrillic_latin_translator, name)
+        for kind, texts in corpus[script].items():
+            results.append(
+                run_benchmark(f"{name}[{kind}]", function, texts, repeat=repeat)
+            )
+    return results
+
+
+@dataclass(frozen=True)
+class ForkResult:
+    name: str
+    master_seconds: float
+    first_pass_seconds: float
+    private_growth: int
+
+    def format(self):
+        return (
+            f"{self.name:<32} master {self.master_seconds * 1e3:>7.1f}ms "
+            f"first pass {self.first_pass_seconds * 1e3:>7.1f}ms "
+            f"worker private +{self.private_growth / 1024:>9.1f}KiB"
+        )
+
+
+def get_private_memory():
+    """Bytes of the process mapped in no other process (Linux only)"""
+    with open("/proc/self/smaps_rollup") as file:
+        return 1024 * sum(
+            int(line.split()[1])
+            for line in file
+            if line.startswith(("Private_Clean:", "Private_Dirty:"))
+        )
+
+
+def run_worker(texts):
+    """First pass latency and private memory growth of a freshly forked worker"""
+    private_memory = get_private_memory()
+    started = time.perf_counter()
+    for text in texts:
+        cyrillic_latin_translator.to_cyrillic(text)
+    first_pass_seconds = time.perf_counter() - started
+    # a full collection, as every long running worker eventually does
+    gc.collect()
+    return first_pass_seconds, get_private_memory() - private_memory
+
+
+def fork_workers(texts, workers):
+    """Average `run_worker` result of `workers` processes forked from this one"""
+    readers = []
+    for _ in range(workers):
+        reader, writer = os.pipe()
+        if os.fork() == 0:
+            os.close(reader)
+            os.write(writer, json.dumps(run_worker(texts)).encode())
+            os._exit(0)
+        os.close(writer)
+        readers.append(reader)
+
+    results = []
+    for reader in readers:
+        with os.fdopen(reader) as file:
+            results.append(json.load(file))
+    for _ in readers:
+        os.wait()
+    first_pass_seconds, private_growth = map(sum, zip(*results, strict=True))
+    return first_pass_seconds / workers, private_growth // workers
+
+
+def run_fork_benchmarks(corpus, workers=4):
+    """
+    Workers forked from a cold master against workers forked after
+    `preload_shared_state`. Run it before anything else transliterates in this
+    process, the cold run needs an untouched master.
+    """
+    from core.preload import preload_shared_state
+
+    texts = [
+        *(text for texts in corpus["latin"].values() for text in texts),
+        *get_dictionary_lines(),
+    ]
+    results = [ForkResult("cold master", 0.0, *fork_workers(texts, workers))]
+
+    started = time.perf_counter()
+    preload_shared_state()
+    master_seconds = time.perf_counter() - started
+    results.append(
+        ForkResult("preloaded master", master_seconds, *fork_workers(texts, workers))
+    )
+    gc.unfreeze()
+    return results
@@ -1,4 +1,5 @@
 import re
+from functools import cache, lru_cache, partial
 
 LATIN_TO_CYRILLIC = {
     "a": "а",
@@ -1283,6 +1284,199 @@ CYRILLIC_VOWELS = (
 )
 
 
+# These compounds must be converted before other letters
+COMPOUNDS_FIRST = {
+    "ch": "ч",
+    "Ch": "Ч",
+    "CH": "Ч",
+    # this line must come before 's' because it has an 'h'
+    "sh": "ш",
+    "Sh": "Ш",
+    "SH": "Ш",
+    # This line must come before 'yo' because of it's apostrophe
+    "yo‘": "йў",
+    "Yo‘": "Йў",
+    "YO‘": "ЙЎ",
+}
+COMPOUNDS_SECOND = {
+    "yo": "ё",
+    "Yo": "Ё",
+    "YO": "Ё",
+    # 'ts': 'ц', 'Ts': 'Ц', 'TS': 'Ц',  # No need for this, see TS_WORDS
+    "yu": "ю",
+    "Yu": "Ю",
+    "YU": "Ю",
+    "ya": "я",
+    "Ya": "Я",
+    "YA": "Я",
+    "ye": "е",
+    "Ye": "Е",
+    "YE": "Е",
+    # different kinds of apostrophes
+    "o‘": "ў",
+    "O‘": "Ў",
+    "oʻ": "ў",
+    "Oʻ": "Ў",
+    "g‘": "ғ",
+    "G‘": "Ғ",
+    "gʻ": "ғ",
+    "Gʻ": "Ғ",
+}
+LATIN_BEGINNING_RULES = {
+    "ye": "е",
+    "Ye": "Е",
+    "YE": "Е",
+    "e": "э",
+    "E": "Э",
+}
+LATIN_AFTER_VOWEL_RULES = {
+    "ye": "е",
+    "Ye": "Е",
+    "YE": "Е",
+    "e": "э",
+    "E": "Э",
+}
+EXCEPTION_WORDS_RULES = {
+    "s": "ц",
+    "S": "Ц",
+    "ts": "ц",
+    "Ts": "Ц",
+    "TS": "Ц",  # but not tS
+    "e": "э",
+    "E": "э",
+    "sh": "сҳ",
+    "Sh": "Сҳ",
+    "SH": "СҲ",
+    "yo": "йо",
+    "Yo": "Йо",
+    "YO": "ЙО",
+    "yu": "йу",
+    "Yu": "Йу",
+    "YU": "ЙУ",
+    "ya": "йа",
+    "Ya": "Йа",
+    "YA": "ЙА",
+}
+
+# The engine below is built once at import. Soft sign and exception words are
+# prefiltered with a trie instead of running one regex per dictionary word over
+# the whole text: replacing a word only ever turns latin letters into cyrillic
+# ones, so a word that does not occur in the original text can never start
+# matching later on. Every word the trie finds still gets its own `re.sub`, in
+# the same order as before. The substitutions are not fused into one pass
+# because `_replace_exception_words` slices the match with offsets of the whole
+# text, so each word's output depends on where earlier substitutions left it.
+SOFT_SIGN_PHASE = 0
+EXCEPTION_WORDS_PHASE = 1
+SOFT_SIGN_WORD_KEYS = tuple(SOFT_SIGN_WORDS)
+EXCEPTION_WORDS = (*TS_WORDS, *E_WORDS)
+EXCEPTION_WORD_MAX_LENGTH = max(
+    len(word.replace("(", "").replace(")", "")) for word in EXCEPTION_WORDS
+)
+_WORD_START_RE = re.compile(r"\b(?=\w)")
+
+
+def _build_words_trie():
+    trie = {}
+    phases = (
+        (SOFT_SIGN_PHASE, SOFT_SIGN_WORD_KEYS),
+        (EXCEPTION_WORDS_PHASE, EXCEPTION_WORDS),
+    )
+    for phase, words in phases:
+        for index, word in enumerate(words):
+            node = trie
+            for char in word.replace("(", "").replace(")", ""):
+                node = node.setdefault(char, {})
+            node.setdefault(None, []).append((phase, index))
+    return trie
+
+
+WORDS_TRIE = _build_words_trie()
+
+
+def find_exception_words(text):
+    """Return indexes of the soft sign and exception words found in `text`.
+
+    Only occurrences starting at a word boundary count, as in the `\\b` rules of
+    `to_cyrillic`. The indexes are sorted in dictionary order.
+    """
+    found = (set(), set())
+    length = len(text)
+    for match in _WORD_START_RE.finditer(text):
+        node = WORDS_TRIE
+        position = match.start()
+        while position < length:
+            node = node.get(text[position])
+            if node is None:
+                break
+            for phase, index in node.get(None, ()):
+                found[phase].add(index)
+            position += 1
+    return sorted(found[SOFT_SIGN_PHASE]), sorted(found[EXCEPTION_WORDS_PHASE])
+
+
+@cache
+def _word_pattern(word):
+    return re.compile(rf"\b({word})", flags=re.U)
+
+
+def preload():
+    """Compile every word pattern up front.
+
+    Call it in a master process before workers fork (gunicorn `--preload`,
+    celery `worker_init`) so children share the compiled patterns copy-on-write
+    instead of each compiling them on first use.
+    """
+    for word in (*SOFT_SIGN_WORD_KEYS, *EXCEPTION_WORDS):
+        _word_pattern(word)
+
+
+def _replace_soft_sign_words(m):
+    word = m.group(1)
+    if word.isupper():
+        result = SOFT_SIGN_WORDS[word.lower()].upper()
+    elif word[0].isupper():
+        result = SOFT_SIGN_WORDS[word.lower()]
+        result = result[0].upper() + result[1:]
+    else:
+        result = SOFT_SIGN_WORDS[word.lower()]
+    return result
+
+
+def _replace_exception_words(m):
+    """Replace ц (or э) only leaving other characters unchanged"""
+    return f"{m.group(1)[: m.start(2)]}{EXCEPTION_WORDS_RULES[m.group(2)]}{m.group(1)[m.end(2) :]}"
+
+
+# Compounds, beginning of a word and after a vowel rules in a single scan.
+# Converting an o/g compound swallows its apostrophe, so the apostrophe no
+# longer separates words for the beginning rule.
+_APOSTROPHE_LETTERS = "".join(
+    sorted({key[-2] for key in COMPOUNDS_FIRST | COMPOUNDS_SECOND if key[-1] == "‘"})
+)
+_COMPOUNDS = COMPOUNDS_FIRST | COMPOUNDS_SECOND
+_LATIN_CONTEXT_RE = re.compile(
+    r"({})|(?<!\w)(?<![{}]‘)({})|({})({})".format(
+        "|".join(map(re.escape, _COMPOUNDS)),
+        _APOSTROPHE_LETTERS,
+        "|".join(LATIN_BEGINNING_RULES),
+        "|".join(LATIN_VOWELS),
+        "|".join(LATIN_AFTER_VOWEL_RULES),
+    ),
+    flags=re.U,
+)
+_LATIN_TO_CYRILLIC_TABLE = str.maketrans(LATIN_TO_CYRILLIC)
+
+
+def _replace_latin_context(m):
+    compound, beginning, vowel, after_vowel = m.groups()
+    if compound is not None:
+        return _COMPOUNDS[compound]
+    if beginning is not None:
+        return LATIN_BEGINNING_RULES[beginning]
+    return f"{vowel}{LATIN_AFTER_VOWEL_RULES[after_vowel]}"
+
+
 def to_cyrillic(text):
     """Transliterate latin text to cyrillic  using the following rules:
     1. ye = е in the beginning of a word or after a vowel
@@ -1290,143 +1484,46 @@ def to_cyrillic(text):
     3. ц exception words
     4. э exception words
     """
-    # These compounds must be converted before other letters
-    compounds_first = {
-        "ch": "ч",
-        "Ch": "Ч",
-        "CH": "Ч",
-        # this line must come before 's' because it has an 'h'
-        "sh": "ш",
-        "Sh": "Ш",
-        "SH": "Ш",
-        # This line must come before 'yo' because of it's apostrophe
-        "yo‘": "йў",
-        "Yo‘": "Йў",
-        "YO‘": "ЙЎ",
-    }
-    compounds_second = {
-        "yo": "ё",
-        "Yo": "Ё",
-        "YO": "Ё",
-        # 'ts': 'ц', 'Ts': 'Ц', 'TS': 'Ц',  # No need for this, see TS_WORDS
-        "yu": "ю",
-        "Yu": "Ю",
-        "YU": "Ю",
-        "ya": "я",
-        "Ya": "Я",
-        "YA": "Я",
-        "ye": "е",
-        "Ye": "Е",
-        "YE": "Е",
-        # different kinds of apostrophes
-        "o‘": "ў",
-        "O‘": "Ў",
-        "oʻ": "ў",
-        "Oʻ": "Ў",
-        "g‘": "ғ",
-        "G‘": "Ғ",
-        "gʻ": "ғ",
-        "Gʻ": "Ғ",
-    }
-    beginning_rules = {
-        "ye": "е",
-        "Ye": "Е",
-        "YE": "Е",
-        "e": "э",
-        "E": "Э",
-    }
-    after_vowel_rules = {
-        "ye": "е",
-        "Ye": "Е",
-        "YE": "Е",
-        "e": "э",
-        "E": "Э",
-    }
-    exception_words_rules = {
-        "s": "ц",
-        "S": "Ц",
-        "ts": "ц",
-        "Ts": "Ц",
-        "TS": "Ц",  # but not tS
-        "e": "э",
-        "E": "э",
-        "sh": "сҳ",
-        "Sh": "Сҳ",
-        "SH": "СҲ",
-        "yo": "йо",
-        "Yo": "Йо",
-        "YO": "ЙО",
-        "yu": "йу",
-        "Yu": "Йу",
-        "YU": "ЙУ",
-        "ya": "йа",
-        "Ya": "Йа",
-        "YA": "ЙА",
-    }
-
     # standardize some characters
     # the first one is the windows string, the second one is the mac string
     text = text.replace("ʻ", "‘")
 
-    def replace_soft_sign_words(m):
-        word = m.group(1)
-        if word.isupper():
-            result = SOFT_SIGN_WORDS[word.lower()].upper()
-        elif word[0].isupper():
-            result = SOFT_SIGN_WORDS[word.lower()]
-            result = result[0].upper() + result[1:]
-        else:
-            result = SOFT_SIGN_WORDS[word.lower()]
-        return result
-
-    for word in SOFT_SIGN_WORDS:
-        text = re.sub(rf"\b({word})", replace_soft_sign_words, text, flags=re.U)
-
-    def replace_exception_words(m):
-        """Replace ц (or э) only leaving other characters unchanged"""
-        return f"{m.group(1)[: m.start(2)]}{exception_words_rules[m.group(2)]}{m.group(1)[m.end(2) :]}"
-
-    # loop because of python's limit of 100 named groups
-    for word in list(TS_WORDS.keys()) + list(E_WORDS.keys()):
-        text = re.sub(rf"\b({word})", replace_exception_words, text, flags=re.U)
-
-    # compounds
-    text = re.sub(
-        rf"({'|'.join(compounds_first.keys())})",
-        lambda x: compounds_first[x.group(1)],
-        text,
-        flags=re.U,
-    )
+    soft_sign_words, exception_words = find_exception_words(text)
+    for index in soft_sign_words:
+        word = SOFT_SIGN_WORD_KEYS[index]
+        text = _word_pattern(word).sub(_replace_soft_sign_words, text)
 
-    text = re.sub(
-        rf"({'|'.join(compounds_second.keys())})",
-        lambda x: compounds_second[x.group(1)],
-        text,
-        flags=re.U,
-    )
+    for index in exception_words:
+        word = EXCEPTION_WORDS[index]
+        text = _word_pattern(word).sub(_replace_exception_words, text)
 
-    text = re.sub(
-        rf"\b({'|'.join(beginning_rules.keys())})",
-        lambda x: beginning_rules[x.group(1)],
-        text,
-        flags=re.U,
-    )
+    text = _LATIN_CONTEXT_RE.sub(_replace_latin_context, text)
 
-    text = re.sub(
-        r"({})({})".format("|".join(LATIN_VOWELS), "|".join(after_vowel_rules.keys())),
-        lambda x: f"{x.group(1)}{after_vowel_rules[x.group(2)]}",
-        text,
-        flags=re.U,
-    )
+    return text.translate(_LATIN_TO_CYRILLIC_TABLE)
 
-    text = re.sub(
-        rf"({'|'.join(LATIN_TO_CYRILLIC.keys())})",
-        lambda x: LATIN_TO_CYRILLIC[x.group(1)],
-        text,
-        flags=re.U,
-    )
 
-    return text
+CYRILLIC_BEGINNING_RULES = {"ц": "s", "Ц": "S", "е": "ye", "Е": "Ye"}
+CYRILLIC_AFTER_VOWEL_RULES = {"ц": "ts", "Ц": "Ts", "е": "ye", "Е": "Ye"}
+
+# Months, beginning of a word and after a vowel rules in a single scan
+_CYRILLIC_CONTEXT_RE = re.compile(
+    r"(?i:(сент|окт)([яЯ])(бр))|\b({})|({})({})".format(
+        "|".join(CYRILLIC_BEGINNING_RULES),
+        "|".join(CYRILLIC_VOWELS),
+        "|".join(CYRILLIC_AFTER_VOWEL_RULES),
+    ),
+    flags=re.U,
+)
+_CYRILLIC_TO_LATIN_TABLE = str.maketrans(CYRILLIC_TO_LATIN)
+
+
+def _replace_cyrillic_context(m):
+    month_start, month_letter, month_end, beginning, vowel, after_vowel = m.groups()
+    if month_letter is not None:
+        return f"{month_start}{'a' if month_letter == 'я' else 'A'}{month_end}"
+    if beginning is not None:
+        return CYRILLIC_BEGINNING_RULES[beginning]
+    return f"{vowel}{CYRILLIC_AFTER_VOWEL_RULES[after_vowel]}"
 
 
 def to_latin(text):
@@ -1442,52 +1539,144 @@ def to_latin(text):
     е = e in the middle of a word after a consonant (DEFAULT).
     3. Сентябр = Sentabr, Октябр = Oktabr
     """
-    beginning_rules = {"ц": "s", "Ц": "S", "е": "ye", "Е": "Ye"}
-    after_vowel_rules = {"ц": "ts", "Ц": "Ts", "е": "ye", "Е": "Ye"}
-
-    text = re.sub(
-        r"(сент|окт)([яЯ])(бр)",
-        lambda x: "{}{}{}".format(
-            x.group(1), "a" if x.group(2) == "я" else "A", x.group(3)
-        ),
-        text,
-        flags=re.IGNORECASE | re.U,
-    )
+    text = _CYRILLIC_CONTEXT_RE.sub(_replace_cyrillic_context, text)
 
-    text = re.sub(
-        rf"\b({'|'.join(beginning_rules.keys())})",
-        lambda x: beginning_rules[x.group(1)],
-        text,
-        flags=re.U,
-    )
+    return text.translate(_CYRILLIC_TO_LATIN_TABLE)
 
-    text = re.sub(
-        r"({})({})".format(
-            "|".join(CYRILLIC_VOWELS), "|".join(after_vowel_rules.keys())
-        ),
-        lambda x: f"{x.group(1)}{after_vowel_rules[x.group(2)]}",
-        text,
-        flags=re.U,
-    )
 
-    text = re.sub(
-        rf"({'|'.join(CYRILLIC_TO_LATIN.keys())})",
-        lambda x: CYRILLIC_TO_LATIN[x.group(1)],
-        text,
-        flags=re.U,
-    )
+CYRILLIC = "cyrillic"
+LATIN = "latin"
+MIXED = "mixed"
+NEUTRAL = "neutral"
 
-    return text
+# Characters either transliteration can rewrite, anything else is left untouched
+LATIN_SCRIPT_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZʻ"
+) | frozenset(LATIN_TO_CYRILLIC)
+CYRILLIC_SCRIPT_CHARS = frozenset(map(chr, range(0x0400, 0x0530))) | frozenset(
+    CYRILLIC_TO_LATIN
+)
 
 
-CYRILLIC = "cyrillic"
-LATIN = "latin"
+def detect_script(text):
+    """Classify `text` as LATIN, CYRILLIC, MIXED or NEUTRAL (digits, emails...)"""
+    chars = set(text)
+    has_latin = not LATIN_SCRIPT_CHARS.isdisjoint(chars)
+    has_cyrillic = not CYRILLIC_SCRIPT_CHARS.isdisjoint(chars)
+    if has_latin and has_cyrillic:
+        return MIXED
+    if has_latin:
+        return LATIN
+    if has_cyrillic:
+        return CYRILLIC
+    return NEUTRAL
+
+
+def needs_transliteration(text, to_variant):
+    """Whether transliterating `text` to `to_variant` can change it"""
+    script = detect_script(text)
+    if script == NEUTRAL:
+        return False
+    if to_variant == CYRILLIC:
+        return script != CYRILLIC
+    if to_variant == LATIN:
+        return script != LATIN
+    return False
 
 
 def transliterate(text, to_variant):
+    if not needs_transliteration(text, to_variant):
+        return text
     if to_variant == CYRILLIC:
         text = to_cyrillic(text)
     elif to_variant == LATIN:
         text = to_latin(text)
 
     return text
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _safe_split_index(text):
+    """Index right after the last whitespace of `text`, 0 if there is none.
+
+    Every rule looks at one word only (`\\b` checks and compounds never span
+    whitespace), so text cut after whitespace transliterates the same in pieces.
+    """
+    for index in range(len(text) - 1, -1, -1):
+        if text[index].isspace():
+            return index + 1
+    return 0
+
+
+def transliterate_stream(chunks, to_variant, chunk_size=STREAM_CHUNK_SIZE):
+    """Transliterate a file-like object or an iterable of strings piece by piece.
+
+    Yields transliterated chunks whose concatenation equals `transliterate` of the
+    whole text. A word cut by a chunk edge is held back until it is complete, so
+    memory stays bounded by the chunk size plus the longest word.
+    """
+    if hasattr(chunks, "read"):
+        chunks = iter(partial(chunks.read, chunk_size), "")
+    elif isinstance(chunks, str):
+        chunks = (chunks,)
+
+    # `_replace_exception_words` slices the word with offsets of the whole text,
+    # so words within the first EXCEPTION_WORD_MAX_LENGTH characters convert
+    # differently. The first piece is made long enough to cover that range and
+    # later pieces are padded past it to behave as they would in the whole text.
+    padding = " " * EXCEPTION_WORD_MAX_LENGTH
+    first_piece_length = 4 * EXCEPTION_WORD_MAX_LENGTH
+
+    def convert(text, first):
+        if first or to_variant != CYRILLIC:
+            return transliterate(text, to_variant)
+        return transliterate(padding + text, to_variant)[len(padding) :]
+
+    first = True
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        split_index = _safe_split_index(pending)
+        if not split_index or (first and split_index < first_piece_length):
+            continue
+        ready, pending = pending[:split_index], pending[split_index:]
+        yield convert(ready, first)
+        first = False
+
+    if pending:
+        yield convert(pending, first)
+
+
+TRANSLITERATE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TRANSLITERATE_CACHE_SIZE)
+def transliterate_cached(text, to_variant):
+    """Memoized `transliterate`, repeated search queries and titles are served
+    from a bounded LRU cache.
+    """
+    return transliterate(text, to_variant)
+
+
+def transliterate_many(texts, to_variant):
+    """Transliterate every string of `texts` to `to_variant`.
+
+    Duplicates are converted once per batch and repeats across batches come from
+    the `transliterate_cached` cache. Results keep the order of `texts`.
+    """
+    texts = list(texts)
+    converted = {
+        text: transliterate_cached(text, to_variant) for text in dict.fromkeys(texts)
+    }
+    return [converted[text] for text in texts]
+
+
+def transliterate_cache_info():
+    """Return hits, misses, maxsize and currsize of the transliteration cache"""
+    return transliterate_cached.cache_info()
+
+
+def transliterate_cache_clear():
+    transliterate_cached.cache_clear()
@@ -2,11 +2,15 @@ import operator
 from functools import reduce
 
 from django.conf import settings
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Q
 from rest_framework.filters import SearchFilter
 
+from apps.common.models import SearchableModel
+from apps.common.services import search_cache
 from apps.text_services import cyrillic_latin_translator
 from apps.text_services.q_processors import QLatinCyrillicProcessor
+from apps.text_services.search_columns import normalize_search_text
 
 
 def distinct(queryset, base):
@@ -29,10 +33,52 @@ class MultiSymbolSearchFilter(SearchFilter):
             for orm_lookup in orm_lookups
         ]
 
+    @staticmethod
+    def process_column_terms(
+        processor: QLatinCyrillicProcessor, terms: list[str]
+    ) -> list[str]:
+        joined_terms = normalize_search_text(" ".join(terms))
+        return list(
+            dict.fromkeys(
+                normalize_search_text(processor.process(joined_terms)).split()
+            )
+        )
+
+    @staticmethod
+    def combine_column_terms(terms: list[str], column: str) -> Q:
+        return reduce(
+            operator.and_, [Q(**{f"{column}__contains": term}) for term in terms]
+        )
+
+    def filter_search_columns(self, queryset, search_terms):
+        """
+        Search `SearchableModel` querysets on their shadow columns, one trigram
+        indexed column per script and no joins, so no distinct is needed.
+        Queries without letters read the same in both columns and only search one.
+        Views declaring `search_fields` search those lookups instead.
+        """
+        latin_processor = QLatinCyrillicProcessor(cyrillic_latin_translator.LATIN)
+        cyrillic_processor = QLatinCyrillicProcessor(cyrillic_latin_translator.CYRILLIC)
+
+        latin_terms = self.process_column_terms(latin_processor, search_terms)
+        cyrillic_terms = self.process_column_terms(cyrillic_processor, search_terms)
+
+        condition = self.combine_column_terms(latin_terms, "search_latin")
+        if cyrillic_terms != latin_terms:
+            condition |= self.combine_column_terms(cyrillic_terms, "search_cyrillic")
+        return queryset.filter(condition)
+
     def filter_queryset(self, request, queryset, view):
         search_fields = self.get_search_fields(view, request)
         search_terms = self.get_search_terms(request)
 
+        if (
+            search_terms
+            and not search_fields
+            and issubclass(queryset.model, SearchableModel)
+        ):
+            return self.filter_search_columns(queryset, search_terms)
+
         if not search_fields or not search_terms:
             return queryset
 
@@ -40,7 +86,8 @@ class MultiSymbolSearchFilter(SearchFilter):
         cyrillic_processor = QLatinCyrillicProcessor(cyrillic_latin_translator.CYRILLIC)
 
         orm_lookups = [
-            self.construct_search(str(search_field)) for search_field in search_fields
+            self.construct_search(str(search_field), queryset)
+            for search_field in search_fields
         ]
         base = queryset
         latin_conditions = self.process_terms(
@@ -50,13 +97,125 @@ class MultiSymbolSearchFilter(SearchFilter):
             cyrillic_processor, search_terms, orm_lookups
         )
 
-        combined_latin_conditions = reduce(operator.and_, latin_conditions)
-        combined_cyrillic_conditions = reduce(operator.and_, cyrillic_conditions)
+        condition = reduce(operator.and_, latin_conditions)
+        if cyrillic_conditions != latin_conditions:
+            condition = Q(condition) | Q(reduce(operator.and_, cyrillic_conditions))
 
-        queryset = queryset.filter(
-            Q(combined_latin_conditions) | Q(combined_cyrillic_conditions)
-        )
+        queryset = queryset.filter(condition)
         if self.must_call_distinct(queryset, search_fields):
             queryset = distinct(queryset, base)
 
         return queryset
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Ranked postgres full text search over the stored `search_vector` of
+    `FullTextSearchModel` querysets. The query is matched as prefixes in both
+    scripts and results are ordered by rank.
+    """
+
+    search_vector_field = "search_vector"
+    rank_annotation = "search_rank"
+
+    @staticmethod
+    def quote_term(term: str) -> str:
+        """
+        Quoted tsquery lexeme. Inside quotes a backslash escapes the next
+        character, so backslashes are doubled along with the quotes and
+        operators like `&`, `|` or `:` are read as text.
+        """
+        return "'{}'".format(term.replace("\\", "\\\\").replace("'", "''"))
+
+    @classmethod
+    def build_prefix_query(cls, text: str) -> str:
+        return " & ".join(f"{cls.quote_term(term)}:*" for term in text.split())
+
+    def get_search_query(self, search_terms, config):
+        joined_terms = normalize_search_text(" ".join(search_terms))
+        queries = {
+            self.build_prefix_query(
+                normalize_search_text(
+                    QLatinCyrillicProcessor(variant).process(joined_terms)
+                )
+            )
+            for variant in (
+                cyrillic_latin_translator.LATIN,
+                cyrillic_latin_translator.CYRILLIC,
+            )
+        }
+        return reduce(
+            operator.or_,
+            [
+                SearchQuery(query, config=config, search_type="raw")
+                for query in sorted(queries)
+            ],
+        )
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        query = self.get_search_query(search_terms, queryset.model.search_vector_config)
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return (
+            queryset.filter(**{self.search_vector_field: query})
+            .annotate(
+                **{self.rank_annotation: SearchRank(F(self.search_vector_field), query)}
+            )
+            .order_by(f"-{self.rank_annotation}", *ordering)
+        )
+
+
+class SearchResultCacheMixin:
+    """
+    Cache the primary keys a search filter matches for models listed in
+    `SEARCH_CACHE_MODELS`. Entries are keyed by the query normalized in both
+    scripts and the SQL of the incoming queryset, so filters applied by earlier
+    backends are part of the key, and expire when the model version is bumped.
+    """
+
+    def get_search_variants(self, search_terms):
+        joined_terms = normalize_search_text(" ".join(search_terms))
+        return [
+            normalize_search_text(
+                QLatinCyrillicProcessor(variant).process(joined_terms)
+            )
+            for variant in (
+                cyrillic_latin_translator.LATIN,
+                cyrillic_latin_translator.CYRILLIC,
+            )
+        ]
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms or not search_cache.is_cached_model(queryset.model):
+            return super().filter_queryset(request, queryset, view)
+
+        key = search_cache.build_key(
+            queryset,
+            [
+                type(self).__name__,
+                *(self.get_search_fields(view, request) or ()),
+                *self.get_search_variants(search_terms),
+            ],
+        )
+        if key is None:
+            return super().filter_queryset(request, queryset, view)
+
+        pks = search_cache.get_pks(key)
+        if pks is not None:
+            return search_cache.filter_pks(queryset, pks)
+
+        filtered_queryset = super().filter_queryset(request, queryset, view)
+        search_cache.set_pks(key, filtered_queryset)
+        return filtered_queryset
+
+
+class CachedMultiSymbolSearchFilter(SearchResultCacheMixin, MultiSymbolSearchFilter):
+    pass
+
+
+class CachedFullTextSearchFilter(SearchResultCacheMixin, FullTextSearchFilter):
+    pass
@@ -1,7 +1,194 @@
-from rest_framework.pagination import PageNumberPagination
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from urllib import parse
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.common.services.approximate_count import ApproximateCountPaginator
 
 
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class ApproximateCountPagination(StandardResultsSetPagination):
+    """
+    Page number pagination reporting an estimated `count` for unfiltered lists of
+    large tables, flagged with `approximate`.
+    """
+
+    django_paginator_class = ApproximateCountPaginator
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.page.paginator.count),
+                    ("approximate", self.page.paginator.approximate),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["approximate"] = {
+            "type": "boolean",
+            "example": False,
+        }
+        return response_schema
+
+
+class KeysetResultsSetPagination(BasePagination):
+    """
+    Keyset pagination on `(created_at, id)`, newest first, without COUNT or OFFSET.
+
+    Views opt in by setting it as `pagination_class`. Requests without the
+    `cursor` query parameter keep the `fallback_pagination_class` behaviour,
+    `?cursor=` starts keyset pagination from the first page.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    ordering = ("-created_at", "-id")
+    fallback_pagination_class = StandardResultsSetPagination
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self):
+        self.fallback = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            self.fallback = self.fallback_pagination_class()
+            return self.fallback.paginate_queryset(queryset, request, view=view)
+
+        self.fallback = None
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.get_ordering(reverse))
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position, reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, reverse):
+        if not reverse:
+            return self.ordering
+        return tuple(
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        )
+
+    def get_key_fields(self):
+        return tuple(field.lstrip("-") for field in self.ordering)
+
+    def get_position_filter(self, position, reverse):
+        """`(created_at, id) < position`, bounded on `created_at` for the index"""
+        key, tie_breaker = self.get_key_fields()
+        key_value, tie_breaker_value = position
+        descending = self.ordering[0].startswith("-") != reverse
+        lookup = "lt" if descending else "gt"
+        bound = "lte" if descending else "gte"
+        return Q(**{f"{key}__{bound}": key_value}) & (
+            Q(**{f"{key}__{lookup}": key_value})
+            | Q(**{key: key_value, f"{tie_breaker}__{lookup}": tie_breaker_value})
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None, False
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            key_value, tie_breaker_value = tokens["p"][0].rsplit("|", 1)
+            position = (parse_datetime(key_value), int(tie_breaker_value))
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise ValidationError(
+                {self.cursor_query_param: self.invalid_cursor_message}
+            ) from None
+        if position[0] is None:
+            raise ValidationError(
+                {self.cursor_query_param: self.invalid_cursor_message}
+            )
+        return position, reverse
+
+    def encode_cursor(self, instance, reverse):
+        key, tie_breaker = self.get_key_fields()
+        tokens = {
+            "p": f"{getattr(instance, key).isoformat()}|{getattr(instance, tie_breaker)}"
+        }
+        if reverse:
+            tokens["r"] = "1"
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        if self.fallback is not None:
+            return self.fallback.get_paginated_response(data)
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *self.fallback_pagination_class().get_schema_operation_parameters(view),
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value, empty for the first page.",
+                "schema": {"type": "string"},
+            },
+        ]
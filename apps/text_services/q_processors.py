@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from . import cyrillic_latin_translator
 
@@ -13,6 +14,9 @@ class QProcessorBase(ABC):
     def process(self, text: str) -> str:
         raise NotImplementedError
 
+    def process_many(self, texts: Iterable[str]) -> list[str]:
+        return [self.process(text) for text in texts]
+
 
 class QLatinCyrillicProcessor(QProcessorBase):
     """
@@ -23,4 +27,9 @@ class QLatinCyrillicProcessor(QProcessorBase):
         self.to = to
 
     def process(self, text: str) -> str:
-        return cyrillic_latin_translator.transliterate(text, self.to)
+        if not cyrillic_latin_translator.needs_transliteration(text, self.to):
+            return text
+        return cyrillic_latin_translator.transliterate_cached(text, self.to)
+
+    def process_many(self, texts: Iterable[str]) -> list[str]:
+        return cyrillic_latin_translator.transliterate_many(texts, self.to)
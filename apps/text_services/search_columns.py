@@ -0,0 +1,23 @@
+from apps.text_services import cyrillic_latin_translator
+
+
+def normalize_search_text(text: str) -> str:
+    """Lowercase `text` and collapse whitespace, the form search columns are stored in"""
+    return " ".join(text.lower().split())
+
+
+def build_search_columns(text: str) -> tuple[str, str]:
+    """Return the latin and cyrillic search column values of `text`"""
+    text = normalize_search_text(text)
+    return (
+        normalize_search_text(
+            cyrillic_latin_translator.transliterate(
+                text, cyrillic_latin_translator.LATIN
+            )
+        ),
+        normalize_search_text(
+            cyrillic_latin_translator.transliterate(
+                text, cyrillic_latin_translator.CYRILLIC
+            )
+        ),
+    )
@@ -4,6 +4,7 @@ from django.core.validators import RegexValidator
 from django.db import models
 
 from apps.common.models import BaseModel
+from apps.common.services.reference_cache import ReferenceQuerySet
 from apps.courses.models import Course, Webinar
 from apps.user.enums import ReasonDeleteChoices
 from apps.user.manager import UserManager
@@ -55,7 +56,14 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
             )
         ]
 
-        indexes = [models.Index(fields=["is_active", "is_deleted"])]
+        indexes = [
+            models.Index(fields=["is_active", "is_deleted"]),
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="user_user_created_id_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
 
 
 class UserProfile(BaseModel):
@@ -113,6 +121,8 @@ class UserProfile(BaseModel):
 class Interest(BaseModel):
     name = models.CharField(max_length=64, unique=True, verbose_name="Name")
 
+    objects = ReferenceQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
@@ -2,6 +2,8 @@
 
 from rest_framework import serializers
 
+from apps.common.serializers.cached_fields import CachedFieldsMixin
+from apps.common.serializers.nested import Nested, NestedSerializerMixin
 from apps.user.models import User, UserProfile
 
 
@@ -12,7 +14,9 @@ class UserResponseSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "is_active", "is_staff", "is_superuser", "email")
 
 
-class ProfileResponseSerializer(serializers.ModelSerializer):
+class ProfileResponseSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    exclude_fields_key = "exclude_profile_fields"
+
     # list_interests = serializers.SerializerMethodField()
 
     class Meta:
@@ -31,15 +35,21 @@ class ProfileResponseSerializer(serializers.ModelSerializer):
     # def get_list_interests(self, obj):
     #     return obj.list_interests.all()
 
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_profile_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
-
 
-class UserProfileResponseSerializer(serializers.ModelSerializer):
+class UserProfileResponseSerializer(
+    CachedFieldsMixin, NestedSerializerMixin, serializers.ModelSerializer
+):
     profile = serializers.SerializerMethodField()
 
+    nested_fields = {
+        "profile": Nested(
+            "profile",
+            ProfileResponseSerializer,
+            inherit_context=("exclude_profile_fields",),
+            missing="profile was not set",
+        ),
+    }
+
     class Meta:
         model = User
         fields = (
@@ -54,18 +64,4 @@ class UserProfileResponseSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "is_active", "is_staff", "is_superuser", "email")
 
     def get_profile(self, obj):
-        exclude_profile_fields = self.context.get("exclude_profile_fields", [])
-        try:
-            profile = obj.profile
-        except UserProfile.DoesNotExist:
-            return "profile was not set"
-
-        profile_serializer = ProfileResponseSerializer(
-            profile, context={"exclude_profile_fields": exclude_profile_fields}
-        )
-        return profile_serializer.data
-
-    def get_fields(self):
-        fields = super().get_fields()
-        exclude_fields = self.context.get("exclude_fields", [])
-        return {k: v for k, v in fields.items() if k not in exclude_fields}
+        return self.get_nested("profile", obj)
@@ -8,7 +8,12 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from apps.text_services.pagination import StandardResultsSetPagination
+from apps.common.mixins import (
+    EagerLoadingMixin,
+    ExcludeFieldsMixin,
+    SparseFieldsMixin,
+)
+from apps.text_services.pagination import KeysetResultsSetPagination
 from apps.user.models import User, UserProfile
 from apps.user.serializers.account_model import UserProfileResponseSerializer
 from apps.user.serializers.profile import ProfilePatchSerializer
@@ -61,19 +66,18 @@ class ProfileDetailAPIView(GenericAPIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class ProfileListAPIView(ListAPIView):
-    pagination_class = StandardResultsSetPagination
+class ProfileListAPIView(
+    SparseFieldsMixin, ExcludeFieldsMixin, EagerLoadingMixin, ListAPIView
+):
+    pagination_class = KeysetResultsSetPagination
     serializer_class = UserProfileResponseSerializer
     filter_backends = (SearchFilter,)
     search_fields = ["username", "email"]
     queryset = User.objects.filter(is_deleted=False)
+    exclude_fields = ("is_staff", "is_superuser")
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["exclude_fields"] = [
-            "is_staff",
-            "is_superuser",
-        ]
         context["exclude_profile_fields"] = ["last_name", "phone_number", "bio"]
         return context
 
@@ -1,6 +1,7 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_init
 
 os.environ.setdefault(
     "DJANGO_SETTINGS_MODULE", os.getenv("DJANGO_SETTINGS_MODULE", "core.settings.dev")
@@ -16,3 +17,11 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+def preload_worker(**kwargs):
+    """Runs in the worker master before the pool processes are forked"""
+    from core.preload import preload_shared_state
+
+    preload_shared_state()
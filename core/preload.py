@@ -0,0 +1,21 @@
+import gc
+
+from django.db import connections
+
+from apps.text_services import cyrillic_latin_translator
+
+
+def preload_shared_state(with_autocomplete=False):
+    """
+    Build read-only state in the master process before workers are forked and
+    move it to the permanent GC generation, so collections in the children do
+    not touch (and copy) the shared pages.
+    """
+    cyrillic_latin_translator.preload()
+    if with_autocomplete:
+        from apps.courses.services.autocomplete import autocomplete
+
+        autocomplete.warm_up()
+        # forked workers must not share the connection used for the build
+        connections.close_all()
+    gc.freeze()
@@ -18,6 +18,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 LOCAL_APPS = ["apps.common", "apps.user", "apps.courses", "apps.news", "apps.payment"]
@@ -30,9 +31,21 @@ EXTERNAL_APPS = [
     "django_filters",
 ]
 
+# Render and parse JSON with orjson everywhere, views can also opt in one by one
+FAST_JSON = os.getenv("FAST_JSON", "False") == "True"
+
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "apps.common.renderers.ORJSONRenderer"
+        if FAST_JSON
+        else "rest_framework.renderers.JSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "apps.common.parsers.ORJSONParser"
+        if FAST_JSON
+        else "rest_framework.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
@@ -42,6 +55,9 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Lists of tables bigger than this are counted from planner statistics
+APPROXIMATE_COUNT_THRESHOLD = int(os.getenv("APPROXIMATE_COUNT_THRESHOLD", 100_000))
+
 INSTALLED_APPS = DJANGO_APPS + LOCAL_APPS + EXTERNAL_APPS
 
 MIDDLEWARE = [
@@ -138,7 +154,7 @@ REDIS_DB = os.getenv("REDIS_DB", 0)
 
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}",
         "KEY_PREFIX": os.getenv("PROJECT_NAME", "project_name"),
         "OPTIONS": {
@@ -148,6 +164,45 @@ CACHES = {
     }
 }
 
+# Search results are cached as primary key lists, versioned per model
+SEARCH_CACHE_MODELS = ("courses.Course", "courses.Webinar")
+SEARCH_CACHE_TIMEOUT = int(os.getenv("SEARCH_CACHE_TIMEOUT", 300))
+SEARCH_CACHE_MAX_RESULTS = int(os.getenv("SEARCH_CACHE_MAX_RESULTS", 1000))
+
+# Rendered list responses are cached per generation of the models they read,
+# the timeout only reclaims entries of old generations
+RESPONSE_CACHE_MODELS = (
+    "courses.Category",
+    "courses.Course",
+    "courses.Webinar",
+    "news.Post",
+    "news.Event",
+    "user.User",
+    "user.UserProfile",
+)
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", 3600))
+
+# Autocomplete index: seconds between version checks and before a full rebuild
+AUTOCOMPLETE_CHECK_INTERVAL = int(os.getenv("AUTOCOMPLETE_CHECK_INTERVAL", 5))
+AUTOCOMPLETE_MAX_AGE = int(os.getenv("AUTOCOMPLETE_MAX_AGE", 3600))
+
+# Frontend translation bundle: seconds between version checks, and how long
+# bundles of old versions are kept to compute deltas from
+TRANSLATIONS_CHECK_INTERVAL = int(os.getenv("TRANSLATIONS_CHECK_INTERVAL", 5))
+TRANSLATIONS_BUNDLE_TIMEOUT = int(os.getenv("TRANSLATIONS_BUNDLE_TIMEOUT", 604800))
+
+# Small reference tables kept whole in every process and in the cache. Local
+# copies are dropped through redis pub/sub on writes and expire as a fallback
+REFERENCE_CACHE_MODELS = (
+    "common.VersionHistory",
+    "courses.Category",
+    "user.Interest",
+    "payment.Providers",
+)
+REFERENCE_CACHE_SIZE = int(os.getenv("REFERENCE_CACHE_SIZE", 64))
+REFERENCE_CACHE_LOCAL_TIMEOUT = int(os.getenv("REFERENCE_CACHE_LOCAL_TIMEOUT", 60))
+REFERENCE_CACHE_TIMEOUT = int(os.getenv("REFERENCE_CACHE_TIMEOUT", 3600))
+
 # CELERY CONFIGURATION
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}")
 CELERY_RESULT_BACKEND = os.getenv(
@@ -0,0 +1,9 @@
+# Read by gunicorn from the working directory, e.g. `gunicorn core.wsgi`
+preload_app = True
+
+
+def when_ready(server):
+    """The master builds the shared state once, before any worker is forked"""
+    from core.preload import preload_shared_state
+
+    preload_shared_state(with_autocomplete=True)
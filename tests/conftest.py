@@ -0,0 +1,92 @@
+import itertools
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.test import APIClient
+
+from apps.courses.models import Category, Course, Webinar
+from apps.user.models import User, UserProfile
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+_sequence = itertools.count()
+
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    """Every test starts from an empty process local cache instead of redis"""
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def analyze(db):
+    """
+    Refresh the planner statistics of `models`. ANALYZE writes `reltuples` in
+    place, so the estimate outlives the test transaction.
+    """
+
+    def analyze(*models):
+        with connection.cursor() as cursor:
+            for model in models:
+                cursor.execute(
+                    f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}"
+                )
+
+    return analyze
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def make_user(db):
+    def make_user(first_name="Ali", last_name="Valiyev", **kwargs):
+        number = next(_sequence)
+        kwargs.setdefault("username", f"user{number}")
+        kwargs.setdefault("email", f"user{number}@example.uz")
+        user = User.objects.create(**kwargs)
+        UserProfile.objects.create(
+            user=user, first_name=first_name, last_name=last_name
+        )
+        return user
+
+    return make_user
+
+
+@pytest.fixture
+def category(db):
+    return Category.objects.create(name="Dasturlash")
+
+
+@pytest.fixture
+def make_course(make_user, category):
+    def make_course(title="Python kursi", **kwargs):
+        kwargs.setdefault("description", "Kurs tavsifi")
+        kwargs.setdefault("price", 100)
+        kwargs.setdefault("category", category)
+        if "author" not in kwargs:
+            kwargs["author"] = make_user()
+        return Course.objects.create(title=title, **kwargs)
+
+    return make_course
+
+
+@pytest.fixture
+def make_webinar(make_user, category):
+    def make_webinar(title="Python vebinari", **kwargs):
+        kwargs.setdefault("description", "Vebinar tavsifi")
+        kwargs.setdefault("price", 100)
+        kwargs.setdefault("category", category)
+        if "author" not in kwargs:
+            kwargs["author"] = make_user()
+        return Webinar.objects.create(title=title, **kwargs)
+
+    return make_webinar
@@ -0,0 +1,114 @@
+import pytest
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.common.services import approximate_count
+from apps.common.services.approximate_count import (
+    ApproximateCountPaginator,
+    estimate_count,
+)
+from apps.courses.models import Course
+
+pytestmark = pytest.mark.django_db
+
+COURSE_LIST_URL = reverse("courses:course_list")
+ROWS = 12
+
+
+@pytest.fixture
+def courses(make_course):
+    return [make_course(title=f"Kurs {number}") for number in range(ROWS)]
+
+
+def run_estimate(queryset, threshold):
+    with CaptureQueriesContext(connection) as context:
+        result = estimate_count(queryset, threshold=threshold)
+    return result, [query["sql"] for query in context.captured_queries]
+
+
+def test_analyzed_table_is_counted_from_reltuples(courses, analyze):
+    analyze(Course)
+
+    result, queries = run_estimate(Course.objects.all(), threshold=1)
+
+    assert result == (ROWS, True)
+    assert len(queries) == 1
+    assert "reltuples" in queries[0]
+
+
+def test_never_analyzed_table_falls_back_to_explain(courses, monkeypatch):
+    # reltuples outlives earlier tests, so mark the table as never analyzed
+    monkeypatch.setattr(approximate_count, "get_table_estimate", lambda queryset: -1)
+
+    result, queries = run_estimate(Course.objects.all(), threshold=1)
+
+    count, approximate = result
+    assert approximate is True
+    assert count > 0
+    assert [query.split()[0] for query in queries] == ["EXPLAIN"]
+
+
+def test_small_table_gets_an_exact_count(courses, analyze):
+    analyze(Course)
+
+    result, queries = run_estimate(Course.objects.all(), threshold=ROWS + 1)
+
+    assert result == (ROWS, False)
+    assert "reltuples" in queries[0]
+    assert "COUNT(*)" in queries[-1]
+
+
+def test_filtered_queryset_gets_an_exact_count_without_statistics(courses):
+    result, queries = run_estimate(
+        Course.objects.filter(title__startswith="Kurs 1"), threshold=1
+    )
+
+    assert result == (3, False)
+    assert len(queries) == 1
+    assert "COUNT(*)" in queries[0]
+
+
+@pytest.fixture
+def low_estimate(monkeypatch, settings):
+    """Report 5 rows for every table and treat that as a large table"""
+    settings.APPROXIMATE_COUNT_THRESHOLD = 1
+    monkeypatch.setattr(approximate_count, "get_table_estimate", lambda queryset: 5)
+
+
+def test_pages_past_a_low_estimate_stay_reachable(courses, low_estimate):
+    paginator = ApproximateCountPaginator(Course.objects.order_by("id"), 5)
+
+    pages = [paginator.page(number) for number in (1, 2, 3)]
+
+    assert paginator.count == 5
+    assert [len(page) for page in pages] == [5, 5, 2]
+    assert [page.has_next() for page in pages] == [True, True, False]
+    assert pages[1].next_page_number() == 3
+    with pytest.raises(EmptyPage):
+        paginator.page(4)
+
+
+def test_exact_counts_keep_the_page_bound(courses):
+    paginator = ApproximateCountPaginator(Course.objects.order_by("id"), 5)
+
+    assert paginator.page(3).has_next() is False
+    with pytest.raises(EmptyPage):
+        paginator.page(4)
+
+
+def test_api_walks_every_row_past_a_low_estimate(api_client, courses, low_estimate):
+    titles = []
+    url, params = COURSE_LIST_URL, {"page_size": 5}
+    while url:
+        response = api_client.get(url, params)
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["count"], data["approximate"]) == (5, True)
+        titles += [item["title"] for item in data["results"]]
+        url, params = data["next"], None
+
+    assert sorted(titles) == sorted(course.title for course in courses)
+    response = api_client.get(COURSE_LIST_URL, {"page_size": 5, "page": 4})
+    assert response.status_code == 404
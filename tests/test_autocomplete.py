@@ -0,0 +1,167 @@
+import pytest
+from django.core.cache import cache
+
+from apps.courses.models import Course
+from apps.courses.services import autocomplete as autocomplete_service
+from apps.courses.services.autocomplete import (
+    ADD,
+    CATEGORY,
+    COURSE,
+    REMOVE,
+    WEBINAR,
+    Autocomplete,
+    PrefixIndex,
+    Suggestion,
+)
+
+SUGGESTIONS = [
+    Suggestion(COURSE, 1, "Python dasturlash", 5),
+    Suggestion(COURSE, 2, "Java asoslari", 9),
+    Suggestion(WEBINAR, 1, "Python bilan ishlash", 2),
+    Suggestion(CATEGORY, 1, "Dasturlash", 7),
+]
+PREFIXES = ["p", "py", "pyt", "python d", "d", "da", "dastur", "ja", "п", "жа", "дас"]
+
+
+def get_ids(suggestions):
+    return [(suggestion.kind, suggestion.id) for suggestion in suggestions]
+
+
+def assert_same_results(index, expected):
+    for prefix in PREFIXES:
+        assert index.search(prefix) == expected.search(prefix), prefix
+        assert index.search(prefix, 10, (COURSE,)) == expected.search(
+            prefix, 10, (COURSE,)
+        ), prefix
+
+
+def test_prefixes_match_in_both_scripts_by_popularity():
+    index = PrefixIndex(SUGGESTIONS)
+
+    assert get_ids(index.search("py")) == [(COURSE, 1), (WEBINAR, 1)]
+    assert get_ids(index.search("dastur")) == [(CATEGORY, 1), (COURSE, 1)]
+    assert get_ids(index.search("дастур")) == [(CATEGORY, 1), (COURSE, 1)]
+    assert get_ids(index.search("жа")) == [(COURSE, 2)]
+    assert get_ids(index.search("dastur", 10, (COURSE,))) == [(COURSE, 1)]
+    assert index.search("") == ()
+
+
+def test_applied_changes_match_a_rebuilt_index():
+    index = PrefixIndex(SUGGESTIONS, version=1)
+
+    updated = index.apply(
+        [
+            [ADD, COURSE, 3, "Python kursi"],
+            [ADD, COURSE, 2, "Go asoslari"],
+            [REMOVE, WEBINAR, 1, ""],
+        ],
+        version=4,
+    )
+
+    expected = PrefixIndex(
+        [
+            Suggestion(COURSE, 1, "Python dasturlash", 5),
+            Suggestion(COURSE, 2, "Go asoslari", 9),
+            Suggestion(CATEGORY, 1, "Dasturlash", 7),
+            Suggestion(COURSE, 3, "Python kursi", 0),
+        ]
+    )
+    assert updated.version == 4
+    assert updated.keys == expected.keys
+    assert sorted(zip(updated.keys, updated.key_ranks, strict=True)) == sorted(
+        zip(expected.keys, expected.key_ranks, strict=True)
+    )
+    assert updated.matches == expected.matches
+    assert_same_results(updated, expected)
+
+
+def test_apply_leaves_the_original_index_and_is_idempotent():
+    index = PrefixIndex(SUGGESTIONS, version=1)
+    changes = [[ADD, COURSE, 3, "Python kursi"], [REMOVE, COURSE, 2, ""]]
+
+    once = index.apply(changes, version=3)
+    twice = once.apply(changes, version=3)
+
+    assert_same_results(index, PrefixIndex(SUGGESTIONS))
+    assert_same_results(twice, once)
+    assert twice.keys == once.keys
+
+
+@pytest.fixture
+def autocomplete(settings):
+    settings.AUTOCOMPLETE_CHECK_INTERVAL = 0
+    return Autocomplete()
+
+
+@pytest.mark.django_db
+def test_committed_writes_are_applied_without_a_rebuild(
+    autocomplete, make_course, django_capture_on_commit_callbacks, monkeypatch
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        course = make_course(title="Python kursi")
+    assert get_ids(autocomplete.search("pyth")) == [(COURSE, course.pk)]
+
+    loads = []
+    load_suggestions = autocomplete_service.load_suggestions
+    monkeypatch.setattr(
+        autocomplete_service,
+        "load_suggestions",
+        lambda: loads.append(1) or load_suggestions(),
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        other = make_course(title="Python asoslari")
+    assert get_ids(autocomplete.search("python a")) == [(COURSE, other.pk)]
+
+    course.title = "Go kursi"
+    with django_capture_on_commit_callbacks(execute=True):
+        course.save(update_fields=["title"])
+    assert get_ids(autocomplete.search("pyth")) == [(COURSE, other.pk)]
+    assert get_ids(autocomplete.search("go")) == [(COURSE, course.pk)]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        other.delete()
+    assert autocomplete.search("pyth") == ()
+    assert loads == []
+
+
+@pytest.mark.django_db
+def test_changes_wait_for_commit_and_skip_other_fields(
+    autocomplete, make_course, django_capture_on_commit_callbacks
+):
+    course = make_course(title="Python kursi")
+    version = autocomplete_service.get_version()
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        Course.objects.get(pk=course.pk).save(update_fields=["price"])
+        course.title = "Go kursi"
+        course.save()
+    assert autocomplete_service.get_version() == version
+    published = [
+        callback.args
+        for callback in callbacks
+        if getattr(callback, "func", None) is autocomplete_service.publish_change
+    ]
+    assert published == [(ADD, COURSE, course.pk, "Go kursi")]
+
+
+@pytest.mark.django_db
+def test_missing_changes_rebuild_off_the_request_path(
+    autocomplete, make_course, django_capture_on_commit_callbacks, monkeypatch
+):
+    index = autocomplete.get_index()
+    rebuilds = []
+    monkeypatch.setattr(
+        autocomplete, "rebuild_in_background", lambda: rebuilds.append(1)
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        make_course(title="Python kursi")
+    cache.delete(
+        autocomplete_service.CHANGE_KEY.format(
+            version=autocomplete_service.get_version()
+        )
+    )
+
+    assert autocomplete.get_index() is index
+    assert rebuilds == [1]
@@ -0,0 +1,123 @@
+import pytest
+from rest_framework import serializers
+
+from apps.common.serializers import cached_fields
+from apps.common.serializers.cached_fields import CachedFieldsMixin
+from apps.courses.serializers.category import CategoryModelSerializer
+from apps.user.serializers.account_model import ProfileResponseSerializer
+
+PROFILE_FIELDS = [
+    "id",
+    "user",
+    "avatar",
+    "bio",
+    "first_name",
+    "last_name",
+    "phone_number",
+]
+
+
+@pytest.fixture(autouse=True)
+def fields_cache(monkeypatch):
+    cache = {}
+    monkeypatch.setattr(CachedFieldsMixin, "_fields_cache", cache)
+    return cache
+
+
+def field_names(serializer_class, **context):
+    return list(serializer_class(context=context).fields)
+
+
+def test_exclusions_are_keyed_apart(fields_cache):
+    everything = field_names(CategoryModelSerializer)
+    without_id = field_names(CategoryModelSerializer, exclude_fields=["id"])
+
+    assert without_id == [name for name in everything if name != "id"]
+    assert set(fields_cache) == {
+        (CategoryModelSerializer, frozenset()),
+        (CategoryModelSerializer, frozenset({"id"})),
+    }
+
+
+@pytest.mark.parametrize(
+    "exclude_fields",
+    [["id", "name"], ("name", "id"), {"id", "name"}, ["id", "name", "id"]],
+)
+def test_exclusions_are_keyed_by_set(fields_cache, exclude_fields):
+    field_names(CategoryModelSerializer, exclude_fields=["name", "id"])
+
+    names = field_names(CategoryModelSerializer, exclude_fields=exclude_fields)
+
+    assert "id" not in names
+    assert "name" not in names
+    assert list(fields_cache) == [(CategoryModelSerializer, frozenset({"id", "name"}))]
+
+
+def test_missing_and_empty_exclusions_share_a_key(fields_cache):
+    field_names(CategoryModelSerializer)
+    field_names(CategoryModelSerializer, exclude_fields=None)
+    field_names(CategoryModelSerializer, exclude_fields=[])
+
+    assert list(fields_cache) == [(CategoryModelSerializer, frozenset())]
+
+
+def test_subclasses_are_keyed_apart(fields_cache):
+    class IconlessCategorySerializer(CategoryModelSerializer):
+        class Meta(CategoryModelSerializer.Meta):
+            fields = ("id", "name")
+
+    assert field_names(IconlessCategorySerializer) == ["id", "name"]
+    assert "icon" in field_names(CategoryModelSerializer)
+    assert len(fields_cache) == 2
+
+
+def test_exclude_fields_key_selects_the_context_entry(fields_cache):
+    names = field_names(
+        ProfileResponseSerializer,
+        exclude_fields=["first_name"],
+        exclude_profile_fields=["bio", "phone_number"],
+    )
+
+    assert names == [
+        name for name in PROFILE_FIELDS if name not in ("bio", "phone_number")
+    ]
+    assert list(fields_cache) == [
+        (ProfileResponseSerializer, frozenset({"bio", "phone_number"}))
+    ]
+
+
+def test_instances_bind_their_own_fields():
+    first = CategoryModelSerializer()
+    second = CategoryModelSerializer()
+
+    assert first.fields["name"] is not second.fields["name"]
+    assert first.fields["name"].parent is first
+    assert second.fields["name"].parent is second
+
+
+class ChildSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+class ParentSerializer(CachedFieldsMixin, serializers.Serializer):
+    child = ChildSerializer()
+    tags = serializers.ListField(child=serializers.CharField())
+
+
+def test_nested_fields_are_deep_copied():
+    first, second = ParentSerializer(), ParentSerializer()
+
+    assert first.fields["child"] is not second.fields["child"]
+    assert first.fields["child"].fields["name"].parent is first.fields["child"]
+    assert first.fields["tags"].child is not second.fields["tags"].child
+    assert first.fields["tags"].child.parent is first.fields["tags"]
+
+
+def test_full_cache_builds_fields_without_storing(fields_cache, monkeypatch):
+    monkeypatch.setattr(cached_fields, "FIELDS_CACHE_SIZE", 1)
+    field_names(CategoryModelSerializer)
+
+    names = field_names(CategoryModelSerializer, exclude_fields=["id"])
+
+    assert "id" not in names
+    assert list(fields_cache) == [(CategoryModelSerializer, frozenset())]
@@ -0,0 +1,68 @@
+import pytest
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.common import mixins
+from apps.courses.models import Webinar
+from apps.courses.serializers.webinar import WebinarModelSerializer
+
+pytestmark = pytest.mark.django_db
+
+WEBINAR_LIST_URL = reverse("courses:webinar_list")
+
+
+@pytest.fixture
+def compiled_plans(monkeypatch):
+    """Counts the plans compiled by list views, starting from an empty cache"""
+    compiled = []
+
+    class CountingCompiledSerializer(mixins.CompiledSerializer):
+        def __init__(self, *args, **kwargs):
+            compiled.append(args[0])
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(mixins, "_compiled_plans", {})
+    monkeypatch.setattr(mixins, "CompiledSerializer", CountingCompiledSerializer)
+    return compiled
+
+
+@pytest.fixture
+def webinar(make_webinar, category):
+    category.icon = "category/icon/python.png"
+    category.save()
+    webinar = make_webinar()
+    Webinar.objects.filter(pk=webinar.pk).update(cover="webinars/cover.png")
+    return webinar
+
+
+def get_expected(host):
+    request = Request(APIRequestFactory().get(WEBINAR_LIST_URL, HTTP_HOST=host))
+    return WebinarModelSerializer(
+        Webinar.objects.all(), many=True, context={"request": request}
+    ).data
+
+
+def test_plan_is_compiled_once_and_bound_per_request(
+    api_client, compiled_plans, webinar
+):
+    for host in ("first.example.uz", "second.example.uz"):
+        response = api_client.get(WEBINAR_LIST_URL, HTTP_HOST=host)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data == get_expected(host)
+        assert data[0]["cover"].startswith(f"http://{host}/")
+
+    assert compiled_plans == [WebinarModelSerializer]
+
+
+def test_plans_are_kept_per_exclusions(api_client, compiled_plans, webinar):
+    for params in ({}, {"omit": "cover"}, {"omit": "cover"}, {"fields": "id"}):
+        response = api_client.get(WEBINAR_LIST_URL, params)
+
+        assert response.status_code == 200
+        if params:
+            assert "cover" not in response.json()[0]
+
+    assert len(compiled_plans) == 3
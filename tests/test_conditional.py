@@ -0,0 +1,159 @@
+from contextlib import contextmanager
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.news.models import Event, Post
+
+pytestmark = pytest.mark.django_db
+
+POST_LIST_URL = reverse("news:post-list")
+
+
+@pytest.fixture
+def post(make_user):
+    return Post.objects.create(title="Yangilik", description="d", author=make_user())
+
+
+@pytest.fixture
+def event(make_user):
+    return Event.objects.create(
+        title="Tadbir",
+        description="d",
+        author=make_user(),
+        date="2026-01-01",
+        latitude=0,
+        longitude=0,
+    )
+
+
+@contextmanager
+def assert_no_queries():
+    """No statements besides the savepoints of `ATOMIC_REQUESTS`"""
+    with CaptureQueriesContext(connection) as context:
+        yield
+    statements = [query["sql"] for query in context.captured_queries]
+    assert [sql for sql in statements if "SAVEPOINT" not in sql] == []
+
+
+def get_etag(api_client, url, **extra):
+    response = api_client.get(url, **extra)
+    assert response.status_code == 200
+    return response["ETag"]
+
+
+def test_matching_etag_is_not_modified(api_client, post):
+    etag = get_etag(api_client, POST_LIST_URL)
+
+    response = api_client.get(POST_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+
+def test_etag_depends_on_query_parameters(api_client, post):
+    etag = get_etag(api_client, POST_LIST_URL)
+
+    response = api_client.get(POST_LIST_URL, {"page_size": 5}, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "extra", [{"HTTP_HOST": "second.example.uz"}, {"secure": True}]
+)
+def test_etag_depends_on_scheme_and_host(api_client, post, extra):
+    etag = get_etag(api_client, POST_LIST_URL, HTTP_HOST="first.example.uz")
+
+    response = api_client.get(POST_LIST_URL, HTTP_IF_NONE_MATCH=etag, **extra)
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_saves_change_the_list_etag(
+    api_client, post, django_capture_on_commit_callbacks
+):
+    etag = get_etag(api_client, POST_LIST_URL)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        post.title = "Yangi sarlavha"
+        post.save()
+    response = api_client.get(POST_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_deletes_change_the_list_etag(
+    api_client, post, make_user, django_capture_on_commit_callbacks
+):
+    Post.objects.create(title="Boshqa", description="d", author=make_user())
+    etag = get_etag(api_client, POST_LIST_URL)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        post.delete()
+    response = api_client.get(POST_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_related_model_changes_change_the_list_etag(
+    api_client, post, django_capture_on_commit_callbacks
+):
+    etag = get_etag(api_client, POST_LIST_URL)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        post.author.profile.first_name = "Bobur"
+        post.author.profile.save()
+    response = api_client.get(POST_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+
+
+def test_detail_etag(api_client, event):
+    url = reverse("news:event-detail", args=[event.pk])
+    api_client.force_authenticate(user=event.author)
+    etag = get_etag(api_client, url)
+
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    event.title = "Yangi tadbir"
+    event.save()
+
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+def test_cache_hits_run_no_queries(api_client, make_course, django_assert_num_queries):
+    make_course()
+    url = reverse("courses:course_list")
+    first = api_client.get(url, {"search": "python"})
+
+    with assert_no_queries():
+        second = api_client.get(url, {"search": "python"})
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second["ETag"] == first["ETag"]
+    assert second["Last-Modified"] == first["Last-Modified"]
+
+
+def test_cache_hits_answer_conditional_requests_without_queries(api_client, post):
+    etag = get_etag(api_client, POST_LIST_URL)
+
+    with assert_no_queries():
+        response = api_client.get(POST_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+
+def test_cache_hits_answer_if_modified_since(api_client, post):
+    last_modified = api_client.get(POST_LIST_URL)["Last-Modified"]
+
+    response = api_client.get(POST_LIST_URL, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+    assert response.status_code == 304
@@ -0,0 +1,40 @@
+import pytest
+from django.urls import reverse
+
+from apps.text_services.filters import FullTextSearchFilter
+
+COURSE_LIST_URL = reverse("courses:course_list")
+
+
+def test_prefix_query_escapes_quotes_and_backslashes():
+    assert FullTextSearchFilter.build_prefix_query("it's back\\") == (
+        "'it''s':* & 'back\\\\':*"
+    )
+
+
+def test_prefix_query_quotes_operators():
+    assert FullTextSearchFilter.build_prefix_query("a:b c&d e|f") == (
+        "'a:b':* & 'c&d':* & 'e|f':*"
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query", ["'", "\\", ":", "&", "|", "it's", "back\\", "\\'", "a:b", "c&d", "e|f"]
+)
+def test_search_with_tsquery_characters(api_client, make_course, query):
+    make_course(title="It's back\\ a:b c&d e|f")
+
+    response = api_client.get(COURSE_LIST_URL, {"search": query})
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_search_matches_terms_with_quotes_and_backslashes(api_client, make_course):
+    course = make_course(title="It's back\\ again")
+    make_course(title="Boshqa kurs")
+
+    response = api_client.get(COURSE_LIST_URL, {"search": "it's back\\"})
+
+    assert [item["id"] for item in response.json()["results"]] == [course.id]
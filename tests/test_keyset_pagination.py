@@ -0,0 +1,133 @@
+import datetime
+from base64 import b64encode
+from urllib import parse
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.news.models import Post
+from apps.text_services.pagination import KeysetResultsSetPagination
+
+pytestmark = pytest.mark.django_db
+
+POST_LIST_URL = reverse("news:post-list")
+
+
+@pytest.fixture
+def make_posts(make_user):
+    def make_posts(count, created_at=None):
+        author = make_user()
+        posts = [
+            Post.objects.create(title=f"Post {number}", description="d", author=author)
+            for number in range(count)
+        ]
+        if created_at is not None:
+            Post.objects.filter(pk__in=[post.pk for post in posts]).update(
+                created_at=created_at
+            )
+        return posts
+
+    return make_posts
+
+
+def get_cursor(link):
+    return parse.parse_qs(parse.urlparse(link).query)["cursor"][0]
+
+
+def get_page(api_client, **params):
+    response = api_client.get(POST_LIST_URL, params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_cursor_round_trip():
+    paginator = KeysetResultsSetPagination()
+    paginator.base_url = "http://testserver/posts/?cursor="
+    post = Post(id=42, created_at=timezone.now())
+
+    for backwards in (False, True):
+        link = paginator.encode_cursor(post, reverse=backwards)
+        request = Request(APIRequestFactory().get("/", {"cursor": get_cursor(link)}))
+
+        assert paginator.decode_cursor(request) == (
+            (post.created_at, post.id),
+            backwards,
+        )
+
+
+def test_requests_without_cursor_use_page_number_pagination(api_client, make_posts):
+    make_posts(3)
+
+    page = get_page(api_client, page_size=2)
+
+    assert page["count"] == 3
+    assert "approximate" not in page
+    assert len(page["results"]) == 2
+
+
+def test_pages_follow_created_at_and_id(api_client, make_posts):
+    posts = make_posts(5)
+    expected = [post.id for post in sorted(posts, key=lambda post: post.created_at)]
+    expected.reverse()
+
+    seen = []
+    page = get_page(api_client, cursor="", page_size=2)
+    assert page["previous"] is None
+    while True:
+        seen.extend(item["id"] for item in page["results"])
+        if page["next"] is None:
+            break
+        page = get_page(api_client, cursor=get_cursor(page["next"]), page_size=2)
+
+    assert seen == expected
+
+
+def test_ties_on_created_at_are_ordered_by_id(api_client, make_posts):
+    created_at = timezone.now() - datetime.timedelta(days=1)
+    posts = make_posts(5, created_at=created_at)
+    expected = sorted((post.id for post in posts), reverse=True)
+
+    first = get_page(api_client, cursor="", page_size=2)
+    second = get_page(api_client, cursor=get_cursor(first["next"]), page_size=2)
+    third = get_page(api_client, cursor=get_cursor(second["next"]), page_size=2)
+
+    assert [item["id"] for item in first["results"]] == expected[:2]
+    assert [item["id"] for item in second["results"]] == expected[2:4]
+    assert [item["id"] for item in third["results"]] == expected[4:]
+    assert third["next"] is None
+
+
+def test_previous_link_returns_the_prior_page(api_client, make_posts):
+    created_at = timezone.now() - datetime.timedelta(days=1)
+    make_posts(5, created_at=created_at)
+
+    first = get_page(api_client, cursor="", page_size=2)
+    second = get_page(api_client, cursor=get_cursor(first["next"]), page_size=2)
+    previous = get_page(api_client, cursor=get_cursor(second["previous"]), page_size=2)
+
+    assert previous["results"] == first["results"]
+    assert previous["previous"] is None
+    assert get_cursor(previous["next"]) == get_cursor(first["next"])
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        "émoji",
+        b64encode(b"p=2024-01-01").decode(),
+        b64encode(b"p=yesterday|1").decode(),
+        b64encode(b"p=2024-01-01T00:00:00|one").decode(),
+        b64encode(b"r=1").decode(),
+    ],
+)
+def test_malformed_cursor_is_a_bad_request(api_client, make_posts, cursor):
+    make_posts(1)
+
+    response = api_client.get(POST_LIST_URL, {"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json() == {"cursor": "Invalid cursor"}
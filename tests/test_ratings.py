@@ -0,0 +1,255 @@
+import io
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.courses.models import Course, RatingCourse, RatingWebinar, Webinar
+from apps.courses.services import ratings
+
+pytestmark = pytest.mark.django_db
+
+COURSE_LIST_URL = reverse("courses:course_list")
+WEBINAR_LIST_URL = reverse("courses:webinar_list")
+
+
+@pytest.fixture
+def rate(make_user):
+    def rate(target, rating):
+        if isinstance(target, Course):
+            return RatingCourse.objects.create(
+                course=target, user=make_user(), rating=rating
+            )
+        return RatingWebinar.objects.create(
+            webinar=target, user=make_user(), rating=rating
+        )
+
+    return rate
+
+
+def get_aggregates(target):
+    target.refresh_from_db()
+    return target.rating_sum, target.rating_count, target.rating_avg
+
+
+def assert_matches_computed(model, rating_model):
+    computed = ratings.get_computed_aggregates(rating_model)
+    rows = model.objects.annotate(
+        computed_sum=computed["rating_sum"],
+        computed_count=computed["rating_count"],
+        computed_avg=computed["rating_avg"],
+    ).values_list(
+        "rating_sum",
+        "rating_count",
+        "rating_avg",
+        "computed_sum",
+        "computed_count",
+        "computed_avg",
+    )
+    for stored_sum, stored_count, stored_avg, *expected in rows:
+        assert (stored_sum, stored_count) == tuple(expected[:2])
+        assert stored_avg == pytest.approx(expected[2])
+
+
+def test_created_ratings_are_added(make_course, rate):
+    course = make_course()
+
+    rate(course, 5)
+    rate(course, 2)
+
+    assert get_aggregates(course) == (7, 2, 3.5)
+
+
+def test_updated_rating_adds_the_difference(make_course, rate):
+    course = make_course()
+    rate(course, 5)
+    rating = rate(course, 2)
+
+    rating.rating = 4
+    rating.save()
+
+    assert get_aggregates(course) == (9, 2, 4.5)
+
+
+def test_unchanged_rating_save_keeps_aggregates(
+    make_course, rate, django_assert_num_queries
+):
+    course = make_course()
+    rating = rate(course, 3)
+
+    # the locked read of the stored rating and the UPDATE of the rating row
+    with django_assert_num_queries(2):
+        rating.save()
+
+    assert get_aggregates(course) == (3, 1, 3.0)
+
+
+def test_deleted_rating_is_removed(make_course, rate):
+    course = make_course()
+    rate(course, 5)
+    rating = rate(course, 2)
+
+    rating.delete()
+
+    assert get_aggregates(course) == (5, 1, 5.0)
+
+
+def test_last_deleted_rating_resets_the_average(make_webinar, rate):
+    webinar = make_webinar()
+    rating = rate(webinar, 4)
+
+    rating.delete()
+
+    assert get_aggregates(webinar) == (0, 0, 0.0)
+
+
+def test_rating_moved_to_another_course(make_course, rate):
+    first, second = make_course(), make_course(title="Django kursi")
+    rate(first, 5)
+    rating = rate(first, 1)
+    rate(second, 3)
+
+    rating.course = second
+    rating.rating = 2
+    rating.save()
+
+    assert get_aggregates(first) == (5, 1, 5.0)
+    assert get_aggregates(second) == (5, 2, 2.5)
+
+
+def test_stored_rating_is_read_under_a_row_lock(make_course, rate):
+    rating = rate(make_course(), 3)
+
+    with CaptureQueriesContext(connection) as context:
+        ratings.remember_rating(rating)
+
+    assert context.captured_queries[0]["sql"].endswith("FOR UPDATE")
+    assert rating._stored_rating == (rating.course_id, 3)
+
+
+def test_deleting_the_course_skips_its_aggregates(make_course, rate):
+    course = make_course()
+    rate(course, 4)
+    rate(course, 5)
+
+    with CaptureQueriesContext(connection) as context:
+        course.delete()
+
+    updates = [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith('UPDATE "courses_course"')
+    ]
+    assert updates == []
+
+
+def test_mixed_operations_match_computed_aggregates(make_course, make_webinar, rate):
+    courses = [make_course(title=f"Kurs {number}") for number in range(3)]
+    webinar = make_webinar()
+    course_ratings = [rate(course, value) for course in courses for value in (1, 3, 5)]
+    webinar_ratings = [rate(webinar, value) for value in (2, 4)]
+
+    course_ratings[0].rating = 5
+    course_ratings[0].save()
+    course_ratings[1].course = courses[2]
+    course_ratings[1].save()
+    course_ratings[4].delete()
+    RatingCourse.objects.filter(pk=course_ratings[7].pk).delete()
+    webinar_ratings[0].delete()
+    courses[1].delete()
+
+    assert_matches_computed(Course, RatingCourse)
+    assert_matches_computed(Webinar, RatingWebinar)
+
+
+def test_reconcile_range_fixes_drifted_rows_only(make_course, rate):
+    drifted, kept = make_course(), make_course(title="Django kursi")
+    rate(drifted, 4)
+    rate(drifted, 5)
+    rate(kept, 3)
+    Course.objects.filter(pk=drifted.pk).update(
+        rating_sum=1, rating_count=7, rating_avg=0.1
+    )
+    first_pk, last_pk = sorted((drifted.pk, kept.pk))
+
+    assert ratings.reconcile_range(RatingCourse, first_pk, last_pk) == 1
+    assert get_aggregates(drifted) == (9, 2, 4.5)
+    assert get_aggregates(kept) == (3, 1, 3.0)
+    assert ratings.reconcile_range(RatingCourse, first_pk, last_pk) == 0
+
+
+def test_reconcile_command_reports_updated_rows(make_webinar, rate):
+    webinar = make_webinar()
+    rate(webinar, 2)
+    Webinar.objects.filter(pk=webinar.pk).update(rating_sum=0, rating_count=0)
+
+    stdout = io.StringIO()
+    call_command("reconcile_ratings", model=["courses.RatingWebinar"], stdout=stdout)
+
+    assert "courses.RatingWebinar: 1 rows updated" in stdout.getvalue()
+    assert get_aggregates(webinar) == (2, 1, 2.0)
+
+
+@pytest.fixture
+def rated_courses(make_course, rate):
+    """Courses by title: average 5 from one rating, 4 from three and none"""
+    top = make_course(title="Top")
+    rate(top, 5)
+    popular = make_course(title="Popular")
+    for value in (3, 4, 5):
+        rate(popular, value)
+    unrated = make_course(title="Unrated")
+    return top, popular, unrated
+
+
+def list_titles(api_client, url, params):
+    response = api_client.get(url, params)
+    assert response.status_code == 200
+    data = response.json()
+    # the webinar list is not paginated
+    items = data["results"] if isinstance(data, dict) else data
+    return [item["title"] for item in items]
+
+
+@pytest.mark.parametrize(
+    ("params", "titles"),
+    [
+        ({"min_rating": 4.5}, ["Top"]),
+        ({"min_rating": 4}, ["Popular", "Top"]),
+        ({"min_rating_count": 2}, ["Popular"]),
+        ({"ordering": "-rating"}, ["Top", "Popular", "Unrated"]),
+        ({"ordering": "rating"}, ["Unrated", "Popular", "Top"]),
+        ({"ordering": "-rating_count"}, ["Popular", "Top", "Unrated"]),
+    ],
+)
+def test_course_rating_filters_and_ordering(api_client, rated_courses, params, titles):
+    result = list_titles(api_client, COURSE_LIST_URL, params)
+
+    if "ordering" in params:
+        assert result == titles
+    else:
+        assert sorted(result) == titles
+
+
+def test_rating_ties_are_ordered_by_newest(api_client, make_course, rate):
+    older, newer = make_course(title="Older"), make_course(title="Newer")
+    rate(older, 4)
+    rate(newer, 4)
+
+    titles = list_titles(api_client, COURSE_LIST_URL, {"ordering": "-rating"})
+
+    assert titles == ["Newer", "Older"]
+
+
+def test_webinar_rating_filters_and_ordering(api_client, make_webinar, rate):
+    low, high = make_webinar(title="Low"), make_webinar(title="High")
+    rate(low, 2)
+    rate(high, 5)
+    rate(high, 4)
+
+    params = {"min_rating": 2, "ordering": "-rating"}
+    assert list_titles(api_client, WEBINAR_LIST_URL, params) == ["High", "Low"]
+    params = {"min_rating": 3}
+    assert list_titles(api_client, WEBINAR_LIST_URL, params) == ["High"]
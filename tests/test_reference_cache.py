@@ -0,0 +1,177 @@
+import types
+
+import pytest
+
+from apps.common.models import VersionHistory
+from apps.common.services import reference_cache as reference_cache_module
+from apps.common.services.reference_cache import (
+    VERSION_KEY,
+    ReferenceCache,
+    reference_cache,
+)
+from apps.common.services.search_cache import bump_counter
+from apps.courses.models import Category, Course
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clean_reference_cache():
+    reference_cache.drop()
+    yield
+    reference_cache.drop()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Monotonic clock of the reference cache, advanced by hand"""
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        reference_cache_module,
+        "time",
+        types.SimpleNamespace(monotonic=lambda: clock.now),
+    )
+    return clock
+
+
+@pytest.fixture
+def commit(django_capture_on_commit_callbacks):
+    def commit(change, *args, **kwargs):
+        with django_capture_on_commit_callbacks(execute=True):
+            return change(*args, **kwargs)
+
+    return commit
+
+
+def names(model=Category, **lookups):
+    return [row.name for row in reference_cache.filter(model, **lookups)]
+
+
+def test_lookups_return_new_instances_in_default_order(django_assert_num_queries):
+    Category.objects.create(name="Tillar")
+    design = Category.objects.create(name="Dizayn")
+
+    assert names() == ["Dizayn", "Tillar"]
+    with django_assert_num_queries(0):
+        first = reference_cache.first(Category, id=str(design.pk))
+        again = reference_cache.first(Category, pk=design.pk)
+        assert reference_cache.last(Category, name="Yo'q") is None
+
+    assert first == design
+    assert first is not again
+    assert first.created_at == design.created_at
+
+
+def test_unknown_lookups_and_models_are_rejected():
+    with pytest.raises(TypeError, match="no field 'title'"):
+        reference_cache.filter(Category, title="x")
+    with pytest.raises(ValueError, match="not in REFERENCE_CACHE_MODELS"):
+        reference_cache.filter(Course)
+
+
+def test_tables_are_shared_through_the_cache(django_assert_num_queries):
+    VersionHistory.objects.create(version="1.2.0")
+    expected = reference_cache.first(VersionHistory)
+
+    with django_assert_num_queries(0):
+        row = ReferenceCache().first(VersionHistory)
+
+    assert (row.pk, row.version, row.created_at) == (
+        expected.pk,
+        expected.version,
+        expected.created_at,
+    )
+
+
+def test_committed_saves_and_deletes_invalidate(commit):
+    category = commit(Category.objects.create, name="Tillar")
+    assert names() == ["Tillar"]
+
+    category.name = "Chet tillari"
+    commit(category.save)
+    assert names() == ["Chet tillari"]
+
+    commit(category.delete)
+    assert names() == []
+
+
+def test_uncommitted_writes_keep_the_cached_table(django_capture_on_commit_callbacks):
+    Category.objects.create(name="Tillar")
+    assert names() == ["Tillar"]
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        Category.objects.create(name="Dizayn")
+
+    assert names() == ["Tillar"]
+    assert [
+        callback.args
+        for callback in callbacks
+        if getattr(callback, "func", None) == reference_cache.invalidate
+    ] == [(Category,)]
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda: Category.objects.filter(name="Tillar").update(name="Chet tillari"),
+        lambda: Category.objects.bulk_create([Category(name="Chet tillari")]),
+        lambda: Category.objects.bulk_update(
+            [Category(pk=Category.objects.get().pk, name="Chet tillari")], ["name"]
+        ),
+    ],
+    ids=["update", "bulk_create", "bulk_update"],
+)
+def test_bulk_writes_invalidate(commit, write):
+    Category.objects.create(name="Tillar")
+    assert "Chet tillari" not in names()
+
+    commit(write)
+
+    assert "Chet tillari" in names()
+
+
+def test_empty_bulk_writes_do_not_invalidate(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks() as callbacks:
+        Category.objects.filter(name="Yo'q").update(name="Dizayn")
+        Category.objects.bulk_create([])
+
+    assert callbacks == []
+
+
+def test_local_copies_expire_after_the_timeout(clock, settings):
+    settings.REFERENCE_CACHE_LOCAL_TIMEOUT = 60
+    Category.objects.create(name="Tillar")
+    assert names() == ["Tillar"]
+    # another process committed and its message was missed
+    Category.objects.create(name="Dizayn")
+    bump_counter(VERSION_KEY.format(label="courses.Category"))
+
+    clock.now += 59
+    assert names() == ["Tillar"]
+    clock.now += 1
+    assert names() == ["Dizayn", "Tillar"]
+
+
+def test_least_recently_used_tables_are_evicted(settings):
+    settings.REFERENCE_CACHE_SIZE = 1
+    local = ReferenceCache()
+
+    local.filter(Category)
+    local.filter(VersionHistory)
+
+    assert list(local.tables) == ["common.VersionHistory"]
+
+
+def test_tables_loaded_during_a_drop_are_not_kept(monkeypatch):
+    local = ReferenceCache()
+    load_table = local.load_table
+
+    def load_and_drop(model):
+        table = load_table(model)
+        local.drop("courses.Category")
+        return table
+
+    monkeypatch.setattr(local, "load_table", load_and_drop)
+    local.filter(Category)
+
+    assert local.tables == {}
@@ -0,0 +1,109 @@
+import io
+import math
+from decimal import Decimal
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.common.benchmarks.renderers import build_payloads
+from apps.common.parsers import ORJSONParser
+from apps.common.renderers import ORJSONRenderer
+
+
+@pytest.fixture(scope="module")
+def payloads():
+    return build_payloads(rows=60, page_size=20)
+
+
+def render_both(data, **kwargs):
+    return JSONRenderer().render(data, **kwargs), ORJSONRenderer().render(
+        data, **kwargs
+    )
+
+
+def test_serializer_pages_render_like_json_renderer(payloads):
+    for name, pages in payloads.items():
+        for page in pages:
+            expected, rendered = render_both(page)
+            assert rendered == expected, name
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"small": 0.00001, "large": 1e22, "plain": 12.5},
+        {"big": 2**70, "negative": -(2**64)},
+        {1: "non string key"},
+        {"line": "a\u2028b\u2029c", "emoji": "😀"},
+        {"amount": Decimal("12.50"), "nested": [{"value": None}, (1, 2)]},
+        [],
+    ],
+)
+def test_edge_cases_render_like_json_renderer(data):
+    expected, rendered = render_both(data)
+
+    assert rendered == expected
+
+
+def test_indented_responses_render_like_json_renderer():
+    context = {"indent": 2}
+
+    expected, rendered = render_both({"a": [1, None]}, renderer_context=context)
+
+    assert rendered == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"rating": math.nan},
+        {"results": [{"rating": 4.5}, {"rating": math.inf}]},
+        {"results": [{"author": {"location": [1.5, -math.inf]}}]},
+        [None, (math.nan,)],
+    ],
+)
+def test_non_finite_floats_fail_like_json_renderer(data):
+    with pytest.raises(ValueError, match="Out of range float values"):
+        JSONRenderer().render(data)
+    with pytest.raises(ValueError, match="Out of range float values"):
+        ORJSONRenderer().render(data)
+
+
+def parse_both(body, encoding="utf-8"):
+    context = {"encoding": encoding}
+    results = []
+    for parser in (JSONParser(), ORJSONParser()):
+        try:
+            results.append(parser.parse(io.BytesIO(body), parser_context=context))
+        except ParseError as exc:
+            results.append(str(exc.detail))
+    return results
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"title": "Kurs", "price": 12.5, "tags": ["a", null], "ok": true}',
+        '{"title": "Курс  "}'.encode(),
+        b'{"id": 12345678901234567890123}',
+        b'{"id": -9223372036854775809}',
+        b"[1, 2",
+        b"",
+        b'{"a": NaN}',
+    ],
+)
+def test_parser_reads_like_json_parser(body):
+    expected, parsed = parse_both(body)
+
+    assert parsed == expected
+    assert type(parsed) is type(expected)
+
+
+def test_parser_reads_other_encodings_like_json_parser():
+    body = '{"title": "Kurs é"}'.encode("latin-1")
+
+    expected, parsed = parse_both(body, encoding="latin-1")
+
+    assert parsed == expected == {"title": "Kurs é"}
@@ -0,0 +1,96 @@
+import pytest
+from django.urls import reverse
+
+from apps.common.services import response_cache
+from apps.news.models import Post
+
+pytestmark = pytest.mark.django_db
+
+POST_LIST_URL = reverse("news:post-list")
+CACHE_NAME = "PostListAPIView"
+
+
+@pytest.fixture
+def post(make_user):
+    post = Post.objects.create(title="Yangilik", description="d", author=make_user())
+    Post.objects.filter(pk=post.pk).update(card="cards/news.png")
+    return post
+
+
+def get_stats():
+    stats = response_cache.get_stats(CACHE_NAME)
+    return stats[response_cache.HITS], stats[response_cache.MISSES]
+
+
+def test_repeated_request_is_served_from_cache(api_client, post):
+    first = api_client.get(POST_LIST_URL)
+    second = api_client.get(POST_LIST_URL)
+
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content
+    assert get_stats() == (1, 1)
+
+
+def test_query_parameters_are_normalized(api_client, post):
+    api_client.get(POST_LIST_URL, {"page": 1, "page_size": 10})
+    api_client.get(f"{POST_LIST_URL}?page_size=10&page=1")
+
+    assert get_stats() == (1, 1)
+
+
+def test_hosts_are_cached_apart(api_client, post):
+    for host in ("first.example.uz", "second.example.uz", "first.example.uz"):
+        response = api_client.get(POST_LIST_URL, HTTP_HOST=host)
+
+        card = response.json()["results"][0]["card"]
+        assert card == f"http://{host}/media/cards/news.png"
+
+    assert get_stats() == (1, 2)
+
+
+def test_https_is_cached_apart(api_client, post):
+    api_client.get(POST_LIST_URL)
+    response = api_client.get(POST_LIST_URL, secure=True)
+
+    assert response.json()["results"][0]["card"].startswith("https://")
+    assert get_stats() == (0, 2)
+
+
+def test_saves_invalidate_after_commit(
+    api_client, post, django_capture_on_commit_callbacks
+):
+    api_client.get(POST_LIST_URL)
+
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        post.title = "Yangi sarlavha"
+        post.save()
+    assert api_client.get(POST_LIST_URL).json()["results"][0]["title"] == "Yangilik"
+
+    for callback in callbacks:
+        callback()
+    response = api_client.get(POST_LIST_URL)
+
+    assert response.json()["results"][0]["title"] == "Yangi sarlavha"
+    assert get_stats() == (1, 2)
+
+
+def test_deletes_invalidate(api_client, post, django_capture_on_commit_callbacks):
+    api_client.get(POST_LIST_URL)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        post.delete()
+
+    assert api_client.get(POST_LIST_URL).json()["results"] == []
+    assert get_stats() == (0, 2)
+
+
+def test_last_login_updates_keep_entries(
+    api_client, post, django_capture_on_commit_callbacks
+):
+    api_client.get(POST_LIST_URL)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        post.author.save(update_fields=["last_login"])
+    api_client.get(POST_LIST_URL)
+
+    assert get_stats() == (1, 1)
@@ -0,0 +1,90 @@
+import io
+
+import pytest
+from django.core.management import call_command
+from django.db import DatabaseError
+
+from apps.common.tasks import search_backfill as tasks
+from apps.news.models import Post
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def posts(make_user):
+    author = make_user()
+    posts = [
+        Post.objects.create(title=f"Yangilik {number}", description="d", author=author)
+        for number in range(3)
+    ]
+    Post.objects.update(search_latin="", search_cyrillic="")
+    return posts
+
+
+@pytest.fixture
+def fanned_out(monkeypatch):
+    """Chunk signatures of every fan out, instead of sending them to a broker"""
+    calls = []
+
+    class Group:
+        def __init__(self, chunks):
+            calls.append(list(chunks))
+
+        def apply_async(self):
+            pass
+
+    monkeypatch.setattr(tasks, "group", Group)
+    return calls
+
+
+def test_chunk_task_retries_database_errors():
+    task = tasks.backfill_search_columns_chunk_task
+
+    assert DatabaseError in task.autoretry_for
+    assert task.max_retries == 5
+    assert task.retry_backoff
+
+
+def test_chunk_task_fills_search_columns(posts):
+    result = tasks.backfill_search_columns_chunk_task.apply(
+        ("news.Post", posts[0].pk, posts[-1].pk)
+    )
+
+    assert result.get() == 3
+    assert set(Post.objects.values_list("search_latin", flat=True)) == {
+        f"yangilik {number}" for number in range(3)
+    }
+
+
+def test_fan_out_skips_completed_ranges(posts, fanned_out):
+    assert tasks.backfill_search_columns_task(["news.Post"], chunk_size=2) == 2
+    first_chunk = fanned_out[0][0]
+    first_chunk.apply()
+
+    assert tasks.backfill_search_columns_task(["news.Post"], chunk_size=2) == 1
+    assert fanned_out[1][0].args[1:3] == (posts[2].pk, posts[2].pk)
+
+    assert (
+        tasks.backfill_search_columns_task(["news.Post"], chunk_size=2, restart=True)
+        == 2
+    )
+
+
+def test_command_resumes_from_checkpoint(posts, tmp_path):
+    checkpoint = tmp_path / "backfill.json"
+    options = {
+        "models": ["news.Post"],
+        "chunk_size": 2,
+        "workers": 1,
+        "checkpoint": str(checkpoint),
+        "verbosity": 2,
+    }
+
+    stdout = io.StringIO()
+    call_command("backfill_search_columns", stdout=stdout, **options)
+    assert "news.Post: 3 rows updated" in stdout.getvalue()
+    assert f"last pk {posts[-1].pk}" in stdout.getvalue()
+
+    stdout = io.StringIO()
+    call_command("backfill_search_columns", stdout=stdout, **options)
+    assert "news.Post: 0 rows updated" in stdout.getvalue()
@@ -0,0 +1,74 @@
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.common.services import search_cache
+from apps.courses.models import Course
+from apps.text_services.filters import CachedFullTextSearchFilter
+
+pytestmark = pytest.mark.django_db
+
+
+def search(query):
+    request = Request(APIRequestFactory().get("/", {"search": query}))
+    queryset = CachedFullTextSearchFilter().filter_queryset(
+        request, Course.objects.all(), view=None
+    )
+    return list(queryset.values_list("pk", flat=True))
+
+
+def test_results_are_read_from_the_cache(make_course, django_assert_num_queries):
+    course = make_course(title="Python kursi")
+    assert search("python") == [course.pk]
+
+    # bypasses signals, the cached primary keys are still served
+    Course.objects.filter(pk=course.pk).update(title="Java kursi")
+    with django_assert_num_queries(1):
+        assert search("python") == [course.pk]
+
+
+def test_save_bumps_the_version_after_commit(
+    make_course, django_capture_on_commit_callbacks
+):
+    course = make_course(title="Python kursi")
+    version = search_cache.get_version(Course)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        course.title = "Python asoslari"
+        course.save()
+    assert search_cache.get_version(Course) == version
+
+    for callback in callbacks:
+        callback()
+    assert search_cache.get_version(Course) != version
+
+
+def test_write_invalidates_cached_results(
+    make_course, django_capture_on_commit_callbacks
+):
+    first = make_course(title="Python kursi")
+    assert search("python") == [first.pk]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second = make_course(title="Python asoslari")
+    assert sorted(search("python")) == sorted([first.pk, second.pk])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        first.delete()
+    assert search("python") == [second.pk]
+
+
+def test_author_rename_invalidates_after_commit(
+    make_user, make_course, django_capture_on_commit_callbacks
+):
+    author = make_user(first_name="Ali")
+    course = make_course(title="Python kursi", author=author)
+    assert search("ali") == [course.pk]
+
+    profile = author.profile
+    profile.first_name = "Vali"
+    with django_capture_on_commit_callbacks(execute=True):
+        profile.save(update_fields=["first_name"])
+
+    assert search("ali") == []
+    assert search("vali") == [course.pk]
@@ -0,0 +1,155 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.courses.models import Webinar
+from apps.news.models import Post
+from apps.news.views import PostListAPIView
+from apps.text_services.filters import MultiSymbolSearchFilter
+
+pytestmark = pytest.mark.django_db
+
+WEBINAR_LIST_URL = reverse("courses:webinar_list")
+
+
+def search_ids(api_client, url, query):
+    response = api_client.get(url, {"search": query})
+    assert response.status_code == 200
+    return [item["id"] for item in response.json()]
+
+
+def filter_posts(view, query):
+    request = Request(APIRequestFactory().get("/", {"search": query}))
+    return MultiSymbolSearchFilter().filter_queryset(request, Post.objects.all(), view)
+
+
+def test_search_columns_hold_both_scripts(make_webinar, make_user):
+    webinar = make_webinar(
+        title="Python Вебинари", author=make_user(first_name="Алишер")
+    )
+
+    assert "python vebinari" in webinar.search_latin
+    assert "alisher" in webinar.search_latin
+    assert "пйтҳон вебинари" in webinar.search_cyrillic
+    assert "алишер" in webinar.search_cyrillic
+
+
+@pytest.mark.parametrize("query", ["vebinar", "вебинар", "alisher", "алишер"])
+def test_webinar_search_in_either_script(api_client, make_webinar, make_user, query):
+    webinar = make_webinar(
+        title="Python vebinari", author=make_user(first_name="Alisher")
+    )
+    make_webinar(
+        title="Boshqa", description="Tavsif", author=make_user(first_name="Bobur")
+    )
+
+    assert search_ids(api_client, WEBINAR_LIST_URL, query) == [webinar.id]
+
+
+@pytest.mark.parametrize("query", ["tutor_ali", "tutor_a", "tutor@example", "tutor"])
+def test_webinar_search_by_author_username_and_email(
+    api_client, make_webinar, make_user, query
+):
+    author = make_user(username="tutor_ali", email="tutor@example.uz")
+    webinar = make_webinar(author=author)
+    make_webinar(title="Boshqa")
+
+    assert search_ids(api_client, WEBINAR_LIST_URL, query) == [webinar.id]
+
+
+def test_username_change_refreshes_webinar_columns(make_webinar, make_user):
+    author = make_user(username="old_name")
+    webinar = make_webinar(author=author)
+
+    author.username = "new_name"
+    author.save(update_fields=["username"])
+
+    webinar.refresh_from_db()
+    assert "new_name" in webinar.search_latin
+    assert "old_name" not in webinar.search_latin
+    assert Webinar.objects.filter(search_vector="new_name").exists()
+
+
+def test_unrelated_user_update_keeps_webinar_columns(
+    make_webinar, make_user, django_assert_num_queries
+):
+    author = make_user()
+    make_webinar(author=author)
+
+    with django_assert_num_queries(1):
+        author.save(update_fields=["last_login"])
+
+
+def test_declared_search_fields_are_searched(make_user):
+    class TitleSearchView(PostListAPIView):
+        search_fields = ("title",)
+
+    author = make_user(first_name="Yangilik")
+    post = Post.objects.create(title="Yangilik", description="d", author=author)
+    Post.objects.create(title="Boshqa", description="d", author=author)
+
+    queryset = filter_posts(TitleSearchView(), "yangilik")
+
+    assert "search_latin" not in str(queryset.query).split("WHERE")[1]
+    assert list(queryset) == [post]
+
+
+@pytest.mark.parametrize("query", ["2024", "+998"])
+def test_neutral_query_searches_one_column(query):
+    where = str(filter_posts(PostListAPIView(), query).query).split("WHERE")[1]
+
+    assert "search_latin" in where
+    assert "search_cyrillic" not in where
+
+
+def test_script_query_searches_both_columns(make_user):
+    post = Post.objects.create(title="Yangilik", description="d", author=make_user())
+
+    for query in ("yangilik", "янгилик"):
+        queryset = filter_posts(PostListAPIView(), query)
+        where = str(queryset.query).split("WHERE")[1]
+
+        assert "search_latin" in where
+        assert "search_cyrillic" in where
+        assert list(queryset) == [post]
+
+
+def test_neutral_query_collapses_lookup_branches():
+    class TitleSearchView(PostListAPIView):
+        search_fields = ("title",)
+
+    where = str(filter_posts(TitleSearchView(), "2024").query).split("WHERE")[1]
+
+    assert where.count("LIKE") == 1
+
+
+def test_unrelated_update_fields_skip_the_search_columns(make_user):
+    post = Post.objects.create(title="Yangilik", description="d", author=make_user())
+    post.title = "Unsaved sarlavha"
+    post.card = "cards/news.png"
+
+    with CaptureQueriesContext(connection) as context:
+        post.save(update_fields=["card"])
+
+    assert "search_latin" not in context.captured_queries[-1]["sql"]
+    post.refresh_from_db()
+    assert post.search_latin == "yangilik"
+
+
+@pytest.mark.parametrize("update_field", ["title", "author", "author_id"])
+def test_source_update_fields_refresh_the_search_columns(
+    make_webinar, make_user, update_field
+):
+    webinar = make_webinar(title="Eski")
+    if update_field == "title":
+        webinar.title = "Bobur"
+    else:
+        webinar.author = make_user(first_name="Bobur")
+
+    webinar.save(update_fields=[update_field])
+
+    webinar.refresh_from_db()
+    assert "bobur" in webinar.search_latin
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.courses.models import Course
+from apps.courses.views import CourseListAPIView
+from apps.news.models import Post
+from apps.news.views import PostListAPIView
+from apps.text_services.filters import FullTextSearchFilter, MultiSymbolSearchFilter
+
+pytestmark = pytest.mark.django_db
+
+
+def filter_search(filter_class, view_class, queryset, query):
+    request = Request(APIRequestFactory().get("/", {"search": query}))
+    return filter_class().filter_queryset(request, queryset, view_class())
+
+
+def get_plan_nodes(queryset):
+    """Node types and index names of the EXPLAIN plan, depth first"""
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    plans = json.loads(queryset.explain(format="json"))
+    nodes = []
+    stack = [plans[0]["Plan"]]
+    while stack:
+        plan = stack.pop()
+        nodes.append((plan["Node Type"], plan.get("Index Name")))
+        stack.extend(reversed(plan.get("Plans", ())))
+    return nodes
+
+
+def has_trigram_opclass():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_opclass WHERE opcname = 'gin_trgm_ops'")
+        return cursor.fetchone() is not None
+
+
+def test_shadow_column_search_needs_no_join_or_distinct():
+    queryset = filter_search(
+        MultiSymbolSearchFilter, PostListAPIView, Post.objects.all(), "yangilik 2024"
+    )
+
+    sql = str(queryset.query).upper()
+    assert "DISTINCT" not in sql
+    assert "JOIN" not in sql
+    assert "SEARCH_LATIN" in sql
+    assert "SEARCH_CYRILLIC" in sql
+
+
+def test_shadow_column_search_uses_trigram_indexes():
+    if not has_trigram_opclass():
+        pytest.skip("pg_trgm is not installed")
+    queryset = filter_search(
+        MultiSymbolSearchFilter, PostListAPIView, Post.objects.all(), "yangilik"
+    )
+
+    index_names = {
+        index for node, index in get_plan_nodes(queryset) if node == "Bitmap Index Scan"
+    }
+    assert index_names == {"news_post_slat_trgm", "news_post_scyr_trgm"}
+
+
+def test_full_text_search_uses_search_vector_index():
+    queryset = filter_search(
+        FullTextSearchFilter, CourseListAPIView, Course.objects.all(), "python"
+    )
+
+    nodes = get_plan_nodes(queryset)
+    assert ("Bitmap Index Scan", "courses_course_fts") in nodes
+    assert all(node not in {"Unique", "HashAggregate"} for node, _ in nodes)
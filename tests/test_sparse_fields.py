@@ -0,0 +1,146 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import serializers
+
+from apps.common.mixins import eager_load
+from apps.common.services import sparse_fields
+from apps.common.services.sparse_fields import LoadPlan, get_load_plan
+from apps.courses.models import Course
+from apps.news.models import Post
+from apps.news.serializers.survey import SurveyModelSerializer
+
+pytestmark = pytest.mark.django_db
+
+COURSE_LIST_URL = reverse("courses:course_list")
+POST_LIST_URL = reverse("news:post-list")
+SURVEY_LIST_EXCLUSIONS = {"exclude_fields": ("created_at", "updated_at", "description")}
+
+
+@pytest.fixture(autouse=True)
+def plans(monkeypatch):
+    plans = {}
+    monkeypatch.setattr(sparse_fields, "_plans", plans)
+    return plans
+
+
+def get_page_sql(api_client, url, params, table):
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url, params)
+    assert response.status_code == 200
+    (sql,) = [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith(f'SELECT "{table}"."id"') and "LIMIT" in query["sql"]
+    ]
+    return response.json(), sql
+
+
+def test_survey_list_plan_skips_excluded_columns():
+    plan = get_load_plan(SurveyModelSerializer, SURVEY_LIST_EXCLUSIONS)
+
+    assert plan == LoadPlan(
+        only=(
+            "id",
+            "title",
+            "author",
+            "author__id",
+            "author__username",
+            "author__profile__avatar",
+            "author__profile__first_name",
+            "author__profile__last_name",
+            "card",
+            "course",
+            "course__id",
+            "course__rating_count",
+            "course__rating_avg",
+            "course__title",
+            "course__price",
+            "course__card",
+            "course__discount",
+        ),
+        select_related=("author", "author__profile", "course"),
+    )
+
+
+def test_plans_are_cached_per_exclusions(plans):
+    full = get_load_plan(SurveyModelSerializer, {})
+    narrowed = get_load_plan(SurveyModelSerializer, SURVEY_LIST_EXCLUSIONS)
+
+    assert "description" in full.only
+    assert "description" not in narrowed.only
+    assert get_load_plan(SurveyModelSerializer, {}) is full
+    assert len(plans) == 2
+
+
+class UntracedSerializer(serializers.ModelSerializer):
+    summary = serializers.SerializerMethodField()
+
+    select_related_fields = ("category",)
+
+    class Meta:
+        model = Course
+        fields = ("id", "summary")
+
+    def get_summary(self, obj):
+        return f"{obj.title} ({obj.category.name})"
+
+
+def test_untraced_method_fields_keep_the_declared_joins():
+    queryset = eager_load(Course.objects.all(), UntracedSerializer, context={})
+
+    assert get_load_plan(UntracedSerializer, {}) is None
+    assert queryset.query.select_related == {"category": {}}
+    assert queryset.query.deferred_loading == (frozenset(), True)
+
+
+def test_sparse_course_list_loads_only_the_requested_columns(api_client, make_course):
+    make_course()
+
+    data, sql = get_page_sql(
+        api_client, COURSE_LIST_URL, {"fields": "title,price"}, "courses_course"
+    )
+
+    assert list(data["results"][0]) == ["title", "price"]
+    assert "JOIN" not in sql
+    assert '"courses_course"."description"' not in sql
+    assert '"courses_course"."price"' in sql
+
+
+def test_omitted_relations_drop_their_joins(api_client, make_course):
+    make_course()
+
+    data, sql = get_page_sql(
+        api_client, COURSE_LIST_URL, {"omit": "author"}, "courses_course"
+    )
+
+    assert "author" not in data["results"][0]
+    assert '"user_user"' not in sql
+    assert '"courses_category"' in sql
+
+
+def test_unknown_sparse_fields_are_rejected(api_client):
+    response = api_client.get(COURSE_LIST_URL, {"fields": "title,secret", "omit": "x"})
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "fields": ["Unknown field: secret"],
+        "omit": ["Unknown field: x"],
+    }
+
+
+def test_keyset_list_loads_its_keys_but_not_excluded_columns(api_client, make_user):
+    for number in range(3):
+        Post.objects.create(
+            title=f"Yangilik {number}", description="d", author=make_user()
+        )
+
+    data, sql = get_page_sql(
+        api_client, POST_LIST_URL, {"cursor": "", "page_size": 2}, "news_post"
+    )
+
+    assert '"news_post"."created_at"' in sql
+    assert '"news_post"."description"' not in sql
+    assert data["next"] is not None
+    assert "created_at" not in data["results"][0]
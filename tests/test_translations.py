@@ -0,0 +1,123 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from apps.common.models import FrontendTranslation
+from apps.common.services import translations
+from apps.common.services.translations import TranslationBundle
+
+pytestmark = pytest.mark.django_db
+
+TRANSLATIONS_URL = reverse("common:frontend-translations")
+
+
+@pytest.fixture
+def bundle(settings):
+    settings.TRANSLATIONS_CHECK_INTERVAL = 0
+    return TranslationBundle()
+
+
+@pytest.fixture
+def commit(django_capture_on_commit_callbacks):
+    """Run a change and the version bump its commit triggers"""
+
+    def commit(change, *args, **kwargs):
+        with django_capture_on_commit_callbacks(execute=True):
+            return change(*args, **kwargs)
+
+    return commit
+
+
+@pytest.fixture
+def first_version(bundle, commit):
+    commit(FrontendTranslation.objects.create, key="home", text="Bosh sahifa")
+    commit(FrontendTranslation.objects.create, key="about", text="Biz haqimizda")
+    version, _ = bundle.get()
+    return version
+
+
+def test_same_version_has_no_changes(bundle, first_version):
+    assert bundle.get_delta(first_version) == (first_version, False, {}, [])
+
+
+def test_delta_lists_added_changed_and_deleted_keys(bundle, commit, first_version):
+    commit(FrontendTranslation.objects.create, key="login", text="Kirish")
+    commit(FrontendTranslation.objects.get(key="home").delete)
+    about = FrontendTranslation.objects.get(key="about")
+    about.text = "Loyiha haqida"
+    commit(about.save)
+
+    version, full, changed, deleted = bundle.get_delta(first_version)
+
+    assert version == first_version + 3
+    assert full is False
+    assert changed == {"login": "Kirish", "about": "Loyiha haqida"}
+    assert deleted == ["home"]
+
+
+def test_delta_spans_several_served_versions(bundle, commit, first_version):
+    commit(FrontendTranslation.objects.create, key="login", text="Kirish")
+    middle_version, _ = bundle.get()
+    commit(FrontendTranslation.objects.filter(key="login").delete)
+
+    assert bundle.get_delta(middle_version)[1:] == (False, {}, ["login"])
+    assert bundle.get_delta(first_version)[1:] == (False, {}, [])
+
+
+@pytest.mark.parametrize("offset", [-1, 1])
+def test_unknown_versions_get_the_full_bundle(bundle, first_version, offset):
+    texts = {"home": "Bosh sahifa", "about": "Biz haqimizda"}
+
+    result = bundle.get_delta(first_version + offset)
+
+    assert result == (first_version, True, texts, [])
+
+
+def test_expired_bundles_get_the_full_bundle(bundle, commit, first_version):
+    commit(FrontendTranslation.objects.create, key="login", text="Kirish")
+    cache.delete(translations.BUNDLE_KEY.format(version=first_version))
+
+    version, full, changed, deleted = bundle.get_delta(first_version)
+
+    assert full is True
+    assert set(changed) == {"home", "about", "login"}
+    assert deleted == []
+
+
+def test_newer_client_version_refreshes_before_the_check_interval(
+    bundle, commit, first_version, settings
+):
+    settings.TRANSLATIONS_CHECK_INTERVAL = 3600
+    other_process = TranslationBundle()
+    commit(FrontendTranslation.objects.create, key="login", text="Kirish")
+    newer_version, _ = other_process.get()
+
+    assert bundle.get() == (first_version, bundle.texts)
+    assert bundle.get_delta(newer_version) == (newer_version, False, {}, [])
+
+
+def test_bundles_are_shared_through_the_cache(
+    bundle, first_version, django_assert_num_queries
+):
+    other_process = TranslationBundle()
+
+    with django_assert_num_queries(0):
+        assert other_process.get() == bundle.get()
+
+
+def test_view_returns_the_delta_with_the_version_header(
+    api_client, commit, first_version, monkeypatch, bundle
+):
+    monkeypatch.setattr("apps.common.views.FrontendTranslation.bundle", bundle)
+    commit(FrontendTranslation.objects.create, key="login", text="Kirish")
+
+    response = api_client.get(TRANSLATIONS_URL, {"since_version": first_version})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "version": first_version + 1,
+        "full": False,
+        "changed": {"login": "Kirish"},
+        "deleted": [],
+    }
+    assert response.headers["X-Translations-Version"] == str(first_version + 1)
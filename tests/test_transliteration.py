@@ -0,0 +1,287 @@
+import io
+
+import pytest
+
+from apps.text_services import cyrillic_latin_translator
+from apps.text_services.benchmarks.transliteration import (
+    check_snapshot,
+    get_dictionary_lines,
+    load_corpus,
+    load_snapshot,
+)
+from apps.text_services.q_processors import QLatinCyrillicProcessor
+
+
+@pytest.fixture(scope="module")
+def snapshot():
+    """Output of the original regex based implementation"""
+    return load_snapshot()
+
+
+def test_to_cyrillic_matches_reference_implementation(snapshot):
+    assert check_snapshot({"to_cyrillic": snapshot["to_cyrillic"]}) == []
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Tsex", "Тсех"),
+        ("sentabr", "сентябрь"),
+        ("Yevropa ekran", "Европа экран"),
+        ("aktsiya", "актсия"),
+        ("O‘zbekiston G‘alaba", "Ўзбекистон Ғалаба"),
+        ("ob'ekt", "об'экт"),
+        ("Shahar CHOY", "Шаҳар ЧОЙ"),
+        ("MOYUPA", "МОЮПА"),
+        ("kompyuter", "компьютер"),
+    ],
+)
+def test_to_cyrillic_context_rules(text, expected):
+    assert cyrillic_latin_translator.to_cyrillic(text) == expected
+
+
+def test_to_latin_matches_reference_implementation(snapshot):
+    assert check_snapshot({"to_latin": snapshot["to_latin"]}) == []
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Цех", "Sex"),
+        ("сентябрь", "sentabr"),
+        ("октябрда", "oktabrda"),
+        ("Европа экран", "Yevropa ekran"),
+        ("акция", "aksiya"),
+        ("Ўзбекистон Ғалаба", "Oʻzbekiston Gʻalaba"),
+        ("объект", "obʼekt"),
+        ("ПОЕЗД", "POYeZD"),
+        ("Ер ел", "Yer yel"),
+    ],
+)
+def test_to_latin_context_rules(text, expected):
+    assert cyrillic_latin_translator.to_latin(text) == expected
+
+
+@pytest.fixture
+def transliterate_cache():
+    cyrillic_latin_translator.transliterate_cache_clear()
+    yield
+    cyrillic_latin_translator.transliterate_cache_clear()
+
+
+def test_transliterate_many_keeps_order_and_converts_duplicates_once(
+    transliterate_cache,
+):
+    texts = ["kurs", "dars", "kurs", "2024", "kurs"]
+
+    result = cyrillic_latin_translator.transliterate_many(
+        texts, cyrillic_latin_translator.CYRILLIC
+    )
+
+    assert result == ["курс", "дарс", "курс", "2024", "курс"]
+    info = cyrillic_latin_translator.transliterate_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 3, 3)
+
+
+def test_transliterate_many_serves_repeats_from_the_cache(transliterate_cache):
+    texts = ["kurs", "dars"]
+    cyrillic_latin_translator.transliterate_many(
+        texts, cyrillic_latin_translator.CYRILLIC
+    )
+
+    result = cyrillic_latin_translator.transliterate_many(
+        [*texts, "kurs"], cyrillic_latin_translator.CYRILLIC
+    )
+
+    assert result == ["курс", "дарс", "курс"]
+    info = cyrillic_latin_translator.transliterate_cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_transliterate_cache_is_bounded(transliterate_cache):
+    maxsize = cyrillic_latin_translator.TRANSLITERATE_CACHE_SIZE
+
+    cyrillic_latin_translator.transliterate_many(
+        (f"kurs {number}" for number in range(maxsize + 10)),
+        cyrillic_latin_translator.CYRILLIC,
+    )
+
+    info = cyrillic_latin_translator.transliterate_cache_info()
+    assert info.maxsize == maxsize
+    assert info.currsize == maxsize
+
+
+def test_variants_are_cached_apart(transliterate_cache):
+    assert cyrillic_latin_translator.transliterate_many(
+        ["kurs", "курс"], cyrillic_latin_translator.CYRILLIC
+    ) == ["курс", "курс"]
+    assert cyrillic_latin_translator.transliterate_many(
+        ["kurs", "курс"], cyrillic_latin_translator.LATIN
+    ) == ["kurs", "kurs"]
+
+
+@pytest.mark.parametrize(
+    ("text", "script"),
+    [
+        ("Python kursi", cyrillic_latin_translator.LATIN),
+        ("o‘qituvchi", cyrillic_latin_translator.LATIN),
+        ("ali@example.uz", cyrillic_latin_translator.LATIN),
+        ("Питон курси", cyrillic_latin_translator.CYRILLIC),
+        ("ўқитувчи", cyrillic_latin_translator.CYRILLIC),
+        ("Python курси", cyrillic_latin_translator.MIXED),
+        ("2024", cyrillic_latin_translator.NEUTRAL),
+        ("+998 90 123-45-67", cyrillic_latin_translator.NEUTRAL),
+        ("", cyrillic_latin_translator.NEUTRAL),
+    ],
+)
+def test_detect_script(text, script):
+    assert cyrillic_latin_translator.detect_script(text) == script
+
+
+@pytest.mark.parametrize(
+    ("text", "to_variant", "expected"),
+    [
+        ("2024", cyrillic_latin_translator.CYRILLIC, False),
+        ("2024", cyrillic_latin_translator.LATIN, False),
+        ("курс", cyrillic_latin_translator.CYRILLIC, False),
+        ("kurs", cyrillic_latin_translator.LATIN, False),
+        ("kurs", cyrillic_latin_translator.CYRILLIC, True),
+        ("курс", cyrillic_latin_translator.LATIN, True),
+        ("kurs курс", cyrillic_latin_translator.CYRILLIC, True),
+        ("kurs курс", cyrillic_latin_translator.LATIN, True),
+    ],
+)
+def test_needs_transliteration(text, to_variant, expected):
+    assert cyrillic_latin_translator.needs_transliteration(text, to_variant) is expected
+
+
+@pytest.mark.parametrize(
+    ("text", "to_variant"),
+    [
+        ("2024", cyrillic_latin_translator.CYRILLIC),
+        ("курс", cyrillic_latin_translator.CYRILLIC),
+        ("kurs", cyrillic_latin_translator.LATIN),
+    ],
+)
+def test_processor_skips_noop_transliteration(monkeypatch, text, to_variant):
+    def transliterate(text, to_variant):
+        raise AssertionError("transliterated a no-op text")
+
+    monkeypatch.setattr(
+        cyrillic_latin_translator, "transliterate_cached", transliterate
+    )
+
+    assert QLatinCyrillicProcessor(to_variant).process(text) == text
+
+
+@pytest.fixture
+def word_patterns():
+    cyrillic_latin_translator._word_pattern.cache_clear()
+    yield cyrillic_latin_translator._word_pattern.cache_info
+    cyrillic_latin_translator._word_pattern.cache_clear()
+
+
+def test_preload_leaves_nothing_to_compile_on_first_use(word_patterns):
+    cyrillic_latin_translator.preload()
+    compiled = word_patterns().misses
+
+    assert cyrillic_latin_translator.to_cyrillic("avtomobil") == "автомобиль"
+    assert cyrillic_latin_translator.to_cyrillic("karate") == "каратэ"
+    assert compiled == len(
+        {
+            *cyrillic_latin_translator.SOFT_SIGN_WORD_KEYS,
+            *cyrillic_latin_translator.EXCEPTION_WORDS,
+        }
+    )
+    assert word_patterns().misses == compiled
+
+
+@pytest.fixture(scope="module")
+def stream_texts():
+    """Dictionary lines and corpus descriptions in both scripts, one per line"""
+    corpus = load_corpus()
+    latin = "\n".join([*get_dictionary_lines(), *corpus["latin"]["descriptions"]])
+    cyrillic = "\n".join(
+        [
+            cyrillic_latin_translator.to_cyrillic(latin),
+            *corpus["cyrillic"]["descriptions"],
+        ]
+    )
+    return {
+        cyrillic_latin_translator.CYRILLIC: latin,
+        cyrillic_latin_translator.LATIN: cyrillic,
+    }
+
+
+@pytest.mark.parametrize(
+    "to_variant",
+    [cyrillic_latin_translator.CYRILLIC, cyrillic_latin_translator.LATIN],
+)
+@pytest.mark.parametrize(
+    "chunk_size",
+    [
+        1,
+        7,
+        cyrillic_latin_translator.EXCEPTION_WORD_MAX_LENGTH - 1,
+        cyrillic_latin_translator.EXCEPTION_WORD_MAX_LENGTH,
+        cyrillic_latin_translator.EXCEPTION_WORD_MAX_LENGTH + 1,
+        1000,
+    ],
+)
+def test_stream_matches_whole_text(stream_texts, to_variant, chunk_size):
+    text = stream_texts[to_variant]
+
+    pieces = cyrillic_latin_translator.transliterate_stream(
+        io.StringIO(text), to_variant, chunk_size=chunk_size
+    )
+
+    assert "".join(pieces) == cyrillic_latin_translator.transliterate(text, to_variant)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "sentabr aktsiya Yevropa kompyuter ob'ekt",
+        "  Tsex\tsentabr\n\nMOYUPA  ",
+        " ".join(["oktabr"] * 20),
+    ],
+)
+def test_stream_matches_whole_text_at_every_split(text):
+    expected = cyrillic_latin_translator.to_cyrillic(text)
+
+    for index in range(len(text) + 1):
+        pieces = cyrillic_latin_translator.transliterate_stream(
+            [text[:index], text[index:]], cyrillic_latin_translator.CYRILLIC
+        )
+        assert "".join(pieces) == expected, index
+
+
+def test_stream_holds_back_a_word_cut_by_the_chunk_edge():
+    chunks = ["sent", "abr"]
+
+    pieces = list(
+        cyrillic_latin_translator.transliterate_stream(
+            chunks, cyrillic_latin_translator.CYRILLIC
+        )
+    )
+
+    assert pieces == ["сентябрь"]
+
+
+def test_stream_yields_before_reading_everything():
+    word = "sentabr "
+    first_piece_length = 4 * cyrillic_latin_translator.EXCEPTION_WORD_MAX_LENGTH
+    read = []
+
+    def chunks():
+        for number in range(1000):
+            read.append(number)
+            yield word
+
+    stream = cyrillic_latin_translator.transliterate_stream(
+        chunks(), cyrillic_latin_translator.CYRILLIC
+    )
+    piece = next(stream)
+
+    assert len(read) == -(-first_piece_length // len(word))
+    assert piece == "сентябрь " * len(read)